@@ -11,7 +11,17 @@ __description__ = "Universal semantic indexer for Python codebases with vector s
 from claude_indexer.config import IndexerConfig, load_config
 
 from .analysis.entities import Entity, Relation
-from .main import main as cli_main
+
+
+def __getattr__(name: str):
+    # The CLI pulls in storage and embedding clients; import it only when
+    # asked for so that importing any submodule stays cheap.
+    if name == "cli_main":
+        from .main import main as cli_main
+
+        return cli_main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "IndexerConfig",
@@ -12,8 +12,9 @@ This parser extracts structured information from design documents including:
 import hashlib
 import re
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from .entities import (
     Entity,
@@ -25,6 +26,177 @@ from .entities import (
 )
 from .parser import CodeParser, ParserResult
 
+# Requirement extraction patterns
+REQUIREMENT_PATTERNS = [
+    # RFC 2119 style requirements
+    r"(?:^|\n)\s*[-*]\s*(?:The\s+system\s+)?(?:MUST|SHALL|SHOULD|MAY)\s+(.+?)(?:\n|$)",
+    # Bracketed requirement IDs
+    r"\[REQ-\d+\]\s*(.+?)(?:\n|$)",
+    # Numbered requirements
+    r"(?:^|\n)\s*\d+\.\s*(?:The\s+system\s+)?(?:must|shall|should|may)\s+(.+?)(?:\n|$)",
+]
+
+# Compiled once at import instead of on every line of every document
+_REQUIREMENT_RES = tuple(re.compile(p, re.IGNORECASE) for p in REQUIREMENT_PATTERNS)
+# Every requirement pattern needs one of these literals, so text without them
+# can skip the full patterns. One substring-style search is far cheaper than
+# running each anchored, backtracking pattern on every line.
+_REQUIREMENT_HINT_RE = re.compile(r"must|shall|should|may|\[req-", re.IGNORECASE)
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_SECTION_HEADING_RE = re.compile(r"^#{1,3}\s+(.+)$")
+_SECTION_COUNT_RE = re.compile(r"^#{1,3}\s+", re.MULTILINE)
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_MUST_RE = re.compile(r"\bMUST\b", re.IGNORECASE)
+_SHOULD_RE = re.compile(r"\bSHOULD\b", re.IGNORECASE)
+_MAY_RE = re.compile(r"\bMAY\b", re.IGNORECASE)
+
+
+class _SectionSpan(NamedTuple):
+    """A markdown section found in a document."""
+
+    level: int
+    title: str
+    start_line: int
+    content: str
+    requirement_count: int
+
+
+class _RequirementMatch(NamedTuple):
+    """A requirement found on a single line of a document."""
+
+    line_number: int
+    text: str
+    requirement_type: str
+    parent_section: str | None
+
+
+class _DocumentScan(NamedTuple):
+    """Text-level analysis of a design document, independent of entities."""
+
+    content: str
+    file_hash: str
+    title: str | None
+    section_count: int
+    requirement_count: int
+    sections: tuple[_SectionSpan, ...]
+    requirements: tuple[_RequirementMatch, ...]
+
+
+def _count_requirements(text: str) -> int:
+    """Count requirement pattern matches in a block of text."""
+    if not _REQUIREMENT_HINT_RE.search(text):
+        return 0
+    return sum(len(regex.findall(text)) for regex in _REQUIREMENT_RES)
+
+
+def _split_sections(content: str, max_section_depth: int) -> tuple[_SectionSpan, ...]:
+    """Split markdown content into sections up to max_section_depth.
+
+    Deeper headings are kept as part of the enclosing section's content.
+    Sections with no content are dropped.
+    """
+    sections: list[_SectionSpan] = []
+    current: tuple[int, str, int] | None = None
+    content_lines: list[str] = []
+
+    def flush() -> None:
+        if current is None:
+            return
+        section_content = "\n".join(content_lines).strip()
+        if section_content:
+            level, title, start_line = current
+            sections.append(
+                _SectionSpan(
+                    level,
+                    title,
+                    start_line,
+                    section_content,
+                    _count_requirements(section_content),
+                )
+            )
+
+    for i, line in enumerate(content.split("\n")):
+        heading_match = _HEADING_RE.match(line)
+
+        if heading_match:
+            # Any heading closes the pending content of the current section
+            flush()
+            level = len(heading_match.group(1))
+            if level <= max_section_depth:
+                current = (level, heading_match.group(2).strip(), i + 1)
+                content_lines = []
+            elif current is not None:
+                # Include deeper headings in current section content
+                content_lines.append(line)
+        elif current is not None:
+            content_lines.append(line)
+
+    flush()
+    return tuple(sections)
+
+
+def _scan_requirements(content: str) -> tuple[_RequirementMatch, ...]:
+    """Find requirement statements line by line, tracking the parent section."""
+    requirements: list[_RequirementMatch] = []
+    current_section: str | None = None
+
+    for i, line in enumerate(content.split("\n")):
+        heading_match = _SECTION_HEADING_RE.match(line)
+        if heading_match:
+            current_section = f"Section: {heading_match.group(1).strip()}"
+            continue
+
+        if not _REQUIREMENT_HINT_RE.search(line):
+            continue
+
+        for regex in _REQUIREMENT_RES:
+            for match in regex.finditer(line):
+                req_text = match.group(1) if match.groups() else match.group(0)
+
+                req_type = "general"
+                if _MUST_RE.search(line):
+                    req_type = "mandatory"
+                elif _SHOULD_RE.search(line):
+                    req_type = "recommended"
+                elif _MAY_RE.search(line):
+                    req_type = "optional"
+
+                requirements.append(
+                    _RequirementMatch(
+                        i + 1, req_text.strip(), req_type, current_section
+                    )
+                )
+
+    return tuple(requirements)
+
+
+@lru_cache(maxsize=256)
+def _scan_document(
+    path_str: str, mtime_ns: int, size: int, max_section_depth: int
+) -> _DocumentScan:
+    """Read and analyze a document, memoized on its path and stat signature.
+
+    Re-parsing an unchanged file (same mtime and size) returns the cached
+    scan without touching the disk again. Entities are still built fresh
+    by the caller, so cached results are never shared mutably.
+    """
+    with open(path_str, "rb") as f:
+        raw = f.read()
+    # Match text-mode reading: universal newlines
+    content = raw.decode("utf-8", errors="ignore")
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+    title_match = _TITLE_RE.search(content)
+    return _DocumentScan(
+        content=content,
+        file_hash=hashlib.sha256(raw).hexdigest(),
+        title=title_match.group(1).strip() if title_match else None,
+        section_count=len(_SECTION_COUNT_RE.findall(content)),
+        requirement_count=_count_requirements(content),
+        sections=_split_sections(content, max_section_depth),
+        requirements=_scan_requirements(content),
+    )
+
 
 class DesignDocParser(CodeParser):
     """Parse design documents (PRD, TDD, ADR, specifications).
@@ -71,16 +243,6 @@ class DesignDocParser(CodeParser):
         ],
     }
 
-    # Requirement extraction patterns
-    REQUIREMENT_PATTERNS = [
-        # RFC 2119 style requirements
-        r"(?:^|\n)\s*[-*]\s*(?:The\s+system\s+)?(?:MUST|SHALL|SHOULD|MAY)\s+(.+?)(?:\n|$)",
-        # Bracketed requirement IDs
-        r"\[REQ-\d+\]\s*(.+?)(?:\n|$)",
-        # Numbered requirements
-        r"(?:^|\n)\s*\d+\.\s*(?:The\s+system\s+)?(?:must|shall|should|may)\s+(.+?)(?:\n|$)",
-    ]
-
     def __init__(self, config: dict[str, Any] | None = None):
         """Initialize the design document parser.
 
@@ -130,11 +292,12 @@ class DesignDocParser(CodeParser):
         result = ParserResult(file_path=file_path, entities=[], relations=[])
 
         try:
-            # Read file content
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            result.file_hash = self._get_file_hash(file_path)
+            stat = file_path.stat()
+            scan = _scan_document(
+                str(file_path), stat.st_mtime_ns, stat.st_size, self.max_section_depth
+            )
+            content = scan.content
+            result.file_hash = scan.file_hash
 
             # Detect document type
             doc_type = self._detect_doc_type(file_path, content)
@@ -157,11 +320,11 @@ class DesignDocParser(CodeParser):
             chunks: list[EntityChunk] = []
 
             # Create document entity based on type
-            doc_entity = self._create_doc_entity(file_path, content, doc_type)
+            doc_entity = self._create_doc_entity(file_path, scan, doc_type)
             entities.append(doc_entity)
 
             # Extract sections
-            sections = self._extract_sections(content, file_path, doc_type)
+            sections = self._extract_sections(scan, file_path, doc_type)
             for section_entity, section_content, start_line in sections:
                 entities.append(section_entity)
 
@@ -180,7 +343,7 @@ class DesignDocParser(CodeParser):
 
             # Extract requirements if enabled
             if self.extract_requirements:
-                requirements = self._extract_requirements(content, file_path, doc_type)
+                requirements = self._extract_requirements(scan, file_path, doc_type)
                 for req_entity, parent_section in requirements:
                     entities.append(req_entity)
 
@@ -248,13 +411,13 @@ class DesignDocParser(CodeParser):
         return None
 
     def _create_doc_entity(
-        self, file_path: Path, content: str, doc_type: str
+        self, file_path: Path, scan: _DocumentScan, doc_type: str
     ) -> Entity:
         """Create the main document entity.
 
         Args:
             file_path: Path to the document
-            content: Document content
+            scan: Cached text analysis of the document
             doc_type: Detected document type
 
         Returns:
@@ -269,21 +432,16 @@ class DesignDocParser(CodeParser):
         }
         entity_type = type_mapping.get(doc_type, EntityType.DOCUMENTATION)
 
-        # Extract title from first heading
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        title = title_match.group(1).strip() if title_match else file_path.stem
-
-        # Count sections and requirements for observations
-        section_count = len(re.findall(r"^#{1,3}\s+", content, re.MULTILINE))
-        req_matches = []
-        for pattern in self.REQUIREMENT_PATTERNS:
-            req_matches.extend(re.findall(pattern, content, re.IGNORECASE))
+        # Title comes from the first heading
+        title = scan.title or file_path.stem
+        section_count = scan.section_count
+        requirement_count = scan.requirement_count
 
         observations = [
             f"{doc_type.upper()}: {title}",
             f"Design document type: {doc_type}",
             f"Sections: {section_count}",
-            f"Requirements detected: {len(req_matches)}",
+            f"Requirements detected: {requirement_count}",
             f"File: {file_path.name}",
         ]
 
@@ -297,107 +455,57 @@ class DesignDocParser(CodeParser):
                 "type": doc_type,
                 "title": title,
                 "section_count": section_count,
-                "requirement_count": len(req_matches),
+                "requirement_count": requirement_count,
             },
         )
 
     def _extract_sections(
-        self, content: str, file_path: Path, doc_type: str
+        self, scan: _DocumentScan, file_path: Path, doc_type: str
     ) -> list[tuple[Entity, str, int]]:
-        """Extract sections from markdown content.
+        """Build section entities from the document's markdown sections.
 
         Args:
-            content: Document content
+            scan: Cached text analysis of the document
             file_path: Path to the document
             doc_type: Document type
 
         Returns:
             List of (Entity, section_content, start_line) tuples
         """
-        sections: list[tuple[Entity, str, int]] = []
-        lines = content.split("\n")
-
-        current_section: dict[str, Any] | None = None
-        section_content_lines: list[str] = []
-
-        for i, line in enumerate(lines):
-            # Check for heading
-            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
-
-            if heading_match:
-                # Save previous section if exists
-                if current_section is not None:
-                    section_content = "\n".join(section_content_lines).strip()
-                    if section_content:
-                        entity = self._create_section_entity(
-                            current_section, section_content, file_path, doc_type
-                        )
-                        sections.append(
-                            (entity, section_content, current_section["start_line"])
-                        )
-
-                # Start new section
-                level = len(heading_match.group(1))
-                title = heading_match.group(2).strip()
-
-                # Only extract up to max_section_depth
-                if level <= self.max_section_depth:
-                    current_section = {
-                        "level": level,
-                        "title": title,
-                        "start_line": i + 1,
-                    }
-                    section_content_lines = []
-                else:
-                    # Include deeper headings in current section content
-                    if current_section is not None:
-                        section_content_lines.append(line)
-            elif current_section is not None:
-                section_content_lines.append(line)
-
-        # Save last section
-        if current_section is not None:
-            section_content = "\n".join(section_content_lines).strip()
-            if section_content:
-                entity = self._create_section_entity(
-                    current_section, section_content, file_path, doc_type
-                )
-                sections.append(
-                    (entity, section_content, current_section["start_line"])
-                )
-
-        return sections
+        return [
+            (
+                self._create_section_entity(section, file_path, doc_type),
+                section.content,
+                section.start_line,
+            )
+            for section in scan.sections
+        ]
 
     def _create_section_entity(
         self,
-        section_info: dict[str, Any],
-        content: str,
+        section: _SectionSpan,
         file_path: Path,
         doc_type: str,
     ) -> Entity:
         """Create an entity for a document section.
 
         Args:
-            section_info: Section metadata (title, level, start_line)
-            content: Section content
+            section: Section span (title, level, start_line, content)
             file_path: Path to the document
             doc_type: Document type
 
         Returns:
             Entity representing the section
         """
-        title = section_info["title"]
-        level = section_info["level"]
-        start_line = section_info["start_line"]
+        title = section.title
+        level = section.level
+        start_line = section.start_line
+        content = section.content
+        req_count = section.requirement_count
 
         # Create unique name
         name = f"Section: {title}"
 
-        # Count requirements in this section
-        req_count = 0
-        for pattern in self.REQUIREMENT_PATTERNS:
-            req_count += len(re.findall(pattern, content, re.IGNORECASE))
-
         observations = [
             f"Section: {title}",
             f"Heading level: {level}",
@@ -422,12 +530,12 @@ class DesignDocParser(CodeParser):
         )
 
     def _extract_requirements(
-        self, content: str, file_path: Path, doc_type: str
+        self, scan: _DocumentScan, file_path: Path, doc_type: str
     ) -> list[tuple[Entity, str | None]]:
-        """Extract requirements from document content.
+        """Build requirement entities from the document's requirement matches.
 
         Args:
-            content: Document content
+            scan: Cached text analysis of the document
             file_path: Path to the document
             doc_type: Document type
 
@@ -435,55 +543,28 @@ class DesignDocParser(CodeParser):
             List of (Entity, parent_section_name) tuples
         """
         requirements: list[tuple[Entity, str | None]] = []
-        lines = content.split("\n")
-
-        current_section: str | None = None
-        req_counter = 0
-
-        for i, line in enumerate(lines):
-            # Track current section
-            heading_match = re.match(r"^#{1,3}\s+(.+)$", line)
-            if heading_match:
-                current_section = f"Section: {heading_match.group(1).strip()}"
-                continue
-
-            # Check for requirements
-            for pattern in self.REQUIREMENT_PATTERNS:
-                matches = re.finditer(pattern, line, re.IGNORECASE)
-                for match in matches:
-                    req_counter += 1
-                    req_text = match.group(1) if match.groups() else match.group(0)
-                    req_text = req_text.strip()
-
-                    # Determine requirement type
-                    req_type = "general"
-                    if re.search(r"\bMUST\b", line, re.IGNORECASE):
-                        req_type = "mandatory"
-                    elif re.search(r"\bSHOULD\b", line, re.IGNORECASE):
-                        req_type = "recommended"
-                    elif re.search(r"\bMAY\b", line, re.IGNORECASE):
-                        req_type = "optional"
-
-                    entity = Entity(
-                        name=f"REQ-{req_counter:03d}: {req_text[:50]}",
-                        entity_type=EntityType.REQUIREMENT,
-                        observations=[
-                            f"Requirement: {req_text}",
-                            f"Type: {req_type}",
-                            f"From {doc_type.upper()} document",
-                            f"Source section: {current_section or 'Document root'}",
-                        ],
-                        file_path=file_path,
-                        line_number=i + 1,
-                        metadata={
-                            "type": "requirement",
-                            "requirement_type": req_type,
-                            "doc_type": doc_type,
-                            "full_text": req_text,
-                            "parent_section": current_section,
-                        },
-                    )
-                    requirements.append((entity, current_section))
+
+        for req_counter, req in enumerate(scan.requirements, 1):
+            entity = Entity(
+                name=f"REQ-{req_counter:03d}: {req.text[:50]}",
+                entity_type=EntityType.REQUIREMENT,
+                observations=[
+                    f"Requirement: {req.text}",
+                    f"Type: {req.requirement_type}",
+                    f"From {doc_type.upper()} document",
+                    f"Source section: {req.parent_section or 'Document root'}",
+                ],
+                file_path=file_path,
+                line_number=req.line_number,
+                metadata={
+                    "type": "requirement",
+                    "requirement_type": req.requirement_type,
+                    "doc_type": doc_type,
+                    "full_text": req.text,
+                    "parent_section": req.parent_section,
+                },
+            )
+            requirements.append((entity, req.parent_section))
 
         return requirements
 
@@ -1,9 +1,26 @@
 """Embeddings package for generating vector representations of text."""
 
+from importlib import import_module
+
 from .base import BatchingEmbedder, CachingEmbedder, Embedder, EmbeddingResult
-from .bm25 import BM25Embedder
-from .openai import OpenAIEmbedder
-from .registry import EmbedderRegistry
+
+# Provider embedders pull in their client SDKs (openai, bm25s, ...), so they
+# are imported on first access instead of whenever the package is imported.
+_LAZY_EXPORTS = {
+    "BM25Embedder": ".bm25",
+    "OpenAIEmbedder": ".openai",
+    "EmbedderRegistry": ".registry",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "Embedder",
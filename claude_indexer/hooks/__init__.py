@@ -34,41 +34,58 @@ Milestone 12.1 adds Plan QA Verification:
 - verify_plan_qa: Convenience function for plan verification
 """
 
-from .fix_generator import FixSuggestion, FixSuggestionGenerator
-from .index_queue import IndexQueue
-from .plan_mode_detector import (
-    PlanModeDetectionResult,
-    PlanModeDetector,
-    detect_plan_mode,
-)
-from .plan_qa import (
-    PlanQAConfig,
-    PlanQAResult,
-    PlanQAVerifier,
-    verify_plan_qa,
-)
-from .post_write import (
-    PostWriteExecutor,
-    PostWriteResult,
-    format_findings_for_display,
-)
-from .repair_result import RepairCheckResult
-from .repair_session import RepairSession, RepairSessionManager
-from .session_start import (
-    IndexFreshnessResult,
-    SessionStartExecutor,
-    SessionStartResult,
-    run_session_start,
-)
-from .stop_check import (
-    StopCheckExecutor,
-    StopCheckResult,
-    format_findings_for_claude,
-)
-from .stop_check import format_findings_for_display as format_stop_findings_for_display
-from .stop_check import (
-    run_stop_check_with_repair,
-)
+from importlib import import_module
+
+# Each hook pulls in its own stack (rules engine, storage, git, ...), and the
+# hook CLIs only need one of them, so exports are imported on first access.
+_LAZY_EXPORTS = {
+    # PostToolUse hook
+    "PostWriteExecutor": (".post_write", "PostWriteExecutor"),
+    "PostWriteResult": (".post_write", "PostWriteResult"),
+    "format_findings_for_display": (".post_write", "format_findings_for_display"),
+    # Stop hook
+    "StopCheckExecutor": (".stop_check", "StopCheckExecutor"),
+    "StopCheckResult": (".stop_check", "StopCheckResult"),
+    "format_findings_for_claude": (".stop_check", "format_findings_for_claude"),
+    "format_stop_findings_for_display": (
+        ".stop_check",
+        "format_findings_for_display",
+    ),
+    "run_stop_check_with_repair": (".stop_check", "run_stop_check_with_repair"),
+    # SessionStart hook (Milestone 3.4)
+    "SessionStartExecutor": (".session_start", "SessionStartExecutor"),
+    "SessionStartResult": (".session_start", "SessionStartResult"),
+    "IndexFreshnessResult": (".session_start", "IndexFreshnessResult"),
+    "run_session_start": (".session_start", "run_session_start"),
+    # Indexing queue
+    "IndexQueue": (".index_queue", "IndexQueue"),
+    # Self-repair loop (Milestone 3.3)
+    "RepairSession": (".repair_session", "RepairSession"),
+    "RepairSessionManager": (".repair_session", "RepairSessionManager"),
+    "FixSuggestion": (".fix_generator", "FixSuggestion"),
+    "FixSuggestionGenerator": (".fix_generator", "FixSuggestionGenerator"),
+    "RepairCheckResult": (".repair_result", "RepairCheckResult"),
+    # Plan Mode Detection (Milestone 7.1)
+    "PlanModeDetector": (".plan_mode_detector", "PlanModeDetector"),
+    "PlanModeDetectionResult": (".plan_mode_detector", "PlanModeDetectionResult"),
+    "detect_plan_mode": (".plan_mode_detector", "detect_plan_mode"),
+    # Plan QA Verification (Milestone 12.1)
+    "PlanQAVerifier": (".plan_qa", "PlanQAVerifier"),
+    "PlanQAResult": (".plan_qa", "PlanQAResult"),
+    "PlanQAConfig": (".plan_qa", "PlanQAConfig"),
+    "verify_plan_qa": (".plan_qa", "verify_plan_qa"),
+}
+
+
+def __getattr__(name: str):
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # PostToolUse hook
@@ -16,7 +16,9 @@ Milestone 7.1: Plan Mode Detection
 import os
 import re
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from ..session.plan_context import PlanModeContext, PlanModeSource
@@ -35,6 +37,10 @@ PLANNING_KEYWORDS = re.compile(
     re.IGNORECASE,
 )
 
+# Every explicit marker and planning keyword phrase contains "plan", so a
+# substring check lets prompts without it skip both pattern scans
+_PLAN_HINT = "plan"
+
 # Additional planning indicators for boosting confidence
 PLANNING_BOOSTERS = re.compile(
     r"\b(step[- ]by[- ]step|phases?|milestones?|tasks?|timeline|roadmap)\b",
@@ -47,8 +53,90 @@ NON_PLANNING_INDICATORS = re.compile(
     re.IGNORECASE,
 )
 
+# Boosters and negatives never match the same words, so score both in one pass.
+# Explicit markers and planning keywords keep their own scans: their matches
+# can overlap each other and the scoring words ("make a plan mode",
+# "implement this plan"), which a single leftmost-match alternation would drop.
+_SCORING_PATTERNS = re.compile(
+    f"(?P<booster>{PLANNING_BOOSTERS.pattern})"
+    f"|(?P<negative>{NON_PLANNING_INDICATORS.pattern})",
+    re.IGNORECASE,
+)
+
+
+def _ascii_variant(pattern: re.Pattern[str]) -> re.Pattern[str]:
+    """Recompile a pattern for case-sensitive ASCII matching."""
+    flags = pattern.flags & ~(re.UNICODE | re.IGNORECASE)
+    return re.compile(pattern.pattern, flags | re.ASCII)
+
+
+# ASCII twins of the scan patterns, matched against the lowercased prompt.
+# All keywords are lowercase ASCII, so on prompts where str.isascii() holds
+# they match exactly the same spans while skipping the Unicode \w/\b tables
+# and per-character case folding. Other prompts keep the Unicode patterns,
+# where e.g. "café" must still count as a word.
+_EXPLICIT_PATTERNS_ASCII = _ascii_variant(EXPLICIT_PATTERNS)
+_PLANNING_KEYWORDS_ASCII = _ascii_variant(PLANNING_KEYWORDS)
+_SCORING_PATTERNS_ASCII = _ascii_variant(_SCORING_PATTERNS)
+
+
+# Module-level LRU caches for the prompt scans (max 256 prompts each).
+# They depend only on the prompt and the pattern constants above; call
+# cache_clear() on both after changing those patterns at runtime.
+@lru_cache(maxsize=256)
+def _find_explicit_markers(prompt: str, prompt_lower: str) -> tuple[str, ...]:
+    """Return explicit markers in the prompt, normalized to lowercase."""
+    if prompt.isascii():
+        # Every explicit marker contains "@", "--plan" or "mode"; substring
+        # checks are far cheaper than the regex scan for prompts with none
+        if not (
+            "@" in prompt_lower or "--plan" in prompt_lower or "mode" in prompt_lower
+        ):
+            return ()
+        return tuple(m.strip() for m in _EXPLICIT_PATTERNS_ASCII.findall(prompt_lower))
+    return tuple(m.lower().strip() for m in EXPLICIT_PATTERNS.findall(prompt))
+
+
+@lru_cache(maxsize=256)
+def _scan_planning_keywords(
+    prompt: str,
+    prompt_lower: str,
+) -> tuple[tuple[str, ...], tuple[str, ...], int] | None:
+    """Scan the prompt for planning keywords and confidence signals.
+
+    Returns:
+        None if no planning keyword matched, otherwise a tuple of
+        (keyword markers, lowercased booster matches, negative count)
+    """
+    if prompt.isascii():
+        # Lowercasing ASCII keeps offsets, so keyword groups are sliced from
+        # the original prompt to report markers in their original casing.
+        # Unmatched groups span (-1, -1), which slices to "" like findall.
+        keyword_matches = [
+            tuple(prompt[m.start(g) : m.end(g)] for g in (1, 2, 3))
+            for m in _PLANNING_KEYWORDS_ASCII.finditer(prompt_lower)
+        ]
+        scoring, scan_text = _SCORING_PATTERNS_ASCII, prompt_lower
+    else:
+        keyword_matches = PLANNING_KEYWORDS.findall(prompt)
+        scoring, scan_text = _SCORING_PATTERNS, prompt
+
+    if not keyword_matches:
+        return None
+
+    keyword_markers = tuple(" ".join(m).strip() for m in keyword_matches if any(m))
+    boosters: list[str] = []
+    negative_count = 0
+    for match in scoring.finditer(scan_text):
+        if match.lastgroup == "booster":
+            boosters.append(match.group("booster").lower())
+        else:
+            negative_count += 1
 
-@dataclass
+    return keyword_markers, tuple(boosters), negative_count
+
+
+@dataclass(slots=True)
 class PlanModeDetectionResult:
     """Result of Plan Mode detection.
 
@@ -80,6 +168,12 @@ class PlanModeDetectionResult:
         }
 
 
+# Shared "no signal" result returned by the _check_* helpers, so a negative
+# detection doesn't allocate one per signal. detect() never hands it to
+# callers; treat it as read-only.
+_NOT_DETECTED = PlanModeDetectionResult()
+
+
 class PlanModeDetector:
     """Detects Plan Mode activation from user prompts and context.
 
@@ -120,6 +214,12 @@ class PlanModeDetector:
         """
         self.plan_context = plan_context or PlanModeContext()
         self.confidence_threshold = confidence_threshold or self.CONFIDENCE_THRESHOLD
+        # Lowercased CLAUDE_PLAN_MODE value, read on first use
+        self._env_value: str | None = None
+
+    def refresh_env(self) -> None:
+        """Re-read CLAUDE_PLAN_MODE on the next detection."""
+        self._env_value = None
 
     def detect(self, prompt: str) -> PlanModeDetectionResult:
         """Detect Plan Mode from a user prompt.
@@ -137,12 +237,15 @@ class PlanModeDetector:
             PlanModeDetectionResult with detection outcome
         """
         start_time = time.perf_counter()
+        prompt_lower = prompt.lower()
+        mentions_plan = _PLAN_HINT in prompt_lower
 
         # Check explicit markers first (highest confidence)
-        result = self._check_explicit_markers(prompt)
-        if result.is_plan_mode:
-            result.detection_time_ms = (time.perf_counter() - start_time) * 1000
-            return result
+        if mentions_plan:
+            result = self._check_explicit_markers(prompt, prompt_lower)
+            if result.is_plan_mode:
+                result.detection_time_ms = (time.perf_counter() - start_time) * 1000
+                return result
 
         # Check environment variable
         result = self._check_environment_variable()
@@ -151,10 +254,11 @@ class PlanModeDetector:
             return result
 
         # Check planning keywords with confidence
-        result = self._check_planning_keywords(prompt)
-        if result.is_plan_mode:
-            result.detection_time_ms = (time.perf_counter() - start_time) * 1000
-            return result
+        if mentions_plan:
+            result = self._check_planning_keywords(prompt, prompt_lower)
+            if result.is_plan_mode:
+                result.detection_time_ms = (time.perf_counter() - start_time) * 1000
+                return result
 
         # Check session persistence (Plan Mode active from previous turn)
         result = self._check_session_persistence()
@@ -171,19 +275,39 @@ class PlanModeDetector:
         result.detection_time_ms = (time.perf_counter() - start_time) * 1000
         return result
 
-    def _check_explicit_markers(self, prompt: str) -> PlanModeDetectionResult:
+    def detect_many(self, prompts: Iterable[str]) -> list[PlanModeDetectionResult]:
+        """Detect Plan Mode for each prompt, e.g. across a message history.
+
+        Equivalent to calling detect() on every prompt in order; the plan
+        context is not updated between prompts. Pattern scans are cached per
+        prompt, so re-checking a history that grew by one message only scans
+        the new prompt.
+
+        Args:
+            prompts: User prompt texts
+
+        Returns:
+            One PlanModeDetectionResult per prompt, in input order
+        """
+        detect = self.detect
+        return [detect(prompt) for prompt in prompts]
+
+    def _check_explicit_markers(
+        self, prompt: str, prompt_lower: str | None = None
+    ) -> PlanModeDetectionResult:
         """Check for explicit Plan Mode markers.
 
         Args:
             prompt: User prompt text
+            prompt_lower: prompt.lower(), if the caller already computed it
 
         Returns:
             PlanModeDetectionResult
         """
-        matches = EXPLICIT_PATTERNS.findall(prompt)
-        if matches:
-            # Normalize matches to lowercase for consistency
-            markers = [m.lower().strip() for m in matches]
+        if prompt_lower is None:
+            prompt_lower = prompt.lower()
+        markers = list(_find_explicit_markers(prompt, prompt_lower))
+        if markers:
             return PlanModeDetectionResult(
                 is_plan_mode=True,
                 confidence=self.EXPLICIT_CONFIDENCE,
@@ -191,15 +315,20 @@ class PlanModeDetector:
                 detected_markers=markers,
                 reasoning=f"Explicit marker detected: {', '.join(markers)}",
             )
-        return PlanModeDetectionResult()
+        return _NOT_DETECTED
 
     def _check_environment_variable(self) -> PlanModeDetectionResult:
         """Check for CLAUDE_PLAN_MODE environment variable.
 
+        The variable is read once per detector; call refresh_env() to pick
+        up later changes.
+
         Returns:
             PlanModeDetectionResult
         """
-        env_value = os.environ.get(self.ENV_VAR_NAME, "").lower()
+        if self._env_value is None:
+            self._env_value = os.environ.get(self.ENV_VAR_NAME, "").lower()
+        env_value = self._env_value
         if env_value in ("true", "1", "yes", "on"):
             return PlanModeDetectionResult(
                 is_plan_mode=True,
@@ -208,9 +337,11 @@ class PlanModeDetector:
                 detected_markers=[f"{self.ENV_VAR_NAME}={env_value}"],
                 reasoning=f"Environment variable {self.ENV_VAR_NAME} is set",
             )
-        return PlanModeDetectionResult()
+        return _NOT_DETECTED
 
-    def _check_planning_keywords(self, prompt: str) -> PlanModeDetectionResult:
+    def _check_planning_keywords(
+        self, prompt: str, prompt_lower: str | None = None
+    ) -> PlanModeDetectionResult:
         """Check for planning keywords with confidence scoring.
 
         Base confidence starts at 0.7 for keyword match, then:
@@ -219,29 +350,31 @@ class PlanModeDetector:
 
         Args:
             prompt: User prompt text
+            prompt_lower: prompt.lower(), if the caller already computed it
 
         Returns:
             PlanModeDetectionResult
         """
-        keyword_matches = PLANNING_KEYWORDS.findall(prompt)
-        if not keyword_matches:
-            return PlanModeDetectionResult()
+        if prompt_lower is None:
+            prompt_lower = prompt.lower()
+        signals = _scan_planning_keywords(prompt, prompt_lower)
+        if signals is None:
+            return _NOT_DETECTED
+        keyword_markers, booster_matches, negative_count = signals
 
         # Start with base confidence
         confidence = self.KEYWORD_BASE_CONFIDENCE
-        markers = [" ".join(m).strip() for m in keyword_matches if any(m)]
+        markers = list(keyword_markers)
 
         # Check for boosters
-        booster_matches = PLANNING_BOOSTERS.findall(prompt)
         if booster_matches:
             boost = min(len(booster_matches) * self.BOOSTER_INCREMENT, 0.3)
             confidence += boost
-            markers.extend([b.lower() for b in booster_matches])
+            markers.extend(booster_matches)
 
         # Check for negative indicators
-        negative_matches = NON_PLANNING_INDICATORS.findall(prompt)
-        if negative_matches:
-            confidence -= len(negative_matches) * self.NEGATIVE_DECREMENT
+        if negative_count:
+            confidence -= negative_count * self.NEGATIVE_DECREMENT
 
         # Clamp confidence
         confidence = max(0.0, min(1.0, confidence))
@@ -281,7 +414,7 @@ class PlanModeDetector:
                 detected_markers=["session_state"],
                 reasoning="Plan Mode persisted from previous turn",
             )
-        return PlanModeDetectionResult()
+        return _NOT_DETECTED
 
     def update_context(
         self, result: PlanModeDetectionResult, session_id: str | None = None
@@ -18,6 +18,7 @@ Milestone 12.1: Plan QA Verifier
 import re
 import time
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -301,15 +302,21 @@ class PlanQAVerifier:
         start_time = time.perf_counter()
         result = PlanQAResult()
 
+        # The code-change scan feeds both the test and duplicate checks,
+        # so run it at most once per plan
+        has_code_changes = False
+        if self.config.check_tests or self.config.check_duplicates:
+            has_code_changes = self._needs_tests(plan_text)
+
         # Run all checks
         if self.config.check_tests:
-            self._check_test_coverage(plan_text, result)
+            self._check_test_coverage(plan_text, result, has_code_changes)
 
         if self.config.check_docs:
             self._check_doc_coverage(plan_text, result)
 
         if self.config.check_duplicates:
-            self._check_duplicate_verification(plan_text, result)
+            self._check_duplicate_verification(plan_text, result, has_code_changes)
 
         if self.config.check_architecture:
             self._check_architecture(plan_text, result)
@@ -328,17 +335,24 @@ class PlanQAVerifier:
 
         return result
 
-    def _check_test_coverage(self, plan_text: str, result: PlanQAResult) -> None:
+    def _check_test_coverage(
+        self,
+        plan_text: str,
+        result: PlanQAResult,
+        has_code_changes: bool | None = None,
+    ) -> None:
         """Check for test coverage in plan.
 
         Args:
             plan_text: Plan text to check
             result: Result to populate
+            has_code_changes: Precomputed code-change detection, if available
         """
-        has_code_changes = self._needs_tests(plan_text)
-        has_test_tasks = self._has_test_tasks(plan_text)
+        if has_code_changes is None:
+            has_code_changes = self._needs_tests(plan_text)
 
-        if has_code_changes and not has_test_tasks:
+        # Only scan for test tasks when there is code that needs them
+        if has_code_changes and not self._has_test_tasks(plan_text):
             result.missing_tests.append(
                 "Plan modifies/adds code but includes no test tasks"
             )
@@ -350,27 +364,30 @@ class PlanQAVerifier:
             plan_text: Plan text to check
             result: Result to populate
         """
-        is_user_facing = self._is_user_facing(plan_text)
-        has_doc_tasks = self._has_doc_tasks(plan_text)
-
-        if is_user_facing and not has_doc_tasks:
+        # Only scan for doc tasks when the change is user-facing
+        if self._is_user_facing(plan_text) and not self._has_doc_tasks(plan_text):
             result.missing_docs.append(
                 "User-facing changes without documentation update task"
             )
 
     def _check_duplicate_verification(
-        self, plan_text: str, result: PlanQAResult
+        self,
+        plan_text: str,
+        result: PlanQAResult,
+        creates_new_code: bool | None = None,
     ) -> None:
         """Check for duplicate verification in plan.
 
         Args:
             plan_text: Plan text to check
             result: Result to populate
+            creates_new_code: Precomputed code-creation detection, if available
         """
-        creates_new_code = self._creates_new_code(plan_text)
-        mentions_reuse = self._mentions_reuse_check(plan_text)
+        if creates_new_code is None:
+            creates_new_code = self._creates_new_code(plan_text)
 
-        if creates_new_code and not mentions_reuse:
+        # Only scan for reuse mentions when new code is being created
+        if creates_new_code and not self._mentions_reuse_check(plan_text):
             result.potential_duplicates.append(
                 "New code creation without explicit duplicate/reuse check"
             )
@@ -382,11 +399,11 @@ class PlanQAVerifier:
             plan_text: Plan text to check
             result: Result to populate
         """
-        matches = self.ARCHITECTURE_CONCERN_PATTERNS.findall(plan_text)
-        for match in matches[:3]:  # Limit to 3 warnings
-            concern = match if isinstance(match, str) else match[0]
+        # Limit to 3 warnings; islice stops the scan once they are found
+        matches = islice(self.ARCHITECTURE_CONCERN_PATTERNS.finditer(plan_text), 3)
+        for match in matches:
             result.architecture_warnings.append(
-                f"Performance concern detected: {concern}"
+                f"Performance concern detected: {match.group(1)}"
             )
 
     def _determine_validity(self, result: PlanQAResult) -> bool:
@@ -19,6 +19,28 @@ from dataclasses import dataclass, field
 from functools import lru_cache
 from typing import Any
 
+# (heading, command) templates per hint type. Both are formatted with the
+# generator's MCP tool prefix and the entity/query the hint is about.
+_HINT_TEMPLATES: dict[str, tuple[str, str]] = {
+    "duplicate_check": (
+        "Duplicate Check",
+        '{prefix}search_similar("{query}", entityTypes=["function", "class"])',
+    ),
+    "test_discovery": (
+        "Test Discovery",
+        '{prefix}search_similar("{query} test", entityTypes=["file", "function"])',
+    ),
+    "doc_discovery": (
+        "Documentation",
+        '{prefix}search_similar("documentation README", '
+        'entityTypes=["documentation", "file"])',
+    ),
+    "architecture": (
+        "{query} Analysis",
+        '{prefix}read_graph(entity="{query}", mode="smart")',
+    ),
+}
+
 
 # Module-level LRU cache for entity extraction (max 128 prompts)
 @lru_cache(maxsize=128)
@@ -50,7 +72,7 @@ def _cached_extract_entities(prompt: str) -> tuple[str, ...]:
     return tuple(list(entities)[:10])
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationHintsConfig:
     """Configuration for exploration hints generation.
 
@@ -94,7 +116,7 @@ class ExplorationHintsConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationHints:
     """Generated exploration hints.
 
@@ -184,6 +206,8 @@ class ExplorationHintsGenerator:
         self.collection_name = collection_name
         self.config = config or ExplorationHintsConfig()
         self._mcp_prefix = f"mcp__{collection_name}-memory__"
+        # The documentation hint does not depend on the prompt
+        self._doc_hint = self._render_hint("doc_discovery")
 
     def generate(self, prompt: str) -> ExplorationHints:
         """Generate exploration hints from user prompt.
@@ -250,6 +274,21 @@ class ExplorationHintsGenerator:
         # Use cached extraction and convert back to list
         return list(_cached_extract_entities(prompt))
 
+    def _render_hint(self, hint_type: str, query: str = "") -> tuple[str, str]:
+        """Render a hint from its template.
+
+        Args:
+            hint_type: Key into the hint template table
+            query: Entity or search term the hint is about
+
+        Returns:
+            Tuple of (formatted hint, MCP command)
+        """
+        heading, command = _HINT_TEMPLATES[hint_type]
+        cmd = command.format(prefix=self._mcp_prefix, query=query)
+        hint = f"## {heading.format(query=query)}\n{cmd}"
+        return hint, cmd
+
     def _generate_duplicate_hint(self, entity: str) -> tuple[str, str]:
         """Generate duplicate check hint.
 
@@ -259,12 +298,7 @@ class ExplorationHintsGenerator:
         Returns:
             Tuple of (formatted hint, MCP command)
         """
-        cmd = (
-            f'{self._mcp_prefix}search_similar("{entity}", '
-            f'entityTypes=["function", "class"])'
-        )
-        hint = f"## Duplicate Check\n{cmd}"
-        return hint, cmd
+        return self._render_hint("duplicate_check", entity)
 
     def _generate_test_hint(self, entities: list[str]) -> tuple[str, str]:
         """Generate test discovery hint.
@@ -275,13 +309,7 @@ class ExplorationHintsGenerator:
         Returns:
             Tuple of (formatted hint, MCP command)
         """
-        query = entities[0] if entities else "test"
-        cmd = (
-            f'{self._mcp_prefix}search_similar("{query} test", '
-            f'entityTypes=["file", "function"])'
-        )
-        hint = f"## Test Discovery\n{cmd}"
-        return hint, cmd
+        return self._render_hint("test_discovery", entities[0] if entities else "test")
 
     def _generate_doc_hint(self) -> tuple[str, str]:
         """Generate documentation discovery hint.
@@ -289,12 +317,7 @@ class ExplorationHintsGenerator:
         Returns:
             Tuple of (formatted hint, MCP command)
         """
-        cmd = (
-            f'{self._mcp_prefix}search_similar("documentation README", '
-            f'entityTypes=["documentation", "file"])'
-        )
-        hint = f"## Documentation\n{cmd}"
-        return hint, cmd
+        return self._doc_hint
 
     def _generate_architecture_hint(self, entity: str) -> tuple[str, str]:
         """Generate architecture analysis hint for entity.
@@ -305,6 +328,4 @@ class ExplorationHintsGenerator:
         Returns:
             Tuple of (formatted hint, MCP command)
         """
-        cmd = f'{self._mcp_prefix}read_graph(entity="{entity}", mode="smart")'
-        hint = f"## {entity} Analysis\n{cmd}"
-        return hint, cmd
+        return self._render_hint("architecture", entity)
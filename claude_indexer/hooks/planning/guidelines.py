@@ -20,6 +20,13 @@ from typing import Any
 _pattern_cache: dict[tuple[str, float], list[str]] = {}
 _MAX_PATTERN_CACHE_SIZE = 32
 
+# Fixed framing around the rendered sections
+_GUIDELINES_HEADER = (
+    "\n=== PLANNING QUALITY GUIDELINES ===\n\n"
+    "When formulating this implementation plan, follow these guidelines:\n\n"
+)
+_GUIDELINES_FOOTER = "=== END PLANNING GUIDELINES ===\n"
+
 
 @dataclass
 class PlanningGuidelinesConfig:
@@ -203,26 +210,44 @@ Flag any step that may introduce:
         self.project_path = project_path or Path.cwd()
         self.config = config or PlanningGuidelinesConfig()
         self._mcp_prefix = f"mcp__{collection_name}-memory__"
+        # Only these depend on the collection, so render them once
+        self._code_reuse_section = self.CODE_REUSE_TEMPLATE.format(
+            mcp_prefix=self._mcp_prefix
+        )
+        self._code_reuse_commands = (
+            f'{self._mcp_prefix}search_similar("query")',
+            f'{self._mcp_prefix}read_graph(entity="Name", mode="relations")',
+        )
+        self._cache: dict[tuple, PlanningGuidelines] = {}
 
     def generate(self) -> PlanningGuidelines:
         """Generate planning guidelines.
 
+        Output is memoized per generator and rebuilt when the config or a
+        candidate CLAUDE.md file changes.
+
         Returns:
             PlanningGuidelines with full text and structured sections
         """
         start_time = time.perf_counter()
 
+        cache_key = self._cache_key()
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return PlanningGuidelines(
+                full_text=cached.full_text,
+                sections=dict(cached.sections),
+                mcp_commands=list(cached.mcp_commands),
+                project_patterns=list(cached.project_patterns),
+                generation_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
         sections: dict[str, str] = {}
         mcp_commands: list[str] = []
 
         if self.config.include_code_reuse_check:
             sections["code_reuse"] = self._render_code_reuse_section()
-            mcp_commands.extend(
-                [
-                    f'{self._mcp_prefix}search_similar("query")',
-                    f'{self._mcp_prefix}read_graph(entity="Name", mode="relations")',
-                ]
-            )
+            mcp_commands.extend(self._code_reuse_commands)
 
         if self.config.include_testing_requirements:
             sections["testing"] = self.TESTING_TEMPLATE
@@ -248,6 +273,16 @@ Flag any step that may introduce:
 
         generation_time_ms = (time.perf_counter() - start_time) * 1000
 
+        # Only the latest fingerprint is kept; older ones can't match again
+        self._cache = {
+            cache_key: PlanningGuidelines(
+                full_text=full_text,
+                sections=dict(sections),
+                mcp_commands=list(mcp_commands),
+                project_patterns=list(project_patterns),
+            )
+        }
+
         return PlanningGuidelines(
             full_text=full_text,
             sections=sections,
@@ -256,9 +291,48 @@ Flag any step that may introduce:
             generation_time_ms=generation_time_ms,
         )
 
+    def clear_cache(self) -> None:
+        """Drop memoized guidelines so the next generate() rebuilds them."""
+        self._cache.clear()
+
+    def _cache_key(self) -> tuple:
+        """Build a cheap fingerprint of everything generate() depends on.
+
+        Returns:
+            Tuple of collection name, config values and the stat signature
+            of each candidate CLAUDE.md file
+        """
+        config_items = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in self.config.to_dict().items()
+        )
+        return (
+            self.collection_name,
+            config_items,
+            tuple(self._file_signature(path) for path in self._pattern_paths()),
+        )
+
+    @staticmethod
+    def _file_signature(path: Path) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) for a file, or None if it can't be read."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _pattern_paths(self) -> list[Path]:
+        """List CLAUDE.md candidates in lookup order."""
+        paths = []
+        if self.config.project_patterns_path:
+            paths.append(Path(self.config.project_patterns_path))
+        paths.append(self.project_path / "CLAUDE.md")
+        paths.append(self.project_path / ".claude" / "CLAUDE.md")
+        return paths
+
     def _render_code_reuse_section(self) -> str:
         """Render code reuse section with MCP prefix."""
-        return self.CODE_REUSE_TEMPLATE.format(mcp_prefix=self._mcp_prefix)
+        return self._code_reuse_section
 
     def _render_architecture_section(self, patterns: list[str]) -> str:
         """Render architecture section with project patterns."""
@@ -280,20 +354,8 @@ Flag any step that may introduce:
         Returns:
             List of extracted patterns (max 10)
         """
-        # Check custom path first
-        if self.config.project_patterns_path:
-            custom_path = Path(self.config.project_patterns_path)
-            patterns = self._load_patterns_from_file(custom_path)
-            if patterns:
-                return patterns
-
-        # Standard locations
-        claude_md_paths = [
-            self.project_path / "CLAUDE.md",
-            self.project_path / ".claude" / "CLAUDE.md",
-        ]
-
-        for path in claude_md_paths:
+        # Custom path first, then standard locations
+        for path in self._pattern_paths():
             patterns = self._load_patterns_from_file(path)
             if patterns:
                 return patterns
@@ -373,22 +435,8 @@ Flag any step that may introduce:
         Returns:
             Complete guidelines text
         """
-        lines = [
-            "",
-            "=== PLANNING QUALITY GUIDELINES ===",
-            "",
-            "When formulating this implementation plan, follow these guidelines:",
-            "",
-        ]
-
-        for section_content in sections.values():
-            lines.append(section_content.strip())
-            lines.append("")
-
-        lines.append("=== END PLANNING GUIDELINES ===")
-        lines.append("")
-
-        return "\n".join(lines)
+        body = "".join(f"{content.strip()}\n\n" for content in sections.values())
+        return f"{_GUIDELINES_HEADER}{body}{_GUIDELINES_FOOTER}"
 
     def generate_compact(self) -> str:
         """Generate compact version of guidelines for low-latency scenarios.
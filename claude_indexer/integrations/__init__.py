@@ -9,6 +9,7 @@ from .cache import TicketCache
 from .github import GitHubIssuesClient
 from .linear import LinearClient
 from .models import (
+    GITHUB_PRIORITY_TERMS,
     GITHUB_STATUS_MAP,
     LINEAR_PRIORITY_MAP,
     LINEAR_STATUS_MAP,
@@ -40,6 +41,7 @@ __all__ = [
     "LINEAR_STATUS_MAP",
     "LINEAR_PRIORITY_MAP",
     "GITHUB_STATUS_MAP",
+    "GITHUB_PRIORITY_TERMS",
     # Utilities
     "normalize_linear_status",
     "normalize_linear_priority",
@@ -10,11 +10,39 @@ from __future__ import annotations
 import random
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import TYPE_CHECKING
 
+import requests
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from .models import TicketEntity, TicketSource, TicketStatus
 
+# Exception types that are always worth retrying
+_TRANSIENT_ERROR_TYPES = (
+    TimeoutError,
+    ConnectionError,
+    requests.Timeout,
+    requests.ConnectionError,
+)
+
+# HTTP status codes that indicate a transient failure
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503})
+
+# Message fragments for errors that carry no type or status to dispatch on
+_TRANSIENT_MESSAGES = (
+    "rate limit",
+    "timeout",
+    "connection",
+    "429",
+    "503",
+    "502",
+    "500",
+    "temporarily unavailable",
+)
+
 
 class IntegrationClient(ABC):
     """Abstract base class for issue tracker integrations.
@@ -30,6 +58,9 @@ class IntegrationClient(ABC):
         base_delay: float = 1.0,
         max_delay: float = 30.0,
         requests_per_minute: int = 60,
+        time_source: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float, float], float] = random.uniform,
     ):
         """Initialize the integration client.
 
@@ -39,15 +70,21 @@ class IntegrationClient(ABC):
             base_delay: Base delay for exponential backoff (seconds)
             max_delay: Maximum delay between retries (seconds)
             requests_per_minute: Rate limit (requests per minute)
+            time_source: Clock used for rate limiting (seconds)
+            sleep: Function used to wait for rate limits and retries
+            jitter: Random draw between two bounds used to scale retry jitter
         """
         self.api_key = api_key
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self._requests_per_minute = requests_per_minute
+        self._time = time_source
+        self._sleep = sleep
+        self._jitter = jitter
 
         # Rate limiting state
-        self._request_times: list[float] = []
+        self._request_times: deque[float] = deque()
 
     @property
     @abstractmethod
@@ -112,20 +149,23 @@ class IntegrationClient(ABC):
         Blocks if rate limit would be exceeded.
         Follows the pattern from openai.py embeddings.
         """
-        current_time = time.time()
+        current_time = self._time()
 
-        # Clean old entries (older than 1 minute)
-        self._request_times = [t for t in self._request_times if current_time - t < 60]
+        # Clean old entries (older than 1 minute); timestamps are appended in
+        # order, so expired ones are always at the head
+        request_times = self._request_times
+        while request_times and current_time - request_times[0] >= 60:
+            request_times.popleft()
 
         # Check if would exceed limit
         if len(self._request_times) >= self._requests_per_minute:
             sleep_time = 60 - (current_time - self._request_times[0]) + 1
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                self._sleep(sleep_time)
 
     def _record_request(self) -> None:
         """Record a request for rate limiting."""
-        self._request_times.append(time.time())
+        self._request_times.append(self._time())
 
     def _calculate_delay(self, attempt: int) -> float:
         """Calculate delay with exponential backoff and jitter.
@@ -139,7 +179,7 @@ class IntegrationClient(ABC):
         delay = self.base_delay * (2**attempt)
         delay = min(delay, self.max_delay)
         # Add jitter (10-30% of delay)
-        jitter = random.uniform(0.1, 0.3) * delay
+        jitter = self._jitter(0.1, 0.3) * delay
         return delay + jitter
 
     def _should_retry(self, error: Exception, attempt: int) -> bool:
@@ -155,18 +195,14 @@ class IntegrationClient(ABC):
         if attempt >= self.max_retries:
             return False
 
+        if isinstance(error, _TRANSIENT_ERROR_TYPES):
+            return True
+
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in _TRANSIENT_STATUS_CODES
+
         error_str = str(error).lower()
-        transient_errors = [
-            "rate limit",
-            "timeout",
-            "connection",
-            "429",
-            "503",
-            "502",
-            "500",
-            "temporarily unavailable",
-        ]
-        return any(err in error_str for err in transient_errors)
+        return any(err in error_str for err in _TRANSIENT_MESSAGES)
 
     def _execute_with_retry(self, operation: callable, *args, **kwargs):
         """Execute an operation with retry logic.
@@ -194,7 +230,7 @@ class IntegrationClient(ABC):
                 last_error = e
                 if self._should_retry(e, attempt):
                     delay = self._calculate_delay(attempt)
-                    time.sleep(delay)
+                    self._sleep(delay)
                 else:
                     raise
 
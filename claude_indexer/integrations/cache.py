@@ -6,24 +6,26 @@ following the pattern from storage/query_cache.py.
 
 from __future__ import annotations
 
-import hashlib
-import json
+import heapq
+import itertools
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from threading import Lock
+from threading import Event, Lock
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
     from .models import TicketEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """A single cache entry with TTL tracking."""
 
     value: Any
-    created_at: float
+    expires_at: float  # Deadline on the cache's time source
     hits: int = 0
 
 
@@ -37,39 +39,80 @@ class TicketCache:
         self,
         max_entries: int = 500,
         ttl_seconds: float = 300.0,  # 5 minutes default
+        time_source: Callable[[], float] = time.monotonic,
     ):
         """Initialize the ticket cache.
 
         Args:
             max_entries: Maximum number of entries before LRU eviction
             ttl_seconds: Time-to-live for entries in seconds
+            time_source: Clock used for TTL expiry (seconds)
         """
         self.max_entries = max_entries
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._time = time_source
+        self._cache: OrderedDict[Hashable, CacheEntry] = OrderedDict()
         self._lock = Lock()
+        # (expires_at, sequence, key) min-heap; entries whose key was since
+        # rewritten or removed are skipped when popped, and the heap is
+        # rebuilt once such stale entries pile up. The sequence breaks ties
+        # so keys are never compared.
+        self._expiry_heap: list[tuple[float, int, Hashable]] = []
+        self._sequence = itertools.count()
+        # Keys currently being loaded by get_or_fetch, with their done events
+        self._inflight: dict[Hashable, Event] = {}
 
         # Statistics
         self._hits = 0
         self._misses = 0
 
-    def _compute_key(self, *args, **kwargs) -> str:
-        """Compute a cache key from arguments.
+    @staticmethod
+    def _ticket_key(ticket_id: str, source: str) -> tuple[str, str, str]:
+        """Compute the cache key for a single ticket.
+
+        Args:
+            ticket_id: The ticket identifier
+            source: The ticket source (linear, github)
+
+        Returns:
+            Hashable key tuple
+        """
+        return ("ticket", ticket_id, source)
+
+    @staticmethod
+    def _search_key(
+        query: str | None,
+        status: list[str] | None,
+        labels: list[str] | None,
+        source: str | None,
+        project: str | None,
+        limit: int,
+    ) -> tuple[Any, ...]:
+        """Compute the cache key for a search.
+
+        Status and label filters are normalized to sorted tuples of unique
+        values, so their order and repetition do not affect the key.
 
         Args:
-            *args: Positional arguments to hash
-            **kwargs: Keyword arguments to hash
+            query: Search query
+            status: Status filter
+            labels: Labels filter
+            source: Source filter
+            project: Project filter
+            limit: Result limit
 
         Returns:
-            16-character hex string key
+            Hashable key tuple
         """
-        # Create a deterministic string representation
-        key_data = json.dumps(
-            {"args": args, "kwargs": kwargs},
-            sort_keys=True,
-            default=str,
+        return (
+            "search",
+            query,
+            tuple(sorted(set(status))) if status else None,
+            tuple(sorted(set(labels))) if labels else None,
+            source,
+            project,
+            limit,
         )
-        return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
     def _is_expired(self, entry: CacheEntry) -> bool:
         """Check if a cache entry has expired.
@@ -80,7 +123,7 @@ class TicketCache:
         Returns:
             True if expired, False otherwise
         """
-        return time.time() - entry.created_at > self.ttl_seconds
+        return self._time() > entry.expires_at
 
     def _evict_if_needed(self) -> None:
         """Evict oldest entries if cache is full.
@@ -91,25 +134,41 @@ class TicketCache:
             # Remove oldest entry (first item in OrderedDict)
             self._cache.popitem(last=False)
 
-    def _prune_expired(self) -> int:
+    def _prune_expired(self, current_time: float) -> int:
         """Remove all expired entries.
 
-        Must be called while holding the lock.
+        Pops the expiry heap up to current_time, so only expired entries
+        are visited. Must be called while holding the lock.
+
+        Args:
+            current_time: Current reading of the cache's time source
 
         Returns:
             Number of entries removed
         """
-        current_time = time.time()
-        expired_keys = [
-            key
+        heap = self._expiry_heap
+        removed = 0
+        while heap and current_time > heap[0][0]:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                del self._cache[key]
+                removed += 1
+        return removed
+
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live entries only.
+
+        Drops heap entries left behind by rewrites, LRU evictions and
+        source invalidation. Must be called while holding the lock.
+        """
+        self._expiry_heap = [
+            (entry.expires_at, next(self._sequence), key)
             for key, entry in self._cache.items()
-            if current_time - entry.created_at > self.ttl_seconds
         ]
-        for key in expired_keys:
-            del self._cache[key]
-        return len(expired_keys)
+        heapq.heapify(self._expiry_heap)
 
-    def get(self, key: str) -> Any | None:
+    def get(self, key: Hashable) -> Any | None:
         """Get a value from the cache.
 
         Args:
@@ -119,23 +178,36 @@ class TicketCache:
             Cached value or None if not found/expired
         """
         with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                self._misses += 1
-                return None
+            return self._lookup(key)
 
-            if self._is_expired(entry):
-                del self._cache[key]
-                self._misses += 1
-                return None
+    def _lookup(self, key: Hashable) -> Any | None:
+        """Look up a key and update LRU order and statistics.
+
+        Must be called while holding the lock.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            Cached value or None if not found/expired
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if self._is_expired(entry):
+            del self._cache[key]
+            self._misses += 1
+            return None
 
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            entry.hits += 1
-            self._hits += 1
-            return entry.value
+        # Move to end (most recently used)
+        self._cache.move_to_end(key)
+        entry.hits += 1
+        self._hits += 1
+        return entry.value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: Hashable, value: Any) -> None:
         """Set a value in the cache.
 
         Args:
@@ -143,15 +215,54 @@ class TicketCache:
             value: The value to cache
         """
         with self._lock:
-            # Prune expired entries periodically
-            if len(self._cache) > 0 and len(self._cache) % 100 == 0:
-                self._prune_expired()
-
+            current_time = self._time()
+            # Free slots held by expired entries before evicting live ones
+            self._prune_expired(current_time)
+            # A rewritten key replaces its old entry, not some other one
+            self._cache.pop(key, None)
             self._evict_if_needed()
-            self._cache[key] = CacheEntry(
-                value=value,
-                created_at=time.time(),
-            )
+
+            expires_at = current_time + self.ttl_seconds
+            self._cache[key] = CacheEntry(value=value, expires_at=expires_at)
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._sequence), key))
+            if len(self._expiry_heap) > 2 * self.max_entries:
+                self._rebuild_expiry_heap()
+
+    def get_or_fetch(self, key: Hashable, loader: Callable[[], Any]) -> Any | None:
+        """Get a value, loading and caching it on a miss.
+
+        Concurrent misses on the same key run the loader once: the first
+        caller loads while the others wait and then read its cached result.
+        If the loader returns None or raises, a waiting caller takes over
+        the load.
+
+        Args:
+            key: The cache key
+            loader: Called without arguments to produce the value on a miss
+
+        Returns:
+            Cached or freshly loaded value (None results are not cached)
+        """
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not None:
+                    return value
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = Event()
+                    break
+            event.wait()
+
+        try:
+            value = loader()
+            if value is not None:
+                self.set(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
 
     def get_ticket(self, ticket_id: str, source: str) -> TicketEntity | None:
         """Get a cached ticket by ID.
@@ -163,8 +274,7 @@ class TicketCache:
         Returns:
             Cached ticket or None
         """
-        key = self._compute_key("ticket", ticket_id, source)
-        return self.get(key)
+        return self.get(self._ticket_key(ticket_id, source))
 
     def set_ticket(self, ticket: TicketEntity) -> None:
         """Cache a ticket.
@@ -172,8 +282,7 @@ class TicketCache:
         Args:
             ticket: The ticket to cache
         """
-        key = self._compute_key("ticket", ticket.id, ticket.source.value)
-        self.set(key, ticket)
+        self.set(self._ticket_key(ticket.id, ticket.source.value), ticket)
 
     def get_search_results(
         self,
@@ -197,15 +306,7 @@ class TicketCache:
         Returns:
             Cached results or None
         """
-        key = self._compute_key(
-            "search",
-            query=query,
-            status=sorted(status) if status else None,
-            labels=sorted(labels) if labels else None,
-            source=source,
-            project=project,
-            limit=limit,
-        )
+        key = self._search_key(query, status, labels, source, project, limit)
         return self.get(key)
 
     def set_search_results(
@@ -229,15 +330,7 @@ class TicketCache:
             project: Project filter
             limit: Result limit
         """
-        key = self._compute_key(
-            "search",
-            query=query,
-            status=sorted(status) if status else None,
-            labels=sorted(labels) if labels else None,
-            source=source,
-            project=project,
-            limit=limit,
-        )
+        key = self._search_key(query, status, labels, source, project, limit)
         self.set(key, results)
 
     def invalidate(self, source: str | None = None) -> int:
@@ -253,6 +346,7 @@ class TicketCache:
             if source is None:
                 count = len(self._cache)
                 self._cache.clear()
+                self._expiry_heap.clear()
                 return count
 
             # For source-specific invalidation, we need to check all entries
@@ -268,6 +362,8 @@ class TicketCache:
 
             for key in keys_to_remove:
                 del self._cache[key]
+            if keys_to_remove:
+                self._rebuild_expiry_heap()
             return len(keys_to_remove)
 
     def clear(self) -> int:
@@ -68,8 +68,18 @@ GITHUB_STATUS_MAP: dict[str, TicketStatus] = {
     "closed": TicketStatus.DONE,
 }
 
+# Priority label terms for GitHub, matched as substrings in precedence order.
+# "priority: critical" etc. need no entry of their own: they contain the
+# bare term.
+GITHUB_PRIORITY_TERMS: dict[TicketPriority, tuple[str, ...]] = {
+    TicketPriority.URGENT: ("p0", "critical", "urgent"),
+    TicketPriority.HIGH: ("p1", "high"),
+    TicketPriority.MEDIUM: ("p2", "medium"),
+    TicketPriority.LOW: ("p3", "low"),
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketComment:
     """A comment on a ticket."""
 
@@ -90,7 +100,7 @@ class TicketComment:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TicketEntity:
     """Unified ticket representation across Linear and GitHub.
 
@@ -256,27 +266,10 @@ def infer_github_priority(labels: list[str]) -> TicketPriority:
     """
     labels_lower = [label.lower() for label in labels]
 
-    # Check for urgent/critical
-    for label in labels_lower:
-        if any(
-            term in label for term in ["p0", "critical", "urgent", "priority: critical"]
-        ):
-            return TicketPriority.URGENT
-
-    # Check for high
-    for label in labels_lower:
-        if any(term in label for term in ["p1", "high", "priority: high"]):
-            return TicketPriority.HIGH
-
-    # Check for medium
-    for label in labels_lower:
-        if any(term in label for term in ["p2", "medium", "priority: medium"]):
-            return TicketPriority.MEDIUM
-
-    # Check for low
-    for label in labels_lower:
-        if any(term in label for term in ["p3", "low", "priority: low"]):
-            return TicketPriority.LOW
+    for priority, terms in GITHUB_PRIORITY_TERMS.items():
+        for label in labels_lower:
+            if any(term in label for term in terms):
+                return priority
 
     return TicketPriority.NONE
 
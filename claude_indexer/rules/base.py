@@ -173,6 +173,14 @@ class RuleContext:
     _ast_tree: Any = field(default=None, repr=False)
     _parser: Any = field(default=None, repr=False)
 
+    # Split lines, cached for the content string they were split from
+    _lines: list[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lines_source: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     # Memory context
     memory_client: Any = field(default=None, repr=False)  # Qdrant client
     collection_name: str | None = None
@@ -190,8 +198,15 @@ class RuleContext:
 
     @property
     def lines(self) -> list[str]:
-        """Get content as list of lines."""
-        return self.content.split("\n")
+        """Get content as list of lines.
+
+        The split is cached because every rule run against this context
+        reads it; reassigning ``content`` invalidates the cache.
+        """
+        if self._lines is None or self._lines_source is not self.content:
+            self._lines = self.content.split("\n")
+            self._lines_source = self.content
+        return self._lines
 
     def is_line_in_diff(self, line_number: int) -> bool:
         """Check if a line is in the diff scope."""
@@ -21,24 +21,35 @@ class OutdatedDocsRule(BaseRule):
     actual function signature, or return types are mismatched.
     """
 
-    # Python docstring parameter patterns
+    # Sphinx style: :param param_name:
+    SPHINX_PARAM_PATTERN = re.compile(r":param\s+(?:\w+\s+)?(\w+):")
+
+    # Python docstring parameter patterns, applied to the Args: section
     PYTHON_PARAM_PATTERNS = [
         # Google style: param_name: description
-        r"^\s+(\w+)\s*(?:\([^)]+\))?:",
-        # Sphinx style: :param param_name:
-        r":param\s+(?:\w+\s+)?(\w+):",
+        re.compile(r"^\s+(\w+)\s*(?:\([^)]+\))?:", re.MULTILINE),
+        SPHINX_PARAM_PATTERN,
         # NumPy style: param_name : type
-        r"^\s+(\w+)\s*:\s*\w+",
+        re.compile(r"^\s+(\w+)\s*:\s*\w+", re.MULTILINE),
     ]
 
+    # Docstring section patterns (Google Args: and NumPy Parameters)
+    ARGS_SECTION_PATTERN = re.compile(r"Args?:\s*\n((?:\s+\w+.*\n?)+)")
+    NUMPY_SECTION_PATTERN = re.compile(r"Parameters\s*\n-+\s*\n((?:\s*\w+\s*:.*\n?)+)")
+    NUMPY_PARAM_PATTERN = re.compile(r"\s*(\w+)\s*:")
+
     # JSDoc parameter pattern
-    JSDOC_PARAM_PATTERN = r"@param\s+(?:\{[^}]+\}\s+)?(\w+)"
+    JSDOC_PARAM_PATTERN = re.compile(r"@param\s+(?:\{[^}]+\}\s+)?(\w+)")
 
     # Function signature patterns
     FUNCTION_PATTERNS = {
-        "python": r"def\s+\w+\s*\(([^)]*)\)",
-        "javascript": r"function\s+\w+\s*\(([^)]*)\)|=>\s*\{|=\s*(?:async\s+)?\(([^)]*)\)\s*=>",
-        "typescript": r"function\s+\w+\s*(?:<[^>]+>)?\s*\(([^)]*)\)|=>\s*\{|=\s*(?:async\s+)?\(([^)]*)\)\s*(?::\s*[^=]+)?\s*=>",
+        "python": re.compile(r"def\s+\w+\s*\(([^)]*)\)"),
+        "javascript": re.compile(
+            r"function\s+\w+\s*\(([^)]*)\)|=>\s*\{|=\s*(?:async\s+)?\(([^)]*)\)\s*=>"
+        ),
+        "typescript": re.compile(
+            r"function\s+\w+\s*(?:<[^>]+>)?\s*\(([^)]*)\)|=>\s*\{|=\s*(?:async\s+)?\(([^)]*)\)\s*(?::\s*[^=]+)?\s*=>"
+        ),
     }
 
     @property
@@ -202,25 +213,23 @@ class OutdatedDocsRule(BaseRule):
         docstring_content = "\n".join(lines[doc_start : doc_end + 1])
 
         # Check for Args: section (Google style)
-        args_match = re.search(r"Args?:\s*\n((?:\s+\w+.*\n?)+)", docstring_content)
+        args_match = self.ARGS_SECTION_PATTERN.search(docstring_content)
         if args_match:
             args_section = args_match.group(1)
             for pattern in self.PYTHON_PARAM_PATTERNS:
-                for match in re.finditer(pattern, args_section, re.MULTILINE):
+                for match in pattern.finditer(args_section):
                     params.add(match.group(1))
 
         # Check for :param: (Sphinx style)
-        for match in re.finditer(r":param\s+(?:\w+\s+)?(\w+):", docstring_content):
+        for match in self.SPHINX_PARAM_PATTERN.finditer(docstring_content):
             params.add(match.group(1))
 
         # Check for Parameters section (NumPy style)
-        params_match = re.search(
-            r"Parameters\s*\n-+\s*\n((?:\s*\w+\s*:.*\n?)+)", docstring_content
-        )
+        params_match = self.NUMPY_SECTION_PATTERN.search(docstring_content)
         if params_match:
             params_section = params_match.group(1)
             for line in params_section.split("\n"):
-                match = re.match(r"\s*(\w+)\s*:", line)
+                match = self.NUMPY_PARAM_PATTERN.match(line)
                 if match:
                     params.add(match.group(1))
 
@@ -251,7 +260,7 @@ class OutdatedDocsRule(BaseRule):
 
         # Extract @param tags
         jsdoc_content = "\n".join(lines[doc_start : doc_end + 1])
-        for match in re.finditer(self.JSDOC_PARAM_PATTERN, jsdoc_content):
+        for match in self.JSDOC_PARAM_PATTERN.finditer(jsdoc_content):
             params.add(match.group(1))
 
         return params, doc_start, doc_end
@@ -309,7 +318,7 @@ class OutdatedDocsRule(BaseRule):
                 continue
 
             # Look for function definitions
-            match = re.search(func_pattern, line)
+            match = func_pattern.search(line)
             if not match:
                 continue
 
@@ -329,7 +338,7 @@ class OutdatedDocsRule(BaseRule):
                     if paren_count <= 0:
                         break
 
-                sig_match = re.search(func_pattern, full_sig)
+                sig_match = func_pattern.search(full_sig)
                 if sig_match:
                     signature = sig_match.group(1) or (
                         sig_match.group(2) if sig_match.lastindex >= 2 else ""
@@ -22,7 +22,7 @@ class PlanModeSource(Enum):
     SESSION_PERSISTED = "session_persisted"  # From session state
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanModeContext:
     """Tracks Plan Mode state for a Claude Code session.
 
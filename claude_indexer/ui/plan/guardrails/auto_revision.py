@@ -5,9 +5,11 @@ revisions to implementation plans based on validation findings from
 plan guardrail rules.
 """
 
+import hashlib
+import json
 import time
 from collections import defaultdict
-from copy import deepcopy
+from copy import copy, deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
@@ -27,7 +29,9 @@ class AppliedRevision:
     """Record of a successfully applied revision.
 
     Tracks the revision that was applied, the finding it addressed,
-    and when it was applied.
+    and when it was applied. Once recorded in a plan's revision history
+    the entry is hash-chained to its predecessor so that later edits to
+    the history can be detected.
     """
 
     revision: PlanRevision
@@ -35,9 +39,27 @@ class AppliedRevision:
     success: bool
     error: str | None = None
     applied_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Hash chain links, set when the entry is added to a plan's history
+    previous_hash: str = field(default="", compare=False)
+    entry_hash: str = field(default="", compare=False)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
+    def compute_hash(self, previous_hash: str) -> str:
+        """Compute the chained hash of this entry.
+
+        Args:
+            previous_hash: Hash of the preceding history entry ("" for first).
+
+        Returns:
+            Hex digest covering the previous hash and this entry's content.
+        """
+        payload = json.dumps(self._hash_payload(), sort_keys=True, default=str)
+        digest = hashlib.blake2b(
+            (previous_hash + payload).encode("utf-8"), digest_size=16
+        )
+        return digest.hexdigest()
+
+    def _hash_payload(self) -> dict[str, Any]:
+        """Content covered by the entry hash (excludes the chain links)."""
         return {
             "revision": self.revision.to_dict(),
             "finding": self.finding.to_dict(),
@@ -46,6 +68,13 @@ class AppliedRevision:
             "applied_at": self.applied_at,
         }
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        result = self._hash_payload()
+        result["previous_hash"] = self.previous_hash
+        result["entry_hash"] = self.entry_hash
+        return result
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AppliedRevision":
         """Create AppliedRevision from dictionary."""
@@ -55,6 +84,8 @@ class AppliedRevision:
             success=data["success"],
             error=data.get("error"),
             applied_at=data.get("applied_at", datetime.now().isoformat()),
+            previous_hash=data.get("previous_hash", ""),
+            entry_hash=data.get("entry_hash", ""),
         )
 
 
@@ -106,9 +137,7 @@ class RevisedPlan:
                 rev = applied.revision
                 finding = applied.finding
 
-                lines.append(
-                    f"### {i}. {rev.revision_type.value.replace('_', ' ').title()}"
-                )
+                lines.append(f"### {i}. {rev.revision_type.label}")
                 lines.append(f"- **Rule**: {finding.rule_id}")
                 lines.append(f"- **Reason**: {rev.rationale}")
                 lines.append(f"- **Confidence**: {finding.confidence:.0%}")
@@ -271,16 +300,29 @@ class AutoRevisionEngine:
             # Sort revisions by priority
             sorted_revisions = self._sort_revisions_by_priority(revisions_to_apply)
 
-            # Apply revisions
+            # Apply revisions. The dependency graph is shared by consecutive
+            # ADD_DEPENDENCY revisions (their conflict checks extend it with
+            # each accepted edge) and rebuilt only after other changes.
             applied_this_iter = 0
+            dependency_graph: dict[str, set[str]] | None = None
             for revision, finding in sorted_revisions:
                 # Check max revisions limit
                 if len(all_applied) >= self.config.max_revisions_per_plan:
                     break
 
+                is_dependency = revision.revision_type == RevisionType.ADD_DEPENDENCY
+                if is_dependency and dependency_graph is None:
+                    dependency_graph = self._get_task_dependency_graph(current_plan)
+                elif not is_dependency:
+                    dependency_graph = None
+
                 # Check for conflicts
-                conflict = self._check_conflicts(current_plan, revision)
+                conflict = self._check_conflicts(
+                    current_plan, revision, graph=dependency_graph
+                )
                 if conflict:
+                    # A rejected revision may have left partial edges behind
+                    dependency_graph = None
                     all_skipped.append((revision, conflict))
                     processed_finding_ids.add(self._finding_id(finding))
                     continue
@@ -288,6 +330,7 @@ class AutoRevisionEngine:
                 # Try to apply the revision
                 new_plan, error = self._apply_revision(current_plan, revision)
                 if error:
+                    dependency_graph = None
                     all_skipped.append((revision, error))
                     processed_finding_ids.add(self._finding_id(finding))
                     continue
@@ -377,12 +420,15 @@ class AutoRevisionEngine:
         self,
         plan: "ImplementationPlan",
         revision: PlanRevision,
+        graph: dict[str, set[str]] | None = None,
     ) -> str | None:
         """Check if a revision would cause conflicts.
 
         Args:
             plan: Current plan state
             revision: Revision to check
+            graph: Optional dependency graph of ``plan`` to reuse for
+                ADD_DEPENDENCY checks. Accepted edges are added to it.
 
         Returns:
             Conflict description if conflict exists, None otherwise
@@ -391,45 +437,44 @@ class AutoRevisionEngine:
             if revision.new_task is None:
                 return "ADD_TASK revision missing new_task"
             # Check if task ID already exists
-            existing_ids = {t.id for t in plan.all_tasks}
-            if revision.new_task.id in existing_ids:
+            if plan.get_task_by_id(revision.new_task.id) is not None:
                 return f"Task ID '{revision.new_task.id}' already exists"
 
         elif revision.revision_type == RevisionType.MODIFY_TASK:
             if revision.target_task_id is None:
                 return "MODIFY_TASK revision missing target_task_id"
             # Check if target task exists
-            existing_ids = {t.id for t in plan.all_tasks}
-            if revision.target_task_id not in existing_ids:
+            if plan.get_task_by_id(revision.target_task_id) is None:
                 return f"Target task '{revision.target_task_id}' does not exist"
 
         elif revision.revision_type == RevisionType.REMOVE_TASK:
             if revision.target_task_id is None:
                 return "REMOVE_TASK revision missing target_task_id"
             # Check if target task exists
-            existing_ids = {t.id for t in plan.all_tasks}
-            if revision.target_task_id not in existing_ids:
+            if plan.get_task_by_id(revision.target_task_id) is None:
                 return f"Target task '{revision.target_task_id}' does not exist"
 
         elif revision.revision_type == RevisionType.ADD_DEPENDENCY:
-            # Check for circular dependencies
+            # Build the graph once and extend it with each accepted edge so
+            # that edges within the same revision are checked together
+            if graph is None:
+                graph = self._get_task_dependency_graph(plan)
             for from_id, to_id in revision.dependency_additions:
                 if from_id == to_id:
                     return f"Self-dependency not allowed: {from_id}"
-                if self._would_create_cycle(plan, from_id, to_id):
+                if self._would_create_cycle(plan, from_id, to_id, graph=graph):
                     return f"Would create circular dependency: {from_id} -> {to_id}"
                 # Check that both tasks exist
-                existing_ids = {t.id for t in plan.all_tasks}
-                if from_id not in existing_ids:
+                if from_id not in graph:
                     return f"Source task '{from_id}' does not exist"
-                if to_id not in existing_ids:
+                if to_id not in graph:
                     return f"Target task '{to_id}' does not exist"
+                graph[from_id].add(to_id)
 
         elif revision.revision_type == RevisionType.REORDER_TASKS:
             if revision.target_task_id is None:
                 return "REORDER_TASKS revision missing target_task_id"
-            existing_ids = {t.id for t in plan.all_tasks}
-            if revision.target_task_id not in existing_ids:
+            if plan.get_task_by_id(revision.target_task_id) is None:
                 return f"Target task '{revision.target_task_id}' does not exist"
 
         return None
@@ -458,6 +503,7 @@ class AutoRevisionEngine:
         plan: "ImplementationPlan",
         from_id: str,
         to_id: str,
+        graph: dict[str, set[str]] | None = None,
     ) -> bool:
         """Check if adding a dependency would create a cycle.
 
@@ -465,30 +511,29 @@ class AutoRevisionEngine:
             plan: Current plan
             from_id: Task that would gain the dependency
             to_id: Task that would be depended upon
+            graph: Optional prebuilt dependency graph to reuse across checks
 
         Returns:
             True if adding from_id -> to_id would create a cycle
         """
-        # Build current graph
-        graph = self._get_task_dependency_graph(plan)
+        if graph is None:
+            graph = self._get_task_dependency_graph(plan)
 
         # Adding from_id -> to_id means from_id depends on to_id
-        # A cycle exists if to_id can reach from_id through dependencies
-        # i.e., if from_id is in the dependency chain of to_id
-
-        # DFS from to_id to see if we can reach from_id
-        visited: set[str] = set()
+        # A cycle exists if to_id can reach from_id through dependencies.
+        # Walk with an explicit stack so deep chains cannot hit the
+        # recursion limit.
+        visited: set[str] = {to_id}
         stack = [to_id]
 
         while stack:
             current = stack.pop()
             if current == from_id:
                 return True  # Found a cycle!
-            if current in visited:
-                continue
-            visited.add(current)
-            # Add all dependencies of current to stack
-            stack.extend(graph.get(current, set()))
+            for dep_id in graph.get(current, ()):
+                if dep_id not in visited:
+                    visited.add(dep_id)
+                    stack.append(dep_id)
 
         return False
 
@@ -500,14 +545,14 @@ class AutoRevisionEngine:
         """Apply a single revision to the plan.
 
         Args:
-            plan: Current plan (will be copied)
+            plan: Current plan (left untouched; see _copy_for_revision)
             revision: Revision to apply
 
         Returns:
             Tuple of (new_plan, error_message). error_message is None on success.
         """
         try:
-            new_plan = deepcopy(plan)
+            new_plan = self._copy_for_revision(plan, revision)
 
             if revision.revision_type == RevisionType.ADD_TASK:
                 new_plan = self._apply_add_task(new_plan, revision)
@@ -527,6 +572,59 @@ class AutoRevisionEngine:
         except Exception as e:
             return plan, f"Error applying revision: {str(e)}"
 
+    def _copy_for_revision(
+        self,
+        plan: "ImplementationPlan",
+        revision: PlanRevision,
+    ) -> "ImplementationPlan":
+        """Copy only the parts of a plan that a revision can modify.
+
+        Groups and tasks the revision does not touch are shared with the
+        input plan, so applying a revision costs O(changes) rather than a
+        deep copy of the whole plan, while the input plan stays intact if
+        the revision fails halfway.
+
+        Args:
+            plan: Plan to copy
+            revision: Revision that will be applied to the copy
+
+        Returns:
+            Plan whose touched groups, tasks and lists are private copies
+        """
+        touched_ids: set[str] = set()
+        if revision.target_task_id is not None:
+            touched_ids.add(revision.target_task_id)
+        touched_ids.update(from_id for from_id, _ in revision.dependency_additions)
+        add_scope = (
+            revision.new_task.scope
+            if revision.revision_type == RevisionType.ADD_TASK
+            and revision.new_task is not None
+            else None
+        )
+
+        new_plan = copy(plan)
+        new_plan.groups = list(plan.groups)
+        replaced: dict[int, Any] = {}
+
+        for group_index, group in enumerate(plan.groups):
+            if group.scope != add_scope and not any(
+                task.id in touched_ids for task in group.tasks
+            ):
+                continue
+
+            new_group = copy(group)
+            new_group.tasks = list(group.tasks)
+            for task_index, task in enumerate(group.tasks):
+                if task.id in touched_ids:
+                    new_task = deepcopy(task)
+                    replaced[id(task)] = new_task
+                    new_group.tasks[task_index] = new_task
+            new_plan.groups[group_index] = new_group
+
+        # Quick wins reference the same Task objects as the groups
+        new_plan.quick_wins = [replaced.get(id(t), t) for t in plan.quick_wins]
+        return new_plan
+
     def _apply_add_task(
         self,
         plan: "ImplementationPlan",
@@ -587,15 +685,11 @@ class AutoRevisionEngine:
         if revision.target_task_id is None:
             return plan
 
-        # Find the task and modify it
-        for group in plan.groups:
-            for task in group.tasks:
-                if task.id == revision.target_task_id:
-                    # Apply modifications
-                    for field_name, new_value in revision.modifications.items():
-                        if hasattr(task, field_name):
-                            setattr(task, field_name, new_value)
-                    return plan
+        task = plan.get_task_by_id(revision.target_task_id)
+        if task is not None:
+            for field_name, new_value in revision.modifications.items():
+                if hasattr(task, field_name):
+                    setattr(task, field_name, new_value)
 
         return plan
 
@@ -643,13 +737,11 @@ class AutoRevisionEngine:
         Returns:
             Modified plan
         """
+        tasks_by_id = plan.get_task_index()
         for from_id, to_id in revision.dependency_additions:
-            # Find the source task and add the dependency
-            for group in plan.groups:
-                for task in group.tasks:
-                    if task.id == from_id:
-                        if to_id not in task.dependencies:
-                            task.dependencies.append(to_id)
+            task = tasks_by_id.get(from_id)
+            if task is not None and to_id not in task.dependencies:
+                task.dependencies.append(to_id)
 
         return plan
 
@@ -675,12 +767,9 @@ class AutoRevisionEngine:
         if new_priority is None:
             return plan
 
-        # Find the task and update its priority
-        for group in plan.groups:
-            for task in group.tasks:
-                if task.id == revision.target_task_id:
-                    task.priority = new_priority
-                    return plan
+        task = plan.get_task_by_id(revision.target_task_id)
+        if task is not None:
+            task.priority = new_priority
 
         return plan
 
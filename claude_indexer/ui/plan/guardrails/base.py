@@ -16,6 +16,8 @@ from typing import TYPE_CHECKING, Any
 # to maintain consistency across rule systems
 from claude_indexer.rules.base import Evidence, Severity
 
+from ..task import intern_id
+
 if TYPE_CHECKING:
     from ..task import ImplementationPlan, Task
     from .config import PlanGuardrailConfig, RuleConfig
@@ -30,8 +32,20 @@ class RevisionType(Enum):
     ADD_DEPENDENCY = "add_dependency"  # Add task dependency
     REORDER_TASKS = "reorder_tasks"  # Change task order/priority
 
+    @property
+    def label(self) -> str:
+        """Human-readable title, e.g. "Add Task" for ADD_TASK."""
+        return _REVISION_TYPE_LABELS[self]
+
 
-@dataclass
+# Precomputed once so audit trail formatting does no per-entry string work
+_REVISION_TYPE_LABELS = {
+    revision_type: revision_type.value.replace("_", " ").title()
+    for revision_type in RevisionType
+}
+
+
+@dataclass(slots=True)
 class PlanRevision:
     """A suggested revision to an implementation plan.
 
@@ -50,6 +64,13 @@ class PlanRevision:
         default_factory=list
     )  # (from_task_id, to_task_id) pairs
 
+    def __post_init__(self) -> None:
+        self.target_task_id = intern_id(self.target_task_id)
+        self.dependency_additions = [
+            (intern_id(from_id), intern_id(to_id))
+            for from_id, to_id in self.dependency_additions
+        ]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -84,7 +105,7 @@ class PlanRevision:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanValidationFinding:
     """A plan validation finding from a guardrail rule.
 
@@ -103,6 +124,10 @@ class PlanValidationFinding:
     suggested_revision: PlanRevision | None = None
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def __post_init__(self) -> None:
+        self.rule_id = intern_id(self.rule_id)
+        self.affected_tasks = [intern_id(task_id) for task_id in self.affected_tasks]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -212,10 +237,7 @@ class PlanValidationContext:
         Returns:
             Task if found, None otherwise
         """
-        for task in self.plan.all_tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self.plan.get_task_by_id(task_id)
 
 
 class PlanValidationRule(ABC):
@@ -266,6 +288,16 @@ class PlanValidationRule(ABC):
         """
         return True
 
+    @property
+    def is_thread_safe(self) -> bool:
+        """Whether this rule may run concurrently with other rules.
+
+        Override and return False for rules that mutate shared state;
+        the engine then runs them on the calling thread even when
+        parallel execution is enabled.
+        """
+        return True
+
     @abstractmethod
     def validate(self, context: PlanValidationContext) -> list[PlanValidationFinding]:
         """Run the rule validation and return findings.
@@ -18,6 +18,12 @@ from .base import PlanValidationContext, PlanValidationFinding, PlanValidationRu
 if TYPE_CHECKING:
     from .config import PlanGuardrailConfig
 
+# Rule classes loaded from each rules file, keyed by resolved path.
+# Values are (mtime_ns, size, classes) so edited files are reloaded.
+_RULE_CLASS_CACHE: dict[Path, tuple[int, int, tuple[type[PlanValidationRule], ...]]] = (
+    {}
+)
+
 
 @dataclass
 class PlanGuardrailEngineConfig:
@@ -301,40 +307,18 @@ class PlanGuardrailEngine:
 
         discovered = 0
 
-        for py_file in rules_dir.glob("*.py"):
+        for py_file in sorted(rules_dir.glob("*.py")):
             if py_file.name.startswith("_"):
                 continue
 
-            try:
-                # Load the module dynamically
-                spec = importlib.util.spec_from_file_location(
-                    f"guardrails_rules_{py_file.stem}",
-                    py_file,
-                )
-                if spec is None or spec.loader is None:
-                    continue
-
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Find all PlanValidationRule subclasses
-                for _name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (
-                        issubclass(obj, PlanValidationRule)
-                        and obj is not PlanValidationRule
-                        and not inspect.isabstract(obj)
-                    ):
-                        try:
-                            rule_instance = obj()
-                            self.register(rule_instance)
-                            discovered += 1
-                        except Exception:
-                            # Skip rules that fail to instantiate
-                            pass
-
-            except Exception:
-                # Skip files that fail to import
-                pass
+            for rule_class in _load_rule_classes(py_file):
+                try:
+                    rule_instance = rule_class()
+                    self.register(rule_instance)
+                    discovered += 1
+                except Exception:
+                    # Skip rules that fail to instantiate
+                    pass
 
         return discovered
 
@@ -510,10 +494,8 @@ class PlanGuardrailEngine:
         Returns:
             Tuple of (results, rules_executed, rules_skipped).
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import ThreadPoolExecutor
 
-        results: list[RuleExecutionResult] = []
-        rules_executed = 0
         rules_skipped = 0
 
         # Filter enabled rules first
@@ -524,22 +506,31 @@ class PlanGuardrailEngine:
             else:
                 rules_skipped += 1
 
-        # Execute enabled rules in parallel
-        if enabled_rules:
+        # Rules that opt out of threading run on this thread before the pool
+        # starts, so they never overlap a pooled rule.
+        by_rule_id = {
+            rule.rule_id: self._execute_rule(rule, context)
+            for rule in enabled_rules
+            if not rule.is_thread_safe
+        }
+
+        pooled_rules = [rule for rule in enabled_rules if rule.is_thread_safe]
+        if pooled_rules:
             max_workers = min(
-                self.engine_config.max_parallel_workers, len(enabled_rules)
+                self.engine_config.max_parallel_workers, len(pooled_rules)
             )
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_rule = {
-                    executor.submit(self._execute_rule, rule, context): rule
-                    for rule in enabled_rules
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                futures = {
+                    rule.rule_id: executor.submit(self._execute_rule, rule, context)
+                    for rule in pooled_rules
                 }
-                for future in as_completed(future_to_rule):
-                    result = future.result()
-                    results.append(result)
-                    rules_executed += 1
+                for rule_id, future in futures.items():
+                    by_rule_id[rule_id] = future.result()
 
-        return results, rules_executed, rules_skipped
+        # Results keep the rule registration order
+        results = [by_rule_id[rule.rule_id] for rule in enabled_rules]
+
+        return results, len(results), rules_skipped
 
     def _filter_findings(
         self,
@@ -574,6 +565,56 @@ class PlanGuardrailEngine:
         return filtered
 
 
+def _load_rule_classes(py_file: Path) -> tuple[type[PlanValidationRule], ...]:
+    """Load the concrete PlanValidationRule subclasses defined in a file.
+
+    Module execution is cached per file and only repeated when the file's
+    mtime or size changes, so building several engines in one process
+    imports each rules module once.
+
+    Args:
+        py_file: Python file to load.
+
+    Returns:
+        Tuple of rule classes (empty if the file fails to import).
+    """
+    try:
+        stat = py_file.stat()
+        cache_key = py_file.resolve()
+    except OSError:
+        return ()
+
+    cached = _RULE_CLASS_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    classes: tuple[type[PlanValidationRule], ...] = ()
+    try:
+        # Load the module dynamically
+        spec = importlib.util.spec_from_file_location(
+            f"guardrails_rules_{py_file.stem}",
+            py_file,
+        )
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+
+            # Find all PlanValidationRule subclasses
+            classes = tuple(
+                obj
+                for _name, obj in inspect.getmembers(module, inspect.isclass)
+                if issubclass(obj, PlanValidationRule)
+                and obj is not PlanValidationRule
+                and not inspect.isabstract(obj)
+            )
+    except Exception:
+        # Skip files that fail to import
+        classes = ()
+
+    _RULE_CLASS_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, classes)
+    return classes
+
+
 def create_guardrail_engine(
     config: "PlanGuardrailConfig",
     discover_rules: bool = True,
@@ -84,12 +84,14 @@ class DocRequirementRule(PlanValidationRule):
         findings: list[PlanValidationFinding] = []
 
         # Gather all doc tasks in the plan
-        doc_task_ids = self._get_doc_task_ids(context.plan.all_tasks)
+        all_tasks = context.plan.all_tasks
+        doc_task_ids = self._get_doc_task_ids(all_tasks)
+        dependents = context.plan.get_dependents()
 
         # If plan already has doc tasks, we might be covered
         has_doc_tasks = len(doc_task_ids) > 0
 
-        for task in context.plan.all_tasks:
+        for task in all_tasks:
             # Skip if task is already a doc task
             if task.id in doc_task_ids:
                 continue
@@ -99,9 +101,7 @@ class DocRequirementRule(PlanValidationRule):
                 continue
 
             # Check if task has doc coverage
-            if has_doc_tasks and self._has_doc_coverage(
-                task, doc_task_ids, context.plan.all_tasks
-            ):
+            if has_doc_tasks and self._has_doc_coverage(task, doc_task_ids, dependents):
                 continue
 
             # Create finding for task without doc coverage
@@ -208,20 +208,15 @@ class DocRequirementRule(PlanValidationRule):
         return {task.id for task in tasks if self._is_doc_task(task)}
 
     def _has_doc_coverage(
-        self, task: Task, doc_task_ids: set[str], all_tasks: list[Task]
+        self, task: Task, doc_task_ids: set[str], dependents: dict[str, set[str]]
     ) -> bool:
         """Check if task has documentation coverage."""
         # Check if any doc task depends on this task
-        for other_task in all_tasks:
-            if other_task.id in doc_task_ids:
-                if task.id in other_task.dependencies:
-                    return True
-
-        # Check if this task depends on a doc task
-        if set(task.dependencies) & doc_task_ids:
+        if not doc_task_ids.isdisjoint(dependents.get(task.id, ())):
             return True
 
-        return False
+        # Check if this task depends on a doc task
+        return not doc_task_ids.isdisjoint(task.dependencies)
 
     def _extract_user_facing_keywords(self, task: Task) -> list[str]:
         """Extract detected user-facing keywords from task."""
@@ -82,9 +82,11 @@ class TestRequirementRule(PlanValidationRule):
         findings: list[PlanValidationFinding] = []
 
         # Gather all test tasks in the plan
-        test_task_ids = self._get_test_task_ids(context.plan.all_tasks)
+        all_tasks = context.plan.all_tasks
+        test_task_ids = self._get_test_task_ids(all_tasks)
+        dependents = context.plan.get_dependents()
 
-        for task in context.plan.all_tasks:
+        for task in all_tasks:
             # Skip if task is already a test task
             if task.id in test_task_ids:
                 continue
@@ -98,7 +100,7 @@ class TestRequirementRule(PlanValidationRule):
                 continue
 
             # Check if task has a test dependency or related test task
-            if self._has_test_coverage(task, test_task_ids, context.plan.all_tasks):
+            if self._has_test_coverage(task, test_task_ids, dependents):
                 continue
 
             # Create finding for task without test coverage
@@ -197,20 +199,15 @@ class TestRequirementRule(PlanValidationRule):
         return {task.id for task in tasks if self._is_test_task(task)}
 
     def _has_test_coverage(
-        self, task: Task, test_task_ids: set[str], all_tasks: list[Task]
+        self, task: Task, test_task_ids: set[str], dependents: dict[str, set[str]]
     ) -> bool:
         """Check if task has test coverage via dependencies or relations."""
         # Check if any test task depends on this task
-        for other_task in all_tasks:
-            if other_task.id in test_task_ids:
-                if task.id in other_task.dependencies:
-                    return True
-
-        # Check if this task depends on a test task (unlikely but possible)
-        if set(task.dependencies) & test_task_ids:
+        if not test_task_ids.isdisjoint(dependents.get(task.id, ())):
             return True
 
-        return False
+        # Check if this task depends on a test task (unlikely but possible)
+        return not test_task_ids.isdisjoint(task.dependencies)
 
     def _extract_feature_keywords(self, task: Task) -> list[str]:
         """Extract detected feature keywords from task."""
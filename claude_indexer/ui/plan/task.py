@@ -4,7 +4,8 @@ Defines Task, TaskGroup, and ImplementationPlan dataclasses
 for structured implementation planning.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
@@ -12,7 +13,22 @@ if TYPE_CHECKING:
     from .guardrails.auto_revision import AppliedRevision
 
 
-@dataclass
+def intern_id(value: Any) -> Any:
+    """Intern an identifier string so repeated IDs share one object.
+
+    Task and rule IDs are used as dict keys and compared constantly during
+    validation and revision; interned copies compare by identity first.
+
+    Args:
+        value: Identifier to intern. Non-``str`` values are returned as-is.
+
+    Returns:
+        The interned string, or ``value`` unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Task:
     """Single implementation task.
 
@@ -35,6 +51,10 @@ class Task:
     dependencies: list[str] = field(default_factory=list)  # task IDs
     tags: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.id = intern_id(self.id)
+        self.dependencies = [intern_id(dep) for dep in self.dependencies]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -86,7 +106,7 @@ class Task:
         return self.impact >= 0.7 and self.estimated_effort == "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskGroup:
     """Group of related tasks by scope.
 
@@ -149,7 +169,7 @@ class TaskGroup:
         return [t for t in self.tasks if t.is_quick_win]
 
 
-@dataclass
+@dataclass(slots=True)
 class ImplementationPlan:
     """Complete implementation plan with grouped tasks.
 
@@ -213,10 +233,41 @@ class ImplementationPlan:
     def add_revisions(self, revisions: list["AppliedRevision"]) -> None:
         """Add revisions to the cumulative history.
 
+        Each entry is stored as a copy chained to the previous entry's
+        hash, so the history can later be checked with
+        verify_revision_history().
+
         Args:
             revisions: List of applied revisions to append.
         """
-        self.revision_history.extend(revisions)
+        previous_hash = (
+            self.revision_history[-1].entry_hash if self.revision_history else ""
+        )
+        for revision in revisions:
+            entry_hash = revision.compute_hash(previous_hash)
+            self.revision_history.append(
+                replace(revision, previous_hash=previous_hash, entry_hash=entry_hash)
+            )
+            previous_hash = entry_hash
+
+    def verify_revision_history(self) -> bool:
+        """Check that the revision history hash chain is intact.
+
+        Histories saved before hashing was introduced carry no hashes
+        and are reported as unverified.
+
+        Returns:
+            True if every entry links to its predecessor and its content
+            still matches its recorded hash.
+        """
+        previous_hash = ""
+        for applied in self.revision_history:
+            if applied.previous_hash != previous_hash:
+                return False
+            if applied.compute_hash(previous_hash) != applied.entry_hash:
+                return False
+            previous_hash = applied.entry_hash
+        return True
 
     def format_revision_history(self) -> str:
         """Format cumulative revision history as human-readable markdown.
@@ -240,9 +291,7 @@ class ImplementationPlan:
             rev = applied.revision
             finding = applied.finding
 
-            lines.append(
-                f"### {i}. {rev.revision_type.value.replace('_', ' ').title()}"
-            )
+            lines.append(f"### {i}. {rev.revision_type.label}")
             lines.append(f"- **Applied at**: {applied.applied_at}")
             lines.append(f"- **Rule**: {finding.rule_id}")
             lines.append(f"- **Reason**: {rev.rationale}")
@@ -315,6 +364,51 @@ class ImplementationPlan:
             tasks.extend(group.tasks)
         return tasks
 
+    def get_task_index(self) -> dict[str, Task]:
+        """Build a task ID -> Task index in a single pass.
+
+        The index is a snapshot; rebuild it after adding or removing tasks.
+        If IDs are duplicated, the first occurrence wins.
+
+        Returns:
+            Dictionary mapping task IDs to tasks.
+        """
+        index: dict[str, Task] = {}
+        for group in self.groups:
+            for task in group.tasks:
+                index.setdefault(task.id, task)
+        return index
+
+    def get_dependents(self) -> dict[str, set[str]]:
+        """Build the reverse dependency graph in a single pass.
+
+        Like get_task_index(), this is a snapshot of the current plan.
+
+        Returns:
+            Dictionary mapping a task ID to the IDs of tasks that depend on it.
+        """
+        dependents: dict[str, set[str]] = {}
+        for group in self.groups:
+            for task in group.tasks:
+                for dep_id in task.dependencies:
+                    dependents.setdefault(dep_id, set()).add(task.id)
+        return dependents
+
+    def get_task_by_id(self, task_id: str) -> Task | None:
+        """Get a task by its ID.
+
+        Args:
+            task_id: Task identifier.
+
+        Returns:
+            Task if found, None otherwise.
+        """
+        for group in self.groups:
+            for task in group.tasks:
+                if task.id == task_id:
+                    return task
+        return None
+
     def get_tasks_by_priority(self, max_priority: int = 3) -> list[Task]:
         """Get high-priority tasks.
 
@@ -10,7 +10,8 @@ Provides test fixtures for:
 
 import json
 import os
-from collections.abc import Iterator
+import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import numpy as np
@@ -19,13 +20,19 @@ from qdrant_client import QdrantClient
 
 
 def pytest_addoption(parser):
-    """Add custom command line option for watcher mode."""
+    """Add custom command line options for watcher mode and snapshots."""
     parser.addoption(
         "--watcher",
         action="store_true",
         default=False,
         help="Run tests using watcher mode instead of incremental indexing",
     )
+    parser.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Rewrite snapshot files from current output instead of comparing",
+    )
 
 
 # Import project components
@@ -657,6 +664,19 @@ def assert_valid_embedding(embedding: np.ndarray, expected_dim: int = 1536):
     assert not np.isinf(embedding).any()
 
 
+def assert_all_in(text: str, needles: Iterable[str]) -> None:
+    """Assert that every needle occurs in text, reporting all missing ones.
+
+    The needles are matched in a single regex pass; any not found that way
+    (e.g. overlapping another match) are rechecked with a plain substring test.
+    """
+    needles = set(needles)
+    pattern = re.compile("|".join(re.escape(n) for n in needles))
+    missing = needles - set(pattern.findall(text))
+    missing = {n for n in missing if n not in text}
+    assert not missing, f"missing from text: {sorted(missing)}"
+
+
 def count_python_files(path: Path) -> int:
     """Count Python files in a directory recursively."""
     return len(list(path.rglob("*.py")))
@@ -8,6 +8,7 @@ Milestone 13.1: Integration Testing
 """
 
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from unittest.mock import patch
 
@@ -112,6 +113,17 @@ def make_plan(
     )
 
 
+def make_simple_plan(
+    tasks: Iterable[Task] = (),
+    scope: str = "components",
+    summary: str = "Test implementation plan",
+) -> ImplementationPlan:
+    """Factory function for the common single-group plan."""
+    return make_plan(
+        groups=[make_task_group(scope=scope, tasks=list(tasks))], summary=summary
+    )
+
+
 def make_finding(
     rule_id: str = "PLAN.TEST_RULE",
     severity: Severity = Severity.MEDIUM,
@@ -491,6 +503,7 @@ class TestPlanModeDetectionIntegration:
 
             assert result.source == PlanModeSource.EXPLICIT_MARKER
 
+    @pytest.mark.latency
     def test_detection_performance(self, plan_mode_detector: PlanModeDetector):
         """Test detection latency is within performance target (<10ms)."""
         prompts = [
@@ -674,7 +687,7 @@ class TestGuardrailValidationIntegration:
             description="Add user authentication functionality",
             scope="components",
         )
-        plan = make_plan(groups=[make_task_group(tasks=[feature_task])])
+        plan = make_simple_plan([feature_task])
 
         context = PlanValidationContext(
             plan=plan,
@@ -705,7 +718,7 @@ class TestGuardrailValidationIntegration:
             dependencies=["TASK-001"],
             tags=["testing"],
         )
-        plan = make_plan(groups=[make_task_group(tasks=[feature_task, test_task])])
+        plan = make_simple_plan([feature_task, test_task])
 
         context = PlanValidationContext(
             plan=plan,
@@ -733,7 +746,7 @@ class TestGuardrailValidationIntegration:
             title="Implement new feature",
             description="Add new functionality",
         )
-        plan = make_plan(groups=[make_task_group(tasks=[feature_task])])
+        plan = make_simple_plan([feature_task])
 
         context = PlanValidationContext(
             plan=plan,
@@ -760,7 +773,7 @@ class TestGuardrailValidationIntegration:
             title="Implement feature",
             description="Add functionality",
         )
-        plan = make_plan(groups=[make_task_group(tasks=[feature_task])])
+        plan = make_simple_plan([feature_task])
 
         context = PlanValidationContext(
             plan=plan,
@@ -791,7 +804,7 @@ class TestGuardrailValidationIntegration:
             )
             for i in range(10)
         ]
-        plan = make_plan(groups=[make_task_group(tasks=tasks)])
+        plan = make_simple_plan(tasks)
 
         context = PlanValidationContext(
             plan=plan,
@@ -814,13 +827,7 @@ class TestAutoRevisionIntegration:
 
     def test_add_task_revision(self, auto_revision_engine: AutoRevisionEngine):
         """Test ADD_TASK revision creates new task."""
-        plan = make_plan(
-            groups=[
-                make_task_group(
-                    tasks=[make_task(task_id="TASK-001", title="Feature task")]
-                )
-            ]
-        )
+        plan = make_simple_plan([make_task(task_id="TASK-001", title="Feature task")])
 
         new_task = make_task(
             task_id="TASK-002",
@@ -851,16 +858,12 @@ class TestAutoRevisionIntegration:
 
     def test_modify_task_revision(self, auto_revision_engine: AutoRevisionEngine):
         """Test MODIFY_TASK revision updates task."""
-        plan = make_plan(
-            groups=[
-                make_task_group(
-                    tasks=[
-                        make_task(
-                            task_id="TASK-001",
-                            title="Original title",
-                            description="Original description",
-                        )
-                    ]
+        plan = make_simple_plan(
+            [
+                make_task(
+                    task_id="TASK-001",
+                    title="Original title",
+                    description="Original description",
                 )
             ]
         )
@@ -891,7 +894,7 @@ class TestAutoRevisionIntegration:
     ):
         """Test conflict detection for duplicate task IDs."""
         existing_task = make_task(task_id="TASK-001", title="Existing task")
-        plan = make_plan(groups=[make_task_group(tasks=[existing_task])])
+        plan = make_simple_plan([existing_task])
 
         # Try to add task with same ID
         duplicate_task = make_task(task_id="TASK-001", title="Duplicate task")
@@ -919,7 +922,7 @@ class TestAutoRevisionIntegration:
         """Test circular dependency detection."""
         task1 = make_task(task_id="TASK-001", title="Task 1")
         task2 = make_task(task_id="TASK-002", title="Task 2", dependencies=["TASK-001"])
-        plan = make_plan(groups=[make_task_group(tasks=[task1, task2])])
+        plan = make_simple_plan([task1, task2])
 
         # Try to add dependency from TASK-001 to TASK-002 (would create cycle)
         finding = make_finding(
@@ -943,7 +946,7 @@ class TestAutoRevisionIntegration:
         guardrail_config.max_revisions_per_plan = 2
         engine = AutoRevisionEngine(config=guardrail_config)
 
-        plan = make_plan(groups=[make_task_group(tasks=[])])
+        plan = make_simple_plan()
 
         # Create many findings
         findings = [
@@ -967,7 +970,7 @@ class TestAutoRevisionIntegration:
 
     def test_audit_trail_generation(self, auto_revision_engine: AutoRevisionEngine):
         """Test audit trail is generated correctly."""
-        plan = make_plan(groups=[make_task_group(tasks=[])])
+        plan = make_simple_plan()
 
         new_task = make_task(task_id="TASK-001", title="New task")
         finding = make_finding(
@@ -1026,9 +1029,8 @@ class TestFullPlanModeFlow:
             title="Implement AuthService class",
             description="Create authentication service",
         )
-        plan = make_plan(
-            groups=[make_task_group(tasks=[feature_task])],
-            summary="Authentication implementation plan",
+        plan = make_simple_plan(
+            [feature_task], summary="Authentication implementation plan"
         )
 
         # Step 4: Validate plan
@@ -1085,7 +1087,7 @@ class TestFullPlanModeFlow:
             title="Implement new feature",
             description="Add new functionality",
         )
-        plan = make_plan(groups=[make_task_group(tasks=[feature_task])])
+        plan = make_simple_plan([feature_task])
 
         # Validate and revise
         context = PlanValidationContext(plan=plan, config=guardrail_config)
@@ -1117,7 +1119,7 @@ class TestFullPlanModeFlow:
         engine = create_guardrail_engine(guardrail_config, discover_rules=True)
 
         task = make_task(task_id="TASK-001", title="Implement feature")
-        plan = make_plan(groups=[make_task_group(tasks=[task])])
+        plan = make_simple_plan([task])
 
         context = PlanValidationContext(plan=plan, config=guardrail_config)
         result = engine.validate(context)
@@ -1319,6 +1321,7 @@ class TestPlanQAVerification:
         assert result.has_issues()
         assert len(result.potential_duplicates) > 0
 
+    @pytest.mark.latency
     def test_plan_qa_performance(self, plan_qa_config: PlanQAConfig):
         """Test QA verification completes within performance target."""
         result = verify_plan_qa(SAMPLE_PLAN_COMPLETE, plan_qa_config)
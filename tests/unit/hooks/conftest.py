@@ -0,0 +1,16 @@
+"""Shared fixtures for hook tests."""
+
+import pytest
+
+from claude_indexer.hooks.plan_mode_detector import PlanModeDetector
+
+
+@pytest.fixture(scope="session")
+def detector() -> PlanModeDetector:
+    """Plan Mode detector with the default config, shared by read-only tests.
+
+    detect() leaves the plan context untouched. CLAUDE_PLAN_MODE is read once
+    per detector, so tests that set it, change the plan context, patch the
+    detector or use a custom threshold construct their own instance.
+    """
+    return PlanModeDetector()
@@ -0,0 +1,86 @@
+"""Shared fixtures for planning hook tests.
+
+The default generator/injector and their outputs are built once per module
+and reused by tests that only read them. Tests that need a custom config,
+project path or collection name construct their own instances.
+
+Project directories with a pre-written CLAUDE.md are created once per session;
+tests must treat them as read-only.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from claude_indexer.hooks.planning.guidelines import (
+    PlanningGuidelines,
+    PlanningGuidelinesGenerator,
+)
+from claude_indexer.hooks.planning.injector import (
+    PlanContextInjectionResult,
+    PlanContextInjector,
+)
+
+_ARCH_CLAUDE_MD = """
+## Architecture
+- Use repository pattern for data access
+- Implement dependency injection
+- Implement clean architecture
+"""
+
+_CODE_STYLE_CLAUDE_MD = """
+# Project Guidelines
+
+## Code Style
+- Use snake_case for functions
+- Use PascalCase for classes
+- Always add docstrings
+"""
+
+
+@pytest.fixture(scope="session")
+def empty_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project directory without any CLAUDE.md."""
+    return tmp_path_factory.mktemp("empty")
+
+
+@pytest.fixture(scope="session")
+def architecture_claude_md(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project directory whose CLAUDE.md lists architecture patterns."""
+    project_path = tmp_path_factory.mktemp("arch")
+    (project_path / "CLAUDE.md").write_text(_ARCH_CLAUDE_MD)
+    return project_path
+
+
+@pytest.fixture(scope="session")
+def code_style_claude_md(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project directory whose CLAUDE.md lists code style patterns."""
+    project_path = tmp_path_factory.mktemp("code_style")
+    (project_path / "CLAUDE.md").write_text(_CODE_STYLE_CLAUDE_MD)
+    return project_path
+
+
+@pytest.fixture(scope="module")
+def default_generator() -> PlanningGuidelinesGenerator:
+    """Guidelines generator with the default config."""
+    return PlanningGuidelinesGenerator(collection_name="test")
+
+
+@pytest.fixture(scope="module")
+def default_guidelines(
+    default_generator: PlanningGuidelinesGenerator,
+) -> PlanningGuidelines:
+    """Guidelines generated once with the default config."""
+    return default_generator.generate()
+
+
+@pytest.fixture(scope="module")
+def default_injector() -> PlanContextInjector:
+    """Plan context injector with the default config."""
+    return PlanContextInjector(collection_name="test")
+
+
+@pytest.fixture(scope="module")
+def default_result(default_injector: PlanContextInjector) -> PlanContextInjectionResult:
+    """Injection result for a generic planning prompt."""
+    return default_injector.inject("Create a plan")
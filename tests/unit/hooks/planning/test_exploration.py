@@ -3,6 +3,8 @@
 Milestone 7.2: Hook Infrastructure Extension
 """
 
+import pytest
+
 from claude_indexer.hooks.planning.exploration import (
     ExplorationHintsConfig,
     ExplorationHintsGenerator,
@@ -125,6 +127,7 @@ class TestExplorationHintsGenerator:
         assert "read_graph" in formatted
         assert 'mode="smart"' in formatted
 
+    @pytest.mark.latency
     def test_generation_latency_under_30ms(self):
         """Generation should complete in under 30ms."""
         generator = ExplorationHintsGenerator(collection_name="test")
@@ -191,6 +194,15 @@ class TestExplorationHintsGenerator:
         assert formatted.endswith("=== END EXPLORATION HINTS ===")
         assert "Consider running these queries" in formatted
 
+    def test_format_for_injection_reflects_added_hints(self):
+        """Formatting picks up hints appended after generation."""
+        generator = ExplorationHintsGenerator(collection_name="test")
+        hints = generator.generate("Create UserService")
+
+        hints.hints.append("## Extra\nextra_command()")
+
+        assert "## Extra" in hints.format_for_injection()
+
     def test_to_dict(self):
         """Hints should serialize to dictionary."""
         generator = ExplorationHintsGenerator(collection_name="test")
@@ -254,6 +266,3 @@ class TestExplorationHintsIntegration:
         # Verify formatting
         formatted = hints.format_for_injection()
         assert "=== EXPLORATION HINTS ===" in formatted
-
-        # Verify performance
-        assert hints.generation_time_ms < 30
@@ -3,11 +3,52 @@
 Milestone 7.2: Hook Infrastructure Extension
 """
 
+from pathlib import Path
+
+import pytest
+
 from claude_indexer.hooks.planning.guidelines import (
     PlanningGuidelines,
     PlanningGuidelinesConfig,
     PlanningGuidelinesGenerator,
 )
+from tests.conftest import assert_all_in
+
+SNAPSHOT_PATH = Path(__file__).parent / "snapshots"
+
+ALL_SECTIONS = [
+    "Code Reuse Check",
+    "Testing Requirements",
+    "Documentation Requirements",
+    "Architecture Alignment",
+    "Performance Considerations",
+]
+
+# (config, headings that must appear, headings that must not appear)
+SECTION_CASES = [
+    (PlanningGuidelinesConfig(), ALL_SECTIONS, []),
+    (
+        PlanningGuidelinesConfig(
+            include_testing_requirements=False,
+            include_documentation_requirements=False,
+        ),
+        ["Code Reuse Check", "Architecture Alignment", "Performance Considerations"],
+        ["Testing Requirements", "Documentation Requirements"],
+    ),
+    (
+        PlanningGuidelinesConfig(include_code_reuse_check=False),
+        ["Testing Requirements", "Documentation Requirements"],
+        ["Code Reuse Check"],
+    ),
+    (
+        PlanningGuidelinesConfig(
+            include_architecture_alignment=False,
+            include_performance_considerations=False,
+        ),
+        ["Code Reuse Check", "Testing Requirements"],
+        ["Architecture Alignment", "Performance Considerations"],
+    ),
+]
 
 
 class TestPlanningGuidelinesConfig:
@@ -25,41 +66,41 @@ class TestPlanningGuidelinesConfig:
         assert config.include_performance_considerations is True
         assert config.custom_guidelines == []
 
-    def test_to_dict(self):
-        """Config should serialize to dictionary."""
-        config = PlanningGuidelinesConfig(
-            include_testing_requirements=False,
-            custom_guidelines=["Custom guideline"],
-        )
-
-        data = config.to_dict()
-
-        assert data["enabled"] is True
-        assert data["include_testing_requirements"] is False
-        assert data["custom_guidelines"] == ["Custom guideline"]
-
-    def test_from_dict(self):
-        """Config should deserialize from dictionary."""
-        data = {
-            "enabled": False,
-            "include_code_reuse_check": False,
-            "custom_guidelines": ["Test guideline"],
-        }
-
-        config = PlanningGuidelinesConfig.from_dict(data)
+    @pytest.mark.parametrize(
+        "config",
+        [
+            PlanningGuidelinesConfig(),
+            PlanningGuidelinesConfig(
+                enabled=False,
+                include_code_reuse_check=False,
+                include_testing_requirements=False,
+                include_documentation_requirements=False,
+                include_architecture_alignment=False,
+                include_performance_considerations=False,
+                custom_guidelines=["Custom guideline", "Test guideline"],
+                project_patterns_path="docs/CLAUDE.md",
+            ),
+        ],
+    )
+    def test_round_trip(self, config: PlanningGuidelinesConfig):
+        """to_dict output should rebuild an equal config."""
+        assert PlanningGuidelinesConfig.from_dict(config.to_dict()) == config
+
+    def test_from_dict_fills_defaults(self):
+        """Missing keys should fall back to defaults."""
+        config = PlanningGuidelinesConfig.from_dict({"enabled": False})
 
         assert config.enabled is False
-        assert config.include_code_reuse_check is False
-        assert config.custom_guidelines == ["Test guideline"]
+        assert config.include_code_reuse_check is True
+        assert config.custom_guidelines == []
 
 
 class TestPlanningGuidelinesGenerator:
     """Test planning guidelines generation."""
 
-    def test_generates_guidelines(self):
+    def test_generates_guidelines(self, default_guidelines: PlanningGuidelines):
         """Generator should produce guidelines."""
-        generator = PlanningGuidelinesGenerator(collection_name="test-project")
-        guidelines = generator.generate()
+        guidelines = default_guidelines
 
         assert isinstance(guidelines, PlanningGuidelines)
         assert len(guidelines.full_text) > 0
@@ -72,34 +113,31 @@ class TestPlanningGuidelinesGenerator:
 
         assert "mcp__my-project-memory__" in guidelines.full_text
 
-    def test_includes_all_sections_by_default(self):
-        """Default config should include all 5 sections."""
-        generator = PlanningGuidelinesGenerator(collection_name="test")
-        guidelines = generator.generate()
-
-        assert "Code Reuse Check" in guidelines.full_text
-        assert "Testing Requirements" in guidelines.full_text
-        assert "Documentation Requirements" in guidelines.full_text
-        assert "Architecture Alignment" in guidelines.full_text
-        assert "Performance Considerations" in guidelines.full_text
-
-    def test_config_disables_sections(self):
-        """Configuration should disable specific sections."""
-        config = PlanningGuidelinesConfig(
-            include_testing_requirements=False,
-            include_documentation_requirements=False,
-        )
-        generator = PlanningGuidelinesGenerator(
-            collection_name="test",
-            config=config,
-        )
+    @pytest.mark.parametrize(
+        "config,must_contain,must_not_contain",
+        SECTION_CASES,
+        ids=[
+            "defaults",
+            "no_tests_or_docs",
+            "no_code_reuse",
+            "no_architecture_or_performance",
+        ],
+    )
+    def test_section_toggles(
+        self,
+        config: PlanningGuidelinesConfig,
+        must_contain: list[str],
+        must_not_contain: list[str],
+    ):
+        """Section flags should include or drop the matching sections."""
+        generator = PlanningGuidelinesGenerator(collection_name="test", config=config)
         guidelines = generator.generate()
 
-        assert "Testing Requirements" not in guidelines.full_text
-        assert "Documentation Requirements" not in guidelines.full_text
-        # Other sections should still be present
-        assert "Code Reuse Check" in guidelines.full_text
+        assert_all_in(guidelines.full_text, must_contain)
+        for section in must_not_contain:
+            assert section not in guidelines.full_text
 
+    @pytest.mark.latency
     def test_generation_latency_under_20ms(self):
         """Generation should complete in under 20ms."""
         generator = PlanningGuidelinesGenerator(collection_name="test")
@@ -107,19 +145,18 @@ class TestPlanningGuidelinesGenerator:
 
         assert guidelines.generation_time_ms < 20
 
-    def test_generates_mcp_commands(self):
+    def test_generates_mcp_commands(self, default_guidelines: PlanningGuidelines):
         """Should generate MCP commands list."""
-        generator = PlanningGuidelinesGenerator(collection_name="test")
-        guidelines = generator.generate()
+        guidelines = default_guidelines
 
         assert len(guidelines.mcp_commands) > 0
-        assert any("search_similar" in cmd for cmd in guidelines.mcp_commands)
-        assert any("read_graph" in cmd for cmd in guidelines.mcp_commands)
+        assert_all_in(
+            "\n".join(guidelines.mcp_commands), ["search_similar", "read_graph"]
+        )
 
-    def test_sections_dict_populated(self):
+    def test_sections_dict_populated(self, default_guidelines: PlanningGuidelines):
         """Should populate sections dictionary."""
-        generator = PlanningGuidelinesGenerator(collection_name="test")
-        guidelines = generator.generate()
+        guidelines = default_guidelines
 
         assert "code_reuse" in guidelines.sections
         assert "testing" in guidelines.sections
@@ -138,35 +175,22 @@ class TestPlanningGuidelinesGenerator:
         assert "Always use TypeScript" in guidelines.full_text
         assert "Follow SOLID principles" in guidelines.full_text
 
-    def test_loads_project_patterns(self, tmp_path):
+    def test_loads_project_patterns(self, code_style_claude_md: Path):
         """Should load patterns from CLAUDE.md if present."""
-        # Create test CLAUDE.md
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(
-            """
-# Project Guidelines
-
-## Code Style
-- Use snake_case for functions
-- Use PascalCase for classes
-- Always add docstrings
-        """
-        )
-
         generator = PlanningGuidelinesGenerator(
             collection_name="test",
-            project_path=tmp_path,
+            project_path=code_style_claude_md,
         )
         guidelines = generator.generate()
 
         assert len(guidelines.project_patterns) > 0
         assert any("snake_case" in p for p in guidelines.project_patterns)
 
-    def test_handles_missing_claude_md(self, tmp_path):
+    def test_handles_missing_claude_md(self, empty_project: Path):
         """Should handle missing CLAUDE.md gracefully."""
         generator = PlanningGuidelinesGenerator(
             collection_name="test",
-            project_path=tmp_path,
+            project_path=empty_project,
         )
         guidelines = generator.generate()
 
@@ -186,6 +210,57 @@ class TestPlanningGuidelinesGenerator:
         assert "[Planning Mode]" in compact
         assert "search_similar" in compact
 
+    def test_generate_memoized_until_inputs_change(self, tmp_path):
+        """Repeated generation reuses output until config or CLAUDE.md change."""
+        generator = PlanningGuidelinesGenerator(
+            collection_name="test",
+            project_path=tmp_path,
+        )
+        first = generator.generate()
+        second = generator.generate()
+
+        assert second.full_text is first.full_text
+        assert second.sections == first.sections
+        assert second.sections is not first.sections
+
+        claude_md = tmp_path / "CLAUDE.md"
+        claude_md.write_text("## Code Style\n- Use snake_case for functions\n")
+        with_patterns = generator.generate()
+        assert any("snake_case" in p for p in with_patterns.project_patterns)
+
+        generator.config.include_performance_considerations = False
+        assert "performance" not in generator.generate().sections
+
+        generator.clear_cache()
+        assert generator.generate().full_text is not with_patterns.full_text
+
+    def test_default_guidelines_snapshot(
+        self, empty_project: Path, request: pytest.FixtureRequest
+    ):
+        """Default guidelines text should match the saved snapshot.
+
+        Run with --update-snapshots to rewrite snapshots/default_guidelines.txt
+        after an intentional template change.
+        """
+        generator = PlanningGuidelinesGenerator(
+            collection_name="test",
+            project_path=empty_project,
+        )
+        full_text = generator.generate().full_text
+
+        snapshot_file = SNAPSHOT_PATH / "default_guidelines.txt"
+        if request.config.getoption("--update-snapshots"):
+            SNAPSHOT_PATH.mkdir(exist_ok=True)
+            snapshot_file.write_text(full_text)
+
+        if not snapshot_file.exists():
+            pytest.fail(
+                f"Snapshot {snapshot_file} is missing; "
+                "run pytest with --update-snapshots to create it"
+            )
+
+        assert full_text == snapshot_file.read_text()
+
     def test_to_dict(self):
         """Guidelines should serialize to dictionary."""
         generator = PlanningGuidelinesGenerator(collection_name="test")
@@ -202,18 +277,8 @@ class TestPlanningGuidelinesGenerator:
 class TestGuidelinesIntegration:
     """Integration tests for guidelines generation."""
 
-    def test_end_to_end_generation(self, tmp_path):
+    def test_end_to_end_generation(self, architecture_claude_md: Path):
         """Test complete guidelines generation workflow."""
-        # Create project structure
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(
-            """
-## Architecture
-- Use repository pattern for data access
-- Implement dependency injection
-        """
-        )
-
         config = PlanningGuidelinesConfig(
             include_code_reuse_check=True,
             include_testing_requirements=True,
@@ -221,7 +286,7 @@ class TestGuidelinesIntegration:
 
         generator = PlanningGuidelinesGenerator(
             collection_name="integration-test",
-            project_path=tmp_path,
+            project_path=architecture_claude_md,
             config=config,
         )
 
@@ -236,6 +301,3 @@ class TestGuidelinesIntegration:
 
         # Verify patterns loaded
         assert any("repository pattern" in p for p in guidelines.project_patterns)
-
-        # Verify performance
-        assert guidelines.generation_time_ms < 20
@@ -3,6 +3,13 @@
 Milestone 7.2: Hook Infrastructure Extension
 """
 
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from claude_indexer.hooks.plan_mode_detector import PlanModeDetector
+from claude_indexer.hooks.plan_qa import PlanQAConfig
 from claude_indexer.hooks.planning.exploration import ExplorationHintsConfig
 from claude_indexer.hooks.planning.guidelines import PlanningGuidelinesConfig
 from claude_indexer.hooks.planning.injector import (
@@ -11,6 +18,32 @@ from claude_indexer.hooks.planning.injector import (
     PlanContextInjector,
     inject_plan_context,
 )
+from tests.conftest import assert_all_in
+
+# Configs covering every top-level flag and nested config; the
+# "*_config" keys that to_dict emits are exercised by the round trip.
+CONFIG_ROUND_TRIP_CASES = [
+    PlanContextInjectionConfig(),
+    PlanContextInjectionConfig(
+        enabled=False,
+        inject_guidelines=False,
+        inject_hints=False,
+        compact_mode=True,
+        qa_enabled=False,
+    ),
+    PlanContextInjectionConfig(
+        guidelines_config=PlanningGuidelinesConfig(
+            include_code_reuse_check=False,
+            custom_guidelines=["Prefer composition"],
+            project_patterns_path="docs/CLAUDE.md",
+        ),
+        hints_config=ExplorationHintsConfig(
+            max_entity_hints=5,
+            include_duplicate_check=False,
+        ),
+        qa_config=PlanQAConfig(check_docs=False, fail_on_missing_tests=True),
+    ),
+]
 
 
 class TestPlanContextInjectionConfig:
@@ -25,19 +58,10 @@ class TestPlanContextInjectionConfig:
         assert config.inject_hints is True
         assert config.compact_mode is False
 
-    def test_to_dict(self):
-        """Config should serialize to dictionary."""
-        config = PlanContextInjectionConfig(
-            compact_mode=True,
-            inject_hints=False,
-        )
-
-        data = config.to_dict()
-
-        assert data["compact_mode"] is True
-        assert data["inject_hints"] is False
-        assert "guidelines_config" in data
-        assert "hints_config" in data
+    @pytest.mark.parametrize("config", CONFIG_ROUND_TRIP_CASES)
+    def test_round_trip(self, config: PlanContextInjectionConfig):
+        """to_dict output should rebuild an equal config."""
+        assert PlanContextInjectionConfig.from_dict(config.to_dict()) == config
 
     def test_from_dict(self):
         """Config should deserialize from dictionary."""
@@ -55,18 +79,6 @@ class TestPlanContextInjectionConfig:
         assert config.guidelines_config.include_testing_requirements is False
         assert config.hints_config.max_entity_hints == 5
 
-    def test_from_dict_alternative_keys(self):
-        """Config should handle both key formats."""
-        data = {
-            "guidelines_config": {"include_code_reuse_check": False},
-            "hints_config": {"include_duplicate_check": False},
-        }
-
-        config = PlanContextInjectionConfig.from_dict(data)
-
-        assert config.guidelines_config.include_code_reuse_check is False
-        assert config.hints_config.include_duplicate_check is False
-
 
 class TestPlanContextInjector:
     """Test plan context injection."""
@@ -80,10 +92,11 @@ class TestPlanContextInjector:
         assert result.success
         assert len(result.injected_text) > 0
 
-    def test_inject_includes_guidelines(self):
+    def test_inject_includes_guidelines(
+        self, default_result: PlanContextInjectionResult
+    ):
         """Injected text should include planning guidelines."""
-        injector = PlanContextInjector(collection_name="test")
-        result = injector.inject("Create a plan")
+        result = default_result
 
         assert "PLANNING QUALITY GUIDELINES" in result.injected_text
         assert result.guidelines is not None
@@ -141,6 +154,7 @@ class TestPlanContextInjector:
         assert len(result.injected_text) < len(normal_result.injected_text)
         assert "[Planning Mode]" in result.injected_text
 
+    @pytest.mark.latency
     def test_total_latency_under_50ms(self):
         """Total injection should complete in under 50ms."""
         injector = PlanContextInjector(collection_name="test")
@@ -155,21 +169,11 @@ class TestPlanContextInjector:
 
         assert "mcp__my-project-memory__" in result.injected_text
 
-    def test_project_path_used(self, tmp_path):
+    def test_project_path_used(self, architecture_claude_md: Path):
         """Should use project path for loading patterns."""
-        # Create CLAUDE.md in tmp_path
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(
-            """
-## Patterns
-- Use dependency injection
-- Follow SOLID principles
-        """
-        )
-
         injector = PlanContextInjector(
             collection_name="test",
-            project_path=tmp_path,
+            project_path=architecture_claude_md,
         )
         result = injector.inject("Create a plan")
 
@@ -177,12 +181,9 @@ class TestPlanContextInjector:
         assert result.guidelines is not None
         assert len(result.guidelines.project_patterns) > 0
 
-    def test_to_dict(self):
+    def test_to_dict(self, default_result: PlanContextInjectionResult):
         """Result should serialize to dictionary."""
-        injector = PlanContextInjector(collection_name="test")
-        result = injector.inject("Create a plan")
-
-        data = result.to_dict()
+        data = default_result.to_dict()
 
         assert "success" in data
         assert "injected_text_length" in data
@@ -192,17 +193,18 @@ class TestPlanContextInjector:
 
     def test_handles_errors_gracefully(self):
         """Should handle errors and set error field."""
-        # Create injector with invalid config to trigger error
-        config = PlanContextInjectionConfig()
-        config.guidelines_config = None  # This will cause an error
+        injector = PlanContextInjector(collection_name="test")
 
-        injector = PlanContextInjector(collection_name="test", config=config)
+        with patch.object(
+            injector._guidelines_generator,
+            "generate",
+            side_effect=RuntimeError("boom"),
+        ):
+            result = injector.inject("Test")
 
-        # Re-initialize with valid config but mock an error
-        # For now, just verify normal operation
-        result = injector.inject("Test")
-        # Normal operation should succeed
-        assert result.success or result.error is not None
+        assert result.success is False
+        assert result.error == "boom"
+        assert result.injected_text == ""
 
 
 class TestConvenienceFunction:
@@ -218,12 +220,12 @@ class TestConvenienceFunction:
         assert isinstance(result, PlanContextInjectionResult)
         assert result.success
 
-    def test_with_project_path(self, tmp_path):
+    def test_with_project_path(self, empty_project: Path):
         """Should accept project path."""
         result = inject_plan_context(
             prompt="Create a plan",
             collection_name="test",
-            project_path=tmp_path,
+            project_path=empty_project,
         )
 
         assert result.success
@@ -244,18 +246,8 @@ class TestConvenienceFunction:
 class TestInjectorIntegration:
     """Integration tests for plan context injector."""
 
-    def test_full_injection_flow(self, tmp_path):
+    def test_full_injection_flow(self, architecture_claude_md: Path):
         """Test complete injection workflow."""
-        # Create project structure
-        claude_md = tmp_path / "CLAUDE.md"
-        claude_md.write_text(
-            """
-## Architecture
-- Use repository pattern
-- Implement clean architecture
-        """
-        )
-
         config = PlanContextInjectionConfig(
             guidelines_config=PlanningGuidelinesConfig(
                 include_code_reuse_check=True,
@@ -269,54 +261,51 @@ class TestInjectorIntegration:
         result = inject_plan_context(
             prompt="Implement UserService and AuthController",
             collection_name="integration-test",
-            project_path=tmp_path,
+            project_path=architecture_claude_md,
             config=config,
         )
 
         # Verify success
         assert result.success
 
-        # Verify guidelines
-        assert "PLANNING QUALITY GUIDELINES" in result.injected_text
-        assert "Code Reuse Check" in result.injected_text
-        assert "Testing Requirements" in result.injected_text
-
-        # Verify hints
-        assert "EXPLORATION HINTS" in result.injected_text
+        # Verify guidelines, hints and MCP prefix
+        assert_all_in(
+            result.injected_text,
+            [
+                "PLANNING QUALITY GUIDELINES",
+                "Code Reuse Check",
+                "Testing Requirements",
+                "EXPLORATION HINTS",
+                "mcp__integration-test-memory__",
+            ],
+        )
         assert (
             "UserService" in result.injected_text
             or "AuthController" in result.injected_text
         )
 
-        # Verify MCP prefix
-        assert "mcp__integration-test-memory__" in result.injected_text
-
         # Verify patterns loaded
         assert result.guidelines is not None
         assert any(
             "repository pattern" in p for p in result.guidelines.project_patterns
         )
 
-        # Verify performance
-        assert result.total_time_ms < 50
-
-    def test_plan_mode_detection_to_injection(self):
+    def test_plan_mode_detection_to_injection(
+        self,
+        detector: PlanModeDetector,
+        default_injector: PlanContextInjector,
+    ):
         """Test flow from Plan Mode detection to context injection."""
-        from claude_indexer.hooks.plan_mode_detector import detect_plan_mode
-
         prompt = "@plan Create user authentication system"
 
         # Step 1: Detect Plan Mode
-        detection_result, plan_ctx = detect_plan_mode(prompt)
+        detection_result = detector.detect(prompt)
         assert detection_result.is_plan_mode
 
         # Step 2: Inject context
-        injection_result = inject_plan_context(
-            prompt=prompt,
-            collection_name="test-project",
-        )
+        injection_result = default_injector.inject(prompt)
 
         # Step 3: Verify injection
         assert injection_result.success
         assert "PLANNING QUALITY GUIDELINES" in injection_result.injected_text
-        assert "mcp__test-project-memory__" in injection_result.injected_text
+        assert "mcp__test-memory__" in injection_result.injected_text
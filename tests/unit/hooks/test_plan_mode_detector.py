@@ -5,21 +5,52 @@ Target: >95% detection accuracy with <10ms latency.
 Milestone 7.1: Plan Mode Detection
 """
 
+import pickle
+import re
+import statistics
 import time
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from claude_indexer.hooks.plan_mode_detector import (
+    _EXPLICIT_PATTERNS_ASCII,
+    _PLAN_HINT,
+    _PLANNING_KEYWORDS_ASCII,
+    _SCORING_PATTERNS,
+    _SCORING_PATTERNS_ASCII,
     EXPLICIT_PATTERNS,
     NON_PLANNING_INDICATORS,
     PLANNING_BOOSTERS,
     PLANNING_KEYWORDS,
     PlanModeDetectionResult,
     PlanModeDetector,
+    _find_explicit_markers,
+    _scan_planning_keywords,
     detect_plan_mode,
 )
 from claude_indexer.session.plan_context import PlanModeContext, PlanModeSource
 
+EXPLICIT_MATCHES = ("@plan", "@agent-plan", "--plan", "plan mode", "Plan Mode")
+EXPLICIT_NON_MATCHES = ("plan", "planning", "@player", "airplane")
+KEYWORD_MATCHES = (
+    "create a plan",
+    "make a plan",
+    "write a plan",
+    "design a plan",
+    "implement a plan",
+)
+BOOSTER_MATCHES = (
+    "step-by-step",
+    "phases",
+    "milestones",
+    "tasks",
+    "timeline",
+    "roadmap",
+)
+NEGATIVE_MATCHES = ("execute", "run", "apply", "start coding", "write the code")
+
 
 class TestExplicitMarkerDetection:
     """Test explicit marker detection (1.0 confidence)."""
@@ -37,9 +68,8 @@ class TestExplicitMarkerDetection:
             ("At end @plan", "@plan"),
         ],
     )
-    def test_explicit_markers_positive(self, prompt, expected_marker):
+    def test_explicit_markers_positive(self, detector, prompt, expected_marker):
         """Explicit markers trigger Plan Mode with 1.0 confidence."""
-        detector = PlanModeDetector()
         result = detector.detect(prompt)
 
         assert result.is_plan_mode is True
@@ -59,9 +89,8 @@ class TestExplicitMarkerDetection:
             "This is implanted",  # "plan" substring
         ],
     )
-    def test_explicit_markers_negative(self, prompt):
+    def test_explicit_markers_negative(self, detector, prompt):
         """Non-marker prompts should not trigger explicit detection."""
-        detector = PlanModeDetector()
         result = detector._check_explicit_markers(prompt)
 
         assert result.is_plan_mode is False
@@ -87,9 +116,8 @@ class TestPlanningKeywordDetection:
             ("Implement a plan for the database migration", 0.7),
         ],
     )
-    def test_planning_keywords_positive(self, prompt, min_confidence):
+    def test_planning_keywords_positive(self, detector, prompt, min_confidence):
         """Planning keywords trigger detection with confidence."""
-        detector = PlanModeDetector()
         result = detector.detect(prompt)
 
         assert result.is_plan_mode is True
@@ -97,10 +125,8 @@ class TestPlanningKeywordDetection:
         assert result.confidence >= min_confidence - 0.01
         assert result.source == PlanModeSource.PLANNING_KEYWORD
 
-    def test_confidence_boosted_by_indicators(self):
+    def test_confidence_boosted_by_indicators(self, detector):
         """Boosters (step-by-step, phases) should increase confidence."""
-        detector = PlanModeDetector()
-
         # Without boosters
         base_result = detector.detect("Create a plan for the feature")
         assert base_result.confidence >= 0.7
@@ -111,10 +137,8 @@ class TestPlanningKeywordDetection:
         )
         assert boosted_result.confidence > base_result.confidence
 
-    def test_confidence_reduced_by_negatives(self):
+    def test_confidence_reduced_by_negatives(self, detector):
         """Negative indicators should reduce confidence."""
-        detector = PlanModeDetector()
-
         # Planning prompt without negatives
         prompt = "Create a plan for the feature"
         base_result = detector._check_planning_keywords(prompt)
@@ -131,6 +155,56 @@ class TestPlanningKeywordDetection:
         # Either not detected or lower confidence
         assert not neg_result.is_plan_mode or neg_result.confidence < base_conf
 
+    @pytest.mark.parametrize(
+        "prompt,confidence,markers",
+        [
+            # Every occurrence boosts, not just each distinct booster word
+            (
+                "Create a plan: tasks first, then more tasks",
+                0.9,
+                ["Create a", "tasks", "tasks"],
+            ),
+            ("Create a plan step-by-step", 0.8, ["Create a", "step-by-step"]),
+            # Word boundaries, not whitespace, delimit negatives
+            ("Create a plan, re-run the tests", 0.55, []),
+        ],
+    )
+    def test_scoring_counts_occurrences_at_word_boundaries(
+        self, detector, prompt, confidence, markers
+    ):
+        """Boosters and negatives are scored per occurrence at word boundaries."""
+        result = detector._check_planning_keywords(prompt)
+
+        assert result.confidence == pytest.approx(confidence)
+        assert result.detected_markers == markers
+
+    def test_keyword_markers_keep_prompt_casing(self, detector):
+        """Scanning the lowercased prompt should not lowercase keyword markers."""
+        result = detector.detect("CREATE A Detailed PLAN with Milestones")
+
+        assert result.detected_markers == ["CREATE A  Detailed", "milestones"]
+
+    @pytest.mark.parametrize(
+        "prompt,is_plan_mode,source,confidence",
+        [
+            # Explicit marker overlaps the keyword phrase "make a plan"
+            ("make a plan mode", True, PlanModeSource.EXPLICIT_MARKER, 1.0),
+            # Booster "tasks" sits inside the keyword phrase
+            ("Create a tasks plan", True, PlanModeSource.PLANNING_KEYWORD, 0.8),
+            # Negative "implement this" overlaps the keyword phrase
+            ("implement this plan", False, None, 0.0),
+        ],
+    )
+    def test_overlapping_matches_all_count(
+        self, detector, prompt, is_plan_mode, source, confidence
+    ):
+        """Matches that overlap across pattern categories should all count."""
+        result = detector.detect(prompt)
+
+        assert result.is_plan_mode is is_plan_mode
+        assert result.source == source
+        assert result.confidence == pytest.approx(confidence)
+
     @pytest.mark.parametrize(
         "prompt",
         [
@@ -144,9 +218,8 @@ class TestPlanningKeywordDetection:
             "How does the plan work?",
         ],
     )
-    def test_non_planning_prompts(self, prompt):
+    def test_non_planning_prompts(self, detector, prompt):
         """Non-planning prompts should not trigger detection."""
-        detector = PlanModeDetector()
         result = detector.detect(prompt)
 
         assert result.is_plan_mode is False
@@ -186,6 +259,18 @@ class TestEnvironmentVariableDetection:
 
         assert result.is_plan_mode is False
 
+    def test_env_var_read_once_until_refreshed(self, monkeypatch):
+        """The env var is cached per detector until refresh_env() is called."""
+        monkeypatch.delenv("CLAUDE_PLAN_MODE", raising=False)
+        detector = PlanModeDetector()
+        assert detector._check_environment_variable().is_plan_mode is False
+
+        monkeypatch.setenv("CLAUDE_PLAN_MODE", "true")
+        assert detector._check_environment_variable().is_plan_mode is False
+
+        detector.refresh_env()
+        assert detector._check_environment_variable().is_plan_mode is True
+
 
 class TestSessionPersistence:
     """Test session state persistence."""
@@ -244,21 +329,51 @@ class TestDetectionLatency:
             "No plan indicators at all",
         ],
     )
+    @pytest.mark.latency
     def test_detection_under_10ms(self, prompt):
-        """Detection should complete in under 10ms."""
+        """Median detection latency should be under 10ms."""
         detector = PlanModeDetector()
 
-        start = time.time()
-        result = detector.detect(prompt)
-        elapsed_ms = (time.time() - start) * 1000
+        timings_ms = []
+        reported_ms = []
+        for _ in range(50):
+            # Time the pattern scans, not a hit in their per-prompt caches
+            _find_explicit_markers.cache_clear()
+            _scan_planning_keywords.cache_clear()
+            start = time.perf_counter()
+            result = detector.detect(prompt)
+            timings_ms.append((time.perf_counter() - start) * 1000)
+            reported_ms.append(result.detection_time_ms)
 
-        msg = f"Detection took {elapsed_ms:.2f}ms, expected <10ms"
-        assert elapsed_ms < 10, msg
-        assert result.detection_time_ms < 10
+        median_ms = statistics.median(timings_ms)
+        msg = f"Median detection took {median_ms:.2f}ms, expected <10ms"
+        assert median_ms < 10, msg
+        assert statistics.median(reported_ms) < 10
 
-    def test_repeated_detections_consistent(self):
-        """Multiple detections should have consistent latency."""
+    @pytest.mark.parametrize(
+        "prompt",
+        [
+            "Fix the failing test in the parser",
+            "Run the tests step by step",
+            "A very long prompt " * 100,
+        ],
+    )
+    def test_prompts_without_plan_skip_pattern_checks(self, prompt):
+        """Prompts that never mention "plan" should not run the regex checks."""
         detector = PlanModeDetector()
+
+        with (
+            patch.object(detector, "_check_explicit_markers") as explicit,
+            patch.object(detector, "_check_planning_keywords") as keywords,
+        ):
+            result = detector.detect(prompt)
+
+        assert result.is_plan_mode is False
+        explicit.assert_not_called()
+        keywords.assert_not_called()
+
+    def test_repeated_detections_consistent(self, detector):
+        """Multiple detections should have consistent latency."""
         prompt = "Create a plan for the new feature"
 
         times = []
@@ -270,6 +385,59 @@ class TestDetectionLatency:
         msg = f"Average detection time {avg_time:.2f}ms exceeds 10ms"
         assert avg_time < 10, msg
 
+    def test_repeated_detection_returns_independent_results(self, detector):
+        """Cached prompt scans should not share markers between results."""
+        prompt = "Create a detailed plan with milestones and phases"
+
+        first = detector.detect(prompt)
+        first.detected_markers.append("mutated")
+        second = detector.detect(prompt)
+
+        assert second.is_plan_mode is True
+        assert second.confidence == first.confidence
+        assert "mutated" not in second.detected_markers
+
+    def test_negative_detection_returns_independent_results(self, monkeypatch):
+        """Negative results should not share state between detections."""
+        monkeypatch.delenv("CLAUDE_PLAN_MODE", raising=False)
+        detector = PlanModeDetector()
+        prompt = "Review the existing plan"
+
+        first = detector.detect(prompt)
+        first.detected_markers.append("mutated")
+        second = detector.detect(prompt)
+
+        assert second is not first
+        assert second.is_plan_mode is False
+        assert second.detected_markers == []
+        assert second.reasoning == "No Plan Mode indicators detected"
+
+
+class TestDetectMany:
+    """Test batch detection across several prompts."""
+
+    def test_matches_individual_detection(self, detector):
+        """detect_many should return the same outcome as detect() per prompt."""
+        prompts = [
+            "@plan Create the feature",
+            "Fix the bug in UserService",
+            "Create a detailed plan with milestones and phases",
+            "Review the existing plan",
+        ]
+
+        results = detector.detect_many(prompts)
+
+        for prompt, result in zip(prompts, results, strict=True):
+            expected = detector.detect(prompt)
+            assert result.is_plan_mode is expected.is_plan_mode
+            assert result.source == expected.source
+            assert result.confidence == expected.confidence
+            assert result.detected_markers == expected.detected_markers
+
+    def test_empty_input(self, detector):
+        """No prompts should yield no results."""
+        assert detector.detect_many([]) == []
+
 
 class TestAccuracyBenchmark:
     """Benchmark test for >95% accuracy target."""
@@ -311,64 +479,52 @@ class TestAccuracyBenchmark:
         "What files need changes?",
     ]
 
-    def test_accuracy_above_95_percent(self):
-        """Overall accuracy should be above 95%."""
-        detector = PlanModeDetector()
+    # Clearly non-plan prompts that must never be detected
+    COMMON_PROMPTS = [
+        "How do I fix this error?",
+        "What does this function do?",
+        "Refactor the code",
+        "Add logging to the service",
+        "Update the documentation",
+        "Run the test suite",
+        "Create a new file",
+        "Delete this function",
+        "Move this code",
+    ]
 
-        # Test true positives
-        tp_correct = 0
-        tp_results = []
-        for prompt in self.TRUE_POSITIVES:
-            result = detector.detect(prompt)
-            if result.is_plan_mode:
-                tp_correct += 1
-            tp_results.append((prompt, result.is_plan_mode))
-
-        # Test true negatives
-        tn_correct = 0
-        tn_results = []
-        for prompt in self.TRUE_NEGATIVES:
-            result = detector.detect(prompt)
-            if not result.is_plan_mode:
-                tn_correct += 1
-            tn_results.append((prompt, result.is_plan_mode))
+    def test_accuracy_above_95_percent(self, detector: PlanModeDetector):
+        """Overall accuracy should be above 95%."""
+        tp = np.fromiter(
+            (r.is_plan_mode for r in detector.detect_many(self.TRUE_POSITIVES)),
+            dtype=bool,
+            count=len(self.TRUE_POSITIVES),
+        )
+        tn = np.fromiter(
+            (not r.is_plan_mode for r in detector.detect_many(self.TRUE_NEGATIVES)),
+            dtype=bool,
+            count=len(self.TRUE_NEGATIVES),
+        )
 
-        total = len(self.TRUE_POSITIVES) + len(self.TRUE_NEGATIVES)
-        correct = tp_correct + tn_correct
-        accuracy = correct / total
+        accuracy = (tp.sum() + tn.sum()) / (tp.size + tn.size)
 
         # Debug output for failures
         if accuracy < 0.95:
-            print("\nTrue Positive Results:")
-            for prompt, detected in tp_results:
-                status = "OK" if detected else "MISS"
-                print(f"  [{status}] {prompt}")
-            print("\nTrue Negative Results:")
-            for prompt, detected in tn_results:
-                status = "OK" if not detected else "FP"
-                print(f"  [{status}] {prompt}")
+            print("\nMissed true positives:")
+            for prompt in np.asarray(self.TRUE_POSITIVES)[~tp]:
+                print(f"  [MISS] {prompt}")
+            print("\nFalse positives:")
+            for prompt in np.asarray(self.TRUE_NEGATIVES)[~tn]:
+                print(f"  [FP] {prompt}")
 
         assert accuracy >= 0.95, f"Accuracy {accuracy:.1%} below 95% target"
 
-    def test_zero_false_positives_on_common_prompts(self):
+    @pytest.mark.parametrize("prompt", COMMON_PROMPTS)
+    def test_zero_false_positives_on_common_prompts(
+        self, detector: PlanModeDetector, prompt: str
+    ):
         """Zero false positives on clearly non-plan prompts."""
-        detector = PlanModeDetector()
-
-        common_prompts = [
-            "How do I fix this error?",
-            "What does this function do?",
-            "Refactor the code",
-            "Add logging to the service",
-            "Update the documentation",
-            "Run the test suite",
-            "Create a new file",
-            "Delete this function",
-            "Move this code",
-        ]
-
-        for prompt in common_prompts:
-            result = detector.detect(prompt)
-            assert not result.is_plan_mode, f"False positive: '{prompt}'"
+        result = detector.detect(prompt)
+        assert not result.is_plan_mode, f"False positive: '{prompt}'"
 
 
 class TestConvenienceFunction:
@@ -432,6 +588,22 @@ class TestDetectionResultSerialization:
         assert data["is_plan_mode"] is False
         assert data["source"] is None
 
+    def test_slotted_result_and_context_pickle(self):
+        """Slotted result and context should round-trip through pickle."""
+        result = PlanModeDetectionResult(
+            is_plan_mode=True,
+            confidence=1.0,
+            source=PlanModeSource.EXPLICIT_MARKER,
+            detected_markers=["@plan"],
+        )
+        context = PlanModeContext()
+        context.activate(PlanModeSource.EXPLICIT_MARKER, 1.0, ["@plan"], "s-1")
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(context, "__dict__")
+        assert pickle.loads(pickle.dumps(result)).to_dict() == result.to_dict()
+        assert pickle.loads(pickle.dumps(context)) == context
+
 
 class TestDetectorConfiguration:
     """Test detector configuration options."""
@@ -457,50 +629,94 @@ class TestDetectorConfiguration:
 class TestRegexPatterns:
     """Test the pre-compiled regex patterns directly."""
 
-    def test_explicit_patterns(self):
+    @pytest.mark.parametrize("text", EXPLICIT_MATCHES)
+    def test_explicit_patterns(self, text):
         """Verify explicit patterns match expected strings."""
-        matches = ["@plan", "@agent-plan", "--plan", "plan mode", "Plan Mode"]
-        non_matches = ["plan", "planning", "@player", "airplane"]
-
-        for text in matches:
-            assert EXPLICIT_PATTERNS.search(text), f"Should match: {text}"
+        assert EXPLICIT_PATTERNS.search(text), f"Should match: {text}"
 
-        for _text in non_matches:
-            # These might match partially; the test is that full words don't
-            # For "plan" and "planning", they shouldn't match because we use \b
-            pass  # Explicit pattern requires @, --, or "mode"
+    @pytest.mark.parametrize("text", EXPLICIT_NON_MATCHES)
+    def test_explicit_patterns_reject_bare_words(self, text):
+        """Explicit pattern requires @, --, or "mode" around "plan"."""
+        assert not EXPLICIT_PATTERNS.search(text), f"Should not match: {text}"
 
-    def test_planning_keywords_pattern(self):
+    @pytest.mark.parametrize("text", KEYWORD_MATCHES)
+    def test_planning_keywords_pattern(self, text):
         """Verify planning keywords pattern matches."""
-        matches = [
-            "create a plan",
-            "make a plan",
-            "write a plan",
-            "design a plan",
-            "implement a plan",
+        assert PLANNING_KEYWORDS.search(text), f"Should match: {text}"
+
+    @pytest.mark.parametrize("text", BOOSTER_MATCHES)
+    def test_booster_patterns(self, text):
+        """Verify booster patterns match."""
+        assert PLANNING_BOOSTERS.search(text), f"Should match: {text}"
+
+    @pytest.mark.parametrize("text", NEGATIVE_MATCHES)
+    def test_negative_patterns(self, text):
+        """Verify negative indicator patterns match."""
+        assert NON_PLANNING_INDICATORS.search(text), f"Should match: {text}"
+
+    def test_plan_hint_covers_explicit_and_keyword_patterns(self):
+        """Anything the explicit or keyword patterns match must contain "plan"."""
+        samples = [
+            "@agent-plan",
+            "--PLAN",
+            "Plan  Mode",
+            "Draft a detailed migration PLAN",
+            "formulate the plan",
         ]
 
-        for text in matches:
-            assert PLANNING_KEYWORDS.search(text), f"Should match: {text}"
+        for text in samples:
+            match = EXPLICIT_PATTERNS.search(text) or PLANNING_KEYWORDS.search(text)
+            assert match, f"Should match: {text}"
+            assert _PLAN_HINT in match.group().lower(), f"Hint missed: {text}"
 
-    def test_booster_patterns(self):
-        """Verify booster patterns match."""
-        matches = [
-            "step-by-step",
-            "phases",
-            "milestones",
-            "tasks",
-            "timeline",
-            "roadmap",
+    @pytest.mark.parametrize(
+        "prompt,markers",
+        [
+            ("@agent-plan and @PLAN", ("@agent-plan", "@plan")),
+            ("run with --plan", ("--plan",)),
+            ("switch to Plan\tMode", ("plan\tmode",)),
+            ("planmode on", ("planmode",)),
+            ("plan the @mention feature", ()),
+            ("a plan with no markers", ()),
+        ],
+    )
+    def test_explicit_marker_prefilter(self, prompt, markers):
+        """The substring prefilter should not change which markers are found."""
+        assert _find_explicit_markers(prompt, prompt.lower()) == markers
+
+    def test_scoring_patterns_label_boosters_and_negatives(self):
+        """Fused scoring pattern should tag each match with its category."""
+        text = "Run the roadmap step by step, then execute the tasks"
+
+        labels = [m.lastgroup for m in _SCORING_PATTERNS.finditer(text)]
+
+        assert labels == ["negative", "booster", "booster", "negative", "booster"]
+
+    def test_ascii_variants_match_like_unicode_patterns(self):
+        """ASCII twins on lowercased ASCII prompts should match the same spans."""
+        pairs = [
+            (EXPLICIT_PATTERNS, _EXPLICIT_PATTERNS_ASCII),
+            (PLANNING_KEYWORDS, _PLANNING_KEYWORDS_ASCII),
+            (_SCORING_PATTERNS, _SCORING_PATTERNS_ASCII),
+        ]
+        samples = [
+            "@agent-plan --PLAN plan mode",
+            "Create a detailed implementation plan with milestones",
+            "Run the roadmap step by step, then execute the tasks",
+            "fix the bug in UserService",
         ]
 
-        for text in matches:
-            assert PLANNING_BOOSTERS.search(text), f"Should match: {text}"
+        for unicode_pattern, ascii_pattern in pairs:
+            assert ascii_pattern.flags & re.ASCII
+            assert not ascii_pattern.flags & re.IGNORECASE
+            for text in samples:
+                expected = [m.span() for m in unicode_pattern.finditer(text)]
+                actual = [m.span() for m in ascii_pattern.finditer(text.lower())]
+                assert actual == expected, text
 
-    def test_negative_patterns(self):
-        """Verify negative indicator patterns match."""
-        matches = ["execute", "run", "apply", "start coding", "write the code"]
+    def test_non_ascii_prompt_uses_unicode_patterns(self, detector):
+        """Accented words should still count as words between verb and "plan"."""
+        result = detector.detect("Create a migration café plan")
 
-        for text in matches:
-            msg = f"Should match: {text}"
-            assert NON_PLANNING_INDICATORS.search(text), msg
+        assert result.is_plan_mode
+        assert any("café" in marker for marker in result.detected_markers)
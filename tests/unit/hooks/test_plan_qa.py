@@ -5,6 +5,8 @@ Tests that the verifier correctly detects quality issues in plan text.
 Milestone 12.1: Plan QA Verifier
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from claude_indexer.hooks.plan_qa import (
@@ -14,6 +16,68 @@ from claude_indexer.hooks.plan_qa import (
     verify_plan_qa,
 )
 
+CODE_CHANGE_PLANS = (
+    "1. Implement user authentication function",
+    "2. Create a new UserService class",
+    "3. Add validation component",
+    "4. Build API endpoint for users",
+    "5. Write handler method for login",
+    "6. Develop the payment module",
+    "7. Modify the existing controller",
+    "8. Update the schema logic",
+)
+
+TESTED_PLANS = (
+    "1. Implement auth\n2. Add unit tests for auth",
+    "1. Create service\n2. Write pytest tests",
+    "1. Build component\n2. Add integration tests",
+    "1. Implement feature\n2. Create test suite",
+    "1. Add endpoint\n2. Include tests for endpoint",
+    "1. Modify handler\n2. Testing for the handler changes",
+    "1. Build module\n2. Verify with tests",
+)
+
+USER_FACING_PLANS = (
+    "1. Add new CLI command for users",
+    "2. Create public API endpoint",
+    "3. Update user-facing dashboard",
+    "4. Add config option for timeout",
+    "5. Build new frontend page",
+    "6. Create customer interface",
+)
+
+DOCUMENTED_PLANS = (
+    "1. Add API endpoint\n2. Update API documentation",
+    "1. Create CLI command\n2. Add README section",
+    "1. Build frontend page\n2. Update the docs",
+    "1. Add config option\n2. Document the new setting",
+    "1. Create interface\n2. Write documentation for users",
+)
+
+REUSE_CHECKED_PLANS = (
+    "1. Create service\n(Verified no existing implementation)",
+    "1. Add handler (checked for duplicate code)",
+    "1. Extend existing AuthService",
+    "1. Use search_similar to find patterns\n2. Create handler",
+    "1. Checked for similar code\n2. Implement new module",
+    "1. Will extend existing user module",
+    "1. Based on existing patterns\n2. Add new component",
+    "1. Confirmed no existing solution\n2. Build service",
+    "1. Reuse existing utility\n2. Create wrapper",
+)
+
+LARGE_PLAN = "\n".join(f"{i}. Task {i}: Implement feature {i}" for i in range(100))
+
+
+@pytest.fixture(scope="module")
+def verifier() -> PlanQAVerifier:
+    """Verifier with the default config, shared by the module's tests.
+
+    verify_plan() keeps no state between calls; tests that need a custom
+    config construct their own verifier.
+    """
+    return PlanQAVerifier()
+
 
 class TestPlanQAResult:
     """Test PlanQAResult dataclass."""
@@ -182,48 +246,20 @@ class TestPlanQAConfig:
 class TestMissingTestDetection:
     """Test detection of missing test tasks."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
-    @pytest.mark.parametrize(
-        "plan_text",
-        [
-            "1. Implement user authentication function",
-            "2. Create a new UserService class",
-            "3. Add validation component",
-            "4. Build API endpoint for users",
-            "5. Write handler method for login",
-            "6. Develop the payment module",
-            "7. Modify the existing controller",
-            "8. Update the schema logic",
-        ],
-    )
-    def test_detects_code_changes_without_tests(self, verifier, plan_text):
+    def test_detects_code_changes_without_tests(self, verifier):
         """Code changes without tests are detected."""
-        result = verifier.verify_plan(plan_text)
+        for plan_text in CODE_CHANGE_PLANS:
+            result = verifier.verify_plan(plan_text)
 
-        assert len(result.missing_tests) > 0
-        assert "no test tasks" in result.missing_tests[0].lower()
+            assert len(result.missing_tests) > 0, plan_text
+            assert "no test tasks" in result.missing_tests[0].lower(), plan_text
 
-    @pytest.mark.parametrize(
-        "plan_text",
-        [
-            "1. Implement auth\n2. Add unit tests for auth",
-            "1. Create service\n2. Write pytest tests",
-            "1. Build component\n2. Add integration tests",
-            "1. Implement feature\n2. Create test suite",
-            "1. Add endpoint\n2. Include tests for endpoint",
-            "1. Modify handler\n2. Testing for the handler changes",
-            "1. Build module\n2. Verify with tests",
-        ],
-    )
-    def test_passes_with_test_tasks(self, verifier, plan_text):
+    def test_passes_with_test_tasks(self, verifier):
         """Plans with test tasks pass."""
-        result = verifier.verify_plan(plan_text)
+        for plan_text in TESTED_PLANS:
+            result = verifier.verify_plan(plan_text)
 
-        assert len(result.missing_tests) == 0
+            assert len(result.missing_tests) == 0, plan_text
 
     def test_no_code_changes_no_test_requirement(self, verifier):
         """Plans without code changes don't require tests."""
@@ -236,44 +272,29 @@ class TestMissingTestDetection:
 class TestMissingDocDetection:
     """Test detection of missing documentation tasks."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
-    @pytest.mark.parametrize(
-        "plan_text",
-        [
-            "1. Add new CLI command for users",
-            "2. Create public API endpoint",
-            "3. Update user-facing dashboard",
-            "4. Add config option for timeout",
-            "5. Build new frontend page",
-            "6. Create customer interface",
-        ],
-    )
-    def test_detects_user_facing_without_docs(self, verifier, plan_text):
+    def test_detects_user_facing_without_docs(self, verifier):
         """User-facing changes without docs are detected."""
-        result = verifier.verify_plan(plan_text)
+        for plan_text in USER_FACING_PLANS:
+            result = verifier.verify_plan(plan_text)
 
-        assert len(result.missing_docs) > 0
-        assert "documentation" in result.missing_docs[0].lower()
+            assert len(result.missing_docs) > 0, plan_text
+            assert "documentation" in result.missing_docs[0].lower(), plan_text
 
-    @pytest.mark.parametrize(
-        "plan_text",
-        [
-            "1. Add API endpoint\n2. Update API documentation",
-            "1. Create CLI command\n2. Add README section",
-            "1. Build frontend page\n2. Update the docs",
-            "1. Add config option\n2. Document the new setting",
-            "1. Create interface\n2. Write documentation for users",
-        ],
-    )
-    def test_passes_with_doc_tasks(self, verifier, plan_text):
+    def test_passes_with_doc_tasks(self, verifier):
         """Plans with doc tasks pass."""
+        for plan_text in DOCUMENTED_PLANS:
+            result = verifier.verify_plan(plan_text)
+
+            assert len(result.missing_docs) == 0, plan_text
+
+    def test_user_facing_text_inside_code_change(self, verifier):
+        """User-facing words are detected even inside a code-change phrase."""
+        plan_text = "1. Create public API endpoint\n2. Add unit tests"
         result = verifier.verify_plan(plan_text)
 
-        assert len(result.missing_docs) == 0
+        assert result.missing_tests == []
+        assert len(result.missing_docs) == 1
+        assert len(result.potential_duplicates) == 1
 
     def test_internal_changes_no_doc_requirement(self, verifier):
         """Internal changes don't require docs."""
@@ -286,11 +307,6 @@ class TestMissingDocDetection:
 class TestDuplicateVerification:
     """Test detection of duplicate verification."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
     def test_detects_new_code_without_check(self, verifier):
         """New code without duplicate check is flagged."""
         plan_text = "1. Create new AuthService class"
@@ -299,35 +315,17 @@ class TestDuplicateVerification:
         assert len(result.potential_duplicates) > 0
         assert "duplicate" in result.potential_duplicates[0].lower()
 
-    @pytest.mark.parametrize(
-        "plan_text",
-        [
-            "1. Create service\n(Verified no existing implementation)",
-            "1. Add handler (checked for duplicate code)",
-            "1. Extend existing AuthService",
-            "1. Use search_similar to find patterns\n2. Create handler",
-            "1. Checked for similar code\n2. Implement new module",
-            "1. Will extend existing user module",
-            "1. Based on existing patterns\n2. Add new component",
-            "1. Confirmed no existing solution\n2. Build service",
-            "1. Reuse existing utility\n2. Create wrapper",
-        ],
-    )
-    def test_passes_with_reuse_check(self, verifier, plan_text):
+    def test_passes_with_reuse_check(self, verifier):
         """Plans mentioning reuse check pass."""
-        result = verifier.verify_plan(plan_text)
+        for plan_text in REUSE_CHECKED_PLANS:
+            result = verifier.verify_plan(plan_text)
 
-        assert len(result.potential_duplicates) == 0
+            assert len(result.potential_duplicates) == 0, plan_text
 
 
 class TestArchitectureChecks:
     """Test detection of architecture concerns."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
     @pytest.mark.parametrize(
         "plan_text,expected_concern",
         [
@@ -337,6 +335,7 @@ class TestArchitectureChecks:
             ("Store unbounded array of results", "unbounded"),
             ("Watch for N+1 query issues", "N+1"),
         ],
+        ids=["quadratic", "nested-loop", "sync-http", "unbounded", "n-plus-one"],
     )
     def test_detects_architecture_concerns(self, verifier, plan_text, expected_concern):
         """Architecture concerns are detected."""
@@ -356,6 +355,11 @@ class TestArchitectureChecks:
         result = verifier.verify_plan(plan_text)
 
         assert len(result.architecture_warnings) <= 3
+        assert result.architecture_warnings == [
+            "Performance concern detected: nested loop",
+            "Performance concern detected: O(n^2)",
+            "Performance concern detected: synchronous HTTP",
+        ]
 
 
 class TestConfiguration:
@@ -431,11 +435,6 @@ class TestConfiguration:
 class TestSuggestions:
     """Test suggestion generation."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
     def test_suggests_test_task(self, verifier):
         """Suggests adding test task when missing."""
         result = verifier.verify_plan("Create new service class")
@@ -458,27 +457,57 @@ class TestSuggestions:
 class TestPerformance:
     """Test performance requirements."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
+    @pytest.mark.latency
     def test_verification_under_50ms(self, verifier):
         """Verification completes in <50ms."""
-        # Large plan text
-        plan_text = "\n".join(
-            [f"{i}. Task {i}: Implement feature {i}" for i in range(100)]
-        )
-        result = verifier.verify_plan(plan_text)
+        verifier.verify_plan(LARGE_PLAN)  # warm up before the timed run
+        result = verifier.verify_plan(LARGE_PLAN)
 
         assert result.verification_time_ms < 50
 
+    def test_verify_plan_leaves_verifier_unchanged(self, verifier):
+        """Repeated verification neither mutates the verifier nor drifts."""
+        config_before = verifier.config.to_dict()
+        plan_text = "Create a new UserService class with nested loops"
+
+        first = verifier.verify_plan(plan_text).to_dict()
+        second = verifier.verify_plan(plan_text).to_dict()
+        first.pop("verification_time_ms")
+        second.pop("verification_time_ms")
+
+        assert verifier.config.to_dict() == config_before
+        assert first == second
+
     def test_verification_time_tracked(self, verifier):
         """Verification time is recorded."""
         result = verifier.verify_plan("Create a function")
 
         assert result.verification_time_ms > 0
 
+    def test_code_change_scan_runs_once(self, verifier):
+        """Code-change detection is shared by the test and duplicate checks."""
+        with patch.object(
+            verifier, "_needs_tests", wraps=verifier._needs_tests
+        ) as needs_tests:
+            result = verifier.verify_plan("Create a new service class")
+
+        assert needs_tests.call_count == 1
+        assert result.missing_tests
+        assert result.potential_duplicates
+
+    def test_follow_up_scans_skipped_without_trigger(self, verifier):
+        """Task scans are skipped when nothing in the plan requires them."""
+        with (
+            patch.object(verifier, "_has_test_tasks") as has_test_tasks,
+            patch.object(verifier, "_has_doc_tasks") as has_doc_tasks,
+            patch.object(verifier, "_mentions_reuse_check") as mentions_reuse,
+        ):
+            verifier.verify_plan("Rename a variable")
+
+        has_test_tasks.assert_not_called()
+        has_doc_tasks.assert_not_called()
+        mentions_reuse.assert_not_called()
+
 
 class TestConvenienceFunction:
     """Test the convenience function."""
@@ -512,11 +541,6 @@ class TestConvenienceFunction:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    @pytest.fixture
-    def verifier(self):
-        """Create verifier instance."""
-        return PlanQAVerifier()
-
     def test_empty_plan(self, verifier):
         """Empty plan has no issues."""
         result = verifier.verify_plan("")
@@ -533,13 +557,8 @@ class TestEdgeCases:
 
     def test_case_insensitive_detection(self, verifier):
         """Detection is case insensitive."""
-        result1 = verifier.verify_plan("CREATE FUNCTION")
-        result2 = verifier.verify_plan("create function")
-        result3 = verifier.verify_plan("Create Function")
-
-        assert result1.has_issues()
-        assert result2.has_issues()
-        assert result3.has_issues()
+        for plan_text in ("CREATE FUNCTION", "create function", "Create Function"):
+            assert verifier.verify_plan(plan_text).has_issues(), plan_text
 
     def test_multiline_plan(self, verifier):
         """Multiline plan is processed correctly."""
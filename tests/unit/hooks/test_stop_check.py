@@ -716,3 +716,23 @@ def get_user(user_id):
         # May or may not block depending on rules loaded
         # But should complete without crashing
         assert exit_code in [0, 1, 2]
+
+
+class TestPackageExports:
+    """Tests for lazily imported hooks package exports."""
+
+    def test_lazy_exports_resolve(self):
+        """Test every public name is reachable from the package."""
+        import claude_indexer.hooks as hooks
+
+        for name in hooks.__all__:
+            assert getattr(hooks, name) is not None
+        assert hooks.StopCheckExecutor is StopCheckExecutor
+        assert hooks.format_stop_findings_for_display is format_findings_for_display
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError."""
+        import claude_indexer.hooks as hooks
+
+        with pytest.raises(AttributeError):
+            hooks.DoesNotExist  # noqa: B018
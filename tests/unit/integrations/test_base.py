@@ -1,9 +1,9 @@
 """Tests for integration base client (Milestone 8.3)."""
 
-import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+import requests
 
 from claude_indexer.integrations.base import IntegrationClient
 from claude_indexer.integrations.models import (
@@ -13,11 +13,70 @@ from claude_indexer.integrations.models import (
 )
 
 
+class FakeClock:
+    """Deterministic clock whose sleep advances time instead of blocking."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def time(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class CountingCall:
+    """Callable that counts calls and plays back scripted outcomes.
+
+    Each call consumes the next outcome, repeating the last one once the
+    script runs out. Exception instances are raised, anything else returned.
+    """
+
+    __slots__ = ("call_count", "_outcomes")
+
+    def __init__(self, *outcomes: object):
+        self.call_count = 0
+        self._outcomes = outcomes
+
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        outcome = self._outcomes[min(self.call_count, len(self._outcomes) - 1)]
+        self.call_count += 1
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def http_error(status_code: int, message: str = "") -> requests.HTTPError:
+    """Build an HTTPError carrying a response with the given status."""
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(message or f"{status_code} error", response=response)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Fresh fake clock for rate limiting and retry tests."""
+    return FakeClock()
+
+
 class ConcreteClient(IntegrationClient):
     """Concrete implementation for testing abstract base class."""
 
-    def __init__(self, api_key: str = "test-key", requests_per_minute: int = 60):
-        super().__init__(api_key, requests_per_minute=requests_per_minute)
+    def __init__(
+        self,
+        api_key: str = "test-key",
+        requests_per_minute: int = 60,
+        clock: FakeClock | None = None,
+        **kwargs,
+    ):
+        if clock:
+            kwargs.update(time_source=clock.time, sleep=clock.sleep)
+        super().__init__(api_key, requests_per_minute=requests_per_minute, **kwargs)
         self.call_count = 0
 
     @property
@@ -87,93 +146,128 @@ class TestRateLimiting:
         client._record_request()
         assert len(client._request_times) == initial_count + 1
 
-    def test_rate_limit_cleanup_old_timestamps(self):
+    def test_record_request_uses_time_source(self, clock):
+        """Recorded timestamps come from the injected clock."""
+        client = ConcreteClient(clock=clock)
+        client._record_request()
+        assert list(client._request_times) == [clock.now]
+
+    def test_rate_limit_cleanup_old_timestamps(self, clock):
         """Test that old timestamps are cleaned up."""
-        client = ConcreteClient(requests_per_minute=60)
+        client = ConcreteClient(requests_per_minute=60, clock=clock)
         # Add old timestamps (more than 60 seconds ago)
-        old_time = time.time() - 120
-        client._request_times = [old_time] * 10
+        client._request_times.extend([clock.now - 120] * 10)
         # Calling _check_rate_limits cleans up old entries
         client._check_rate_limits()
         # Old timestamps should be removed
         assert len(client._request_times) == 0
+        assert clock.sleeps == []
+
+    def test_rate_limit_cleanup_keeps_recent_timestamps(self, clock):
+        """Only timestamps that left the one-minute window are dropped."""
+        client = ConcreteClient(requests_per_minute=60, clock=clock)
+        client._request_times.extend([clock.now - 90, clock.now - 60, clock.now - 59])
+        client._check_rate_limits()
+        assert list(client._request_times) == [clock.now - 59]
 
-    def test_rate_limit_blocks_when_exceeded(self):
+    def test_rate_limit_blocks_when_exceeded(self, clock):
         """Test that rate limit causes blocking when exceeded."""
-        client = ConcreteClient(requests_per_minute=5)
+        client = ConcreteClient(requests_per_minute=5, clock=clock)
         # Fill up the rate limit
-        now = time.time()
-        client._request_times = [now] * 5
-        # This should cause a sleep rather than raise
-        # Let's mock sleep to verify it's called
-        with patch("time.sleep") as mock_sleep:
-            client._check_rate_limits()
-            # Should have called sleep since we're at the limit
-            mock_sleep.assert_called()
+        client._request_times.extend([clock.now] * 5)
+        # This should sleep until the oldest request leaves the window
+        client._check_rate_limits()
+        assert clock.sleeps == [61]
 
 
 class TestRetryLogic:
     """Test retry and backoff logic."""
 
-    def test_calculate_delay_base(self):
+    @pytest.fixture(scope="class")
+    def client(self) -> ConcreteClient:
+        """Client shared by the class; these tests never touch its state."""
+        return ConcreteClient()
+
+    def test_calculate_delay_base(self, client):
         """Test base delay calculation."""
-        client = ConcreteClient()
         delay = client._calculate_delay(attempt=0)
         assert delay >= 1.0  # Base delay
         assert delay <= 1.5  # Base + jitter (max 30%)
 
     def test_calculate_delay_exponential(self):
         """Test exponential backoff."""
-        client = ConcreteClient()
-        # Mock random to get consistent results
-        with patch("random.uniform", return_value=0.2):
-            delay_0 = client._calculate_delay(attempt=0)
-            delay_1 = client._calculate_delay(attempt=1)
-            delay_2 = client._calculate_delay(attempt=2)
-        # Each delay should be roughly double
-        assert delay_1 > delay_0
-        assert delay_2 > delay_1
-
-    def test_calculate_delay_max_cap(self):
+        # Fixed jitter to get consistent results
+        client = ConcreteClient(jitter=lambda low, high: 0.2)
+        delay_0 = client._calculate_delay(attempt=0)
+        delay_1 = client._calculate_delay(attempt=1)
+        delay_2 = client._calculate_delay(attempt=2)
+        # Each delay should double
+        assert delay_0 == pytest.approx(1.2)
+        assert delay_1 == pytest.approx(2.4)
+        assert delay_2 == pytest.approx(4.8)
+
+    def test_calculate_delay_max_cap(self, client):
         """Test delay is capped at maximum."""
-        client = ConcreteClient()
         delay = client._calculate_delay(attempt=10)
         # max_delay (30) + max jitter (30% of 30 = 9)
         assert delay <= 40
 
-    def test_should_retry_rate_limit_error(self):
+    def test_should_retry_rate_limit_error(self, client):
         """Test that rate limit errors trigger retry."""
-        client = ConcreteClient()
         error = Exception("rate limit exceeded")
         assert client._should_retry(error, attempt=0)
 
-    def test_should_retry_timeout_error(self):
+    def test_should_retry_timeout_error(self, client):
         """Test that timeout errors trigger retry."""
-        client = ConcreteClient()
         error = Exception("connection timeout")
         assert client._should_retry(error, attempt=0)
 
-    def test_should_retry_server_error(self):
+    def test_should_retry_server_error(self, client):
         """Test that 5xx errors trigger retry."""
-        client = ConcreteClient()
         error = Exception("500 Internal Server Error")
         assert client._should_retry(error, attempt=0)
 
-    def test_should_not_retry_auth_error(self):
+    def test_should_not_retry_auth_error(self, client):
         """Test that auth errors do not trigger retry."""
-        client = ConcreteClient()
         error = Exception("401 Unauthorized")
         assert not client._should_retry(error, attempt=0)
 
-    def test_should_not_retry_not_found(self):
+    def test_should_not_retry_not_found(self, client):
         """Test that 404 errors do not trigger retry."""
-        client = ConcreteClient()
         error = Exception("404 Not Found")
         assert not client._should_retry(error, attempt=0)
 
-    def test_should_not_retry_max_attempts(self):
+    @pytest.mark.parametrize(
+        "error,expected",
+        [
+            (TimeoutError("read"), True),
+            (ConnectionError("reset"), True),
+            (requests.ConnectTimeout("connect"), True),
+            (requests.ConnectionError("refused"), True),
+            (http_error(503), True),
+            (http_error(429), True),
+            (http_error(401, "500 errors upstream"), False),
+            (http_error(404), False),
+            (requests.HTTPError("GraphQL error: rate limit"), True),
+        ],
+        ids=[
+            "timeout",
+            "connection",
+            "requests-timeout",
+            "requests-connection",
+            "http-503",
+            "http-429",
+            "http-401-status-wins",
+            "http-404",
+            "http-without-response",
+        ],
+    )
+    def test_should_retry_dispatches_on_type_and_status(self, client, error, expected):
+        """Typed errors and HTTP status codes decide before the message scan."""
+        assert client._should_retry(error, attempt=0) is expected
+
+    def test_should_not_retry_max_attempts(self, client):
         """Test that max attempts stops retry."""
-        client = ConcreteClient()
         error = Exception("rate limit exceeded")
         # max_retries defaults to 3, so attempt=3 should stop
         assert not client._should_retry(error, attempt=3)
@@ -182,44 +276,46 @@ class TestRetryLogic:
 class TestExecuteWithRetry:
     """Test execute_with_retry wrapper."""
 
-    def test_successful_execution(self):
+    @pytest.fixture
+    def client(self, clock):
+        """Client on the fake clock with a fixed 0.01s retry delay."""
+        client = ConcreteClient(clock=clock)
+        with patch.object(client, "_calculate_delay", return_value=0.01):
+            yield client
+
+    def test_successful_execution(self, client, clock):
         """Test successful execution without retry."""
-        client = ConcreteClient()
-        mock_func = MagicMock(return_value="success")
+        mock_func = CountingCall("success")
         result = client._execute_with_retry(mock_func)
         assert result == "success"
         assert mock_func.call_count == 1
+        assert clock.sleeps == []
 
-    def test_retry_on_transient_error(self):
+    def test_retry_on_transient_error(self, client, clock):
         """Test retry on transient error."""
-        client = ConcreteClient()
-        mock_func = MagicMock(side_effect=[Exception("timeout"), "success"])
-        with patch.object(client, "_calculate_delay", return_value=0.01):
-            with patch("time.sleep"):
-                result = client._execute_with_retry(mock_func)
+        mock_func = CountingCall(Exception("timeout"), "success")
+        result = client._execute_with_retry(mock_func)
         assert result == "success"
         assert mock_func.call_count == 2
+        assert clock.sleeps == [0.01]
 
-    def test_no_retry_on_permanent_error(self):
+    def test_no_retry_on_permanent_error(self, client):
         """Test no retry on permanent error."""
-        client = ConcreteClient()
-        mock_func = MagicMock(side_effect=Exception("401 Unauthorized"))
+        mock_func = CountingCall(Exception("401 Unauthorized"))
         with pytest.raises(Exception) as exc_info:
             client._execute_with_retry(mock_func)
         assert "401 Unauthorized" in str(exc_info.value)
         assert mock_func.call_count == 1
 
-    def test_max_retries_exceeded(self):
+    def test_max_retries_exceeded(self, client, clock):
         """Test that max retries are respected."""
-        client = ConcreteClient()
-        mock_func = MagicMock(side_effect=Exception("timeout"))
-        with patch.object(client, "_calculate_delay", return_value=0.01):
-            with patch("time.sleep"):
-                with pytest.raises(Exception) as exc_info:
-                    client._execute_with_retry(mock_func)
+        mock_func = CountingCall(Exception("timeout"))
+        with pytest.raises(Exception) as exc_info:
+            client._execute_with_retry(mock_func)
         assert "timeout" in str(exc_info.value)
         # max_retries is 3, so it tries 4 times total (0, 1, 2, 3)
         assert mock_func.call_count == 4
+        assert clock.sleeps == [0.01] * 3
 
 
 class TestAbstractMethods:
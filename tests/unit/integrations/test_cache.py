@@ -1,6 +1,7 @@
 """Tests for ticket cache (Milestone 8.3)."""
 
 import time
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
@@ -14,6 +15,33 @@ from claude_indexer.integrations.models import (
 )
 
 
+def make_ticket(
+    i: int, source: TicketSource = TicketSource.LINEAR, **overrides
+) -> TicketEntity:
+    """Build a minimal ticket numbered ``i`` for cache tests."""
+    identifier = f"AVO-{i}" if source is TicketSource.LINEAR else f"owner/repo#{i}"
+    fields = {
+        "id": f"ticket-{i}",
+        "source": source,
+        "identifier": identifier,
+        "title": f"Test {i}",
+        "description": "Test",
+        "status": TicketStatus.OPEN,
+        "priority": TicketPriority.MEDIUM,
+        "labels": (),
+        "url": f"https://example.com/{i}",
+    }
+    fields.update(overrides)
+    return TicketEntity(**fields)
+
+
+@pytest.fixture(scope="module")
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Thread pool shared by the module's concurrency tests."""
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        yield pool
+
+
 class TestTicketCacheInit:
     """Test TicketCache initialization."""
 
@@ -49,13 +77,10 @@ class TestTicketCacheOperations:
     @pytest.fixture
     def sample_ticket(self) -> TicketEntity:
         """Create a sample ticket."""
-        return TicketEntity(
-            id="ticket-123",
-            source=TicketSource.LINEAR,
-            identifier="AVO-123",
+        return make_ticket(
+            123,
             title="Test ticket",
             description="Test description",
-            status=TicketStatus.OPEN,
             priority=TicketPriority.HIGH,
             labels=("bug",),
             url="https://example.com/ticket-123",
@@ -98,6 +123,32 @@ class TestTicketCacheOperations:
         assert len(cached_results) == 1
         assert cached_results[0].id == "ticket-123"
 
+    def test_search_key_ignores_filter_order(self, cache, sample_ticket):
+        """Status and label filters match regardless of order or repeats."""
+        cache.set_search_results(
+            [sample_ticket],
+            query="test",
+            status=["open", "in_progress"],
+            labels=["bug", "ui"],
+            source="linear",
+            project=None,
+            limit=20,
+        )
+        cached_results = cache.get_search_results(
+            query="test",
+            status=["in_progress", "open", "open"],
+            labels=["ui", "bug"],
+            source="linear",
+            project=None,
+            limit=20,
+        )
+        assert cached_results == [sample_ticket]
+
+    def test_ticket_key_includes_source(self, cache, sample_ticket):
+        """The same ticket id from another source is a different entry."""
+        cache.set_ticket(sample_ticket)
+        assert cache.get_ticket("ticket-123", "github") is None
+
     def test_get_nonexistent_search_results(self, cache):
         """Test getting nonexistent search results returns None."""
         result = cache.get_search_results(
@@ -116,43 +167,29 @@ class TestTicketCacheTTL:
 
     def test_ticket_expires_after_ttl(self):
         """Test that tickets expire after TTL."""
-        cache = TicketCache(ttl_seconds=1)
-        ticket = TicketEntity(
-            id="ticket-123",
-            source=TicketSource.LINEAR,
-            identifier="AVO-123",
-            title="Test",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.MEDIUM,
-            labels=(),
-            url="https://example.com",
-        )
+        now = [0.0]
+        cache = TicketCache(ttl_seconds=1, time_source=lambda: now[0])
+        ticket = make_ticket(123)
         cache.set_ticket(ticket)
 
         # Should be in cache immediately
         assert cache.get_ticket("ticket-123", "linear") is not None
 
-        # Wait for TTL to expire
-        time.sleep(1.5)
+        # Still cached right at the TTL boundary
+        now[0] = 1.0
+        assert cache.get_ticket("ticket-123", "linear") is not None
+
+        # Advance past the TTL
+        now[0] = 1.5
 
         # Should be expired now
         assert cache.get_ticket("ticket-123", "linear") is None
 
     def test_search_results_expire_after_ttl(self):
         """Test that search results expire after TTL."""
-        cache = TicketCache(ttl_seconds=1)
-        ticket = TicketEntity(
-            id="ticket-123",
-            source=TicketSource.GITHUB,
-            identifier="owner/repo#123",
-            title="Test",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.LOW,
-            labels=(),
-            url="https://example.com",
-        )
+        now = [0.0]
+        cache = TicketCache(ttl_seconds=1, time_source=lambda: now[0])
+        ticket = make_ticket(123, TicketSource.GITHUB)
         cache.set_search_results(
             [ticket],
             query="test",
@@ -174,8 +211,8 @@ class TestTicketCacheTTL:
         )
         assert result is not None
 
-        # Wait for TTL to expire
-        time.sleep(1.5)
+        # Advance past the TTL
+        now[0] = 1.5
 
         # Should be expired now
         result = cache.get_search_results(
@@ -188,6 +225,18 @@ class TestTicketCacheTTL:
         )
         assert result is None
 
+    def test_ttl_ignores_wall_clock_changes(self, monkeypatch):
+        """Entries expire on the monotonic clock, not wall-clock time."""
+        cache = TicketCache(ttl_seconds=60)
+        ticket = make_ticket(123)
+        cache.set_ticket(ticket)
+
+        # A wall-clock jump of an hour must not expire the entry
+        wall_clock = time.time() + 3600
+        monkeypatch.setattr(time, "time", lambda: wall_clock)
+
+        assert cache.get_ticket("ticket-123", "linear") is not None
+
 
 class TestTicketCacheLRU:
     """Test LRU eviction."""
@@ -198,31 +247,11 @@ class TestTicketCacheLRU:
 
         # Add 3 tickets
         for i in range(3):
-            ticket = TicketEntity(
-                id=f"ticket-{i}",
-                source=TicketSource.LINEAR,
-                identifier=f"AVO-{i}",
-                title=f"Test {i}",
-                description="Test",
-                status=TicketStatus.OPEN,
-                priority=TicketPriority.MEDIUM,
-                labels=(),
-                url=f"https://example.com/{i}",
-            )
+            ticket = make_ticket(i)
             cache.set_ticket(ticket)
 
         # Add a 4th ticket - this should evict ticket-0 (oldest)
-        ticket = TicketEntity(
-            id="ticket-3",
-            source=TicketSource.LINEAR,
-            identifier="AVO-3",
-            title="Test 3",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.MEDIUM,
-            labels=(),
-            url="https://example.com/3",
-        )
+        ticket = make_ticket(3)
         cache.set_ticket(ticket)
 
         # ticket-0 should be evicted (oldest by insertion order)
@@ -232,6 +261,60 @@ class TestTicketCacheLRU:
         assert cache.get_ticket("ticket-2", "linear") is not None
         assert cache.get_ticket("ticket-3", "linear") is not None
 
+    def test_expired_entry_evicted_before_live_lru(self):
+        """A full cache frees expired slots before evicting live entries."""
+        now = [0.0]
+        cache = TicketCache(ttl_seconds=10, max_entries=2, time_source=lambda: now[0])
+        cache.set_ticket(make_ticket(0))
+        now[0] = 5.0
+        cache.set_ticket(make_ticket(1))
+        # Touch ticket-0 so ticket-1 becomes least recently used
+        now[0] = 6.0
+        assert cache.get_ticket("ticket-0", "linear") is not None
+
+        # ticket-0 has now expired; ticket-1 is still live
+        now[0] = 11.0
+        cache.set_ticket(make_ticket(2))
+
+        assert cache.get_ticket("ticket-1", "linear") is not None
+        assert cache.get_ticket("ticket-2", "linear") is not None
+        assert cache.stats["entries"] == 2
+
+    def test_rewrite_does_not_evict_other_entries(self):
+        """Re-caching an existing key on a full cache keeps the others."""
+        cache = TicketCache(ttl_seconds=300, max_entries=2)
+        cache.set_ticket(make_ticket(0))
+        cache.set_ticket(make_ticket(1))
+
+        cache.set_ticket(make_ticket(1, title="Updated"))
+
+        assert cache.get_ticket("ticket-0", "linear") is not None
+        assert cache.get_ticket("ticket-1", "linear").title == "Updated"
+
+    def test_expiry_heap_handles_mixed_search_keys(self):
+        """Same-deadline entries with incomparable keys can be pruned."""
+        now = [0.0]
+        cache = TicketCache(ttl_seconds=1, time_source=lambda: now[0])
+        cache.set_search_results([], "q", None, None, None, None, 20)
+        cache.set_search_results([], "q", ["open"], None, None, None, 20)
+        cache.set_ticket(make_ticket(0))
+
+        now[0] = 2.0
+        cache.set_ticket(make_ticket(1))
+
+        assert cache.stats["entries"] == 1
+
+    def test_expiry_heap_bounded_by_max_entries(self):
+        """Rewriting a hot key does not grow the expiry heap without bound."""
+        now = [0.0]
+        cache = TicketCache(ttl_seconds=300, max_entries=3, time_source=lambda: now[0])
+        for second in range(100):
+            now[0] = float(second)
+            cache.set_ticket(make_ticket(0))
+
+        assert len(cache._expiry_heap) <= 2 * cache.max_entries
+        assert cache.get_ticket("ticket-0", "linear") is not None
+
 
 class TestTicketCacheInvalidation:
     """Test cache invalidation."""
@@ -239,28 +322,8 @@ class TestTicketCacheInvalidation:
     def test_invalidate_by_source(self):
         """Test invalidating entries by source."""
         cache = TicketCache()
-        linear_ticket = TicketEntity(
-            id="ticket-1",
-            source=TicketSource.LINEAR,
-            identifier="AVO-1",
-            title="Linear ticket",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.HIGH,
-            labels=(),
-            url="https://linear.app/1",
-        )
-        github_ticket = TicketEntity(
-            id="ticket-2",
-            source=TicketSource.GITHUB,
-            identifier="owner/repo#2",
-            title="GitHub ticket",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.MEDIUM,
-            labels=(),
-            url="https://github.com/2",
-        )
+        linear_ticket = make_ticket(1)
+        github_ticket = make_ticket(2, TicketSource.GITHUB)
         cache.set_ticket(linear_ticket)
         cache.set_ticket(github_ticket)
 
@@ -275,31 +338,23 @@ class TestTicketCacheInvalidation:
         assert cache.get_ticket("ticket-1", "linear") is None
         assert cache.get_ticket("ticket-2", "github") is not None
 
+    def test_invalidate_by_source_drops_heap_entries(self):
+        """Source invalidation leaves only live entries in the expiry heap."""
+        cache = TicketCache()
+        cache.set_ticket(make_ticket(1))
+        cache.set_ticket(make_ticket(2, TicketSource.GITHUB))
+
+        cache.invalidate(source="linear")
+
+        assert [key for _, _, key in cache._expiry_heap] == [
+            cache._ticket_key("ticket-2", "github")
+        ]
+
     def test_clear_all(self):
         """Test clearing all cache entries."""
         cache = TicketCache()
-        ticket1 = TicketEntity(
-            id="ticket-1",
-            source=TicketSource.LINEAR,
-            identifier="AVO-1",
-            title="Test 1",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.HIGH,
-            labels=(),
-            url="https://example.com/1",
-        )
-        ticket2 = TicketEntity(
-            id="ticket-2",
-            source=TicketSource.GITHUB,
-            identifier="owner/repo#2",
-            title="Test 2",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.MEDIUM,
-            labels=(),
-            url="https://example.com/2",
-        )
+        ticket1 = make_ticket(1)
+        ticket2 = make_ticket(2, TicketSource.GITHUB)
         cache.set_ticket(ticket1)
         cache.set_ticket(ticket2)
 
@@ -312,50 +367,29 @@ class TestTicketCacheInvalidation:
 class TestTicketCacheThreadSafety:
     """Test thread safety."""
 
-    def test_concurrent_reads_and_writes(self):
+    def test_concurrent_reads_and_writes(self, executor):
         """Test concurrent read/write operations."""
         cache = TicketCache(ttl_seconds=300, max_entries=100)
 
         def write_ticket(i: int):
-            ticket = TicketEntity(
-                id=f"ticket-{i}",
-                source=TicketSource.LINEAR,
-                identifier=f"AVO-{i}",
-                title=f"Test {i}",
-                description="Test",
-                status=TicketStatus.OPEN,
-                priority=TicketPriority.MEDIUM,
-                labels=(),
-                url=f"https://example.com/{i}",
-            )
+            ticket = make_ticket(i)
             cache.set_ticket(ticket)
             return cache.get_ticket(f"ticket-{i}", "linear")
 
         # Run concurrent operations
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(write_ticket, i) for i in range(50)]
-            results = [f.result() for f in futures]
+        futures = [executor.submit(write_ticket, i) for i in range(50)]
+        results = [f.result() for f in futures]
 
         # All operations should succeed
         assert all(r is not None for r in results)
 
-    def test_concurrent_invalidation(self):
+    def test_concurrent_invalidation(self, executor):
         """Test concurrent invalidation doesn't cause errors."""
         cache = TicketCache()
 
         # Pre-populate cache
         for i in range(20):
-            ticket = TicketEntity(
-                id=f"ticket-{i}",
-                source=TicketSource.GITHUB,
-                identifier=f"owner/repo#{i}",
-                title=f"Test {i}",
-                description="Test",
-                status=TicketStatus.OPEN,
-                priority=TicketPriority.LOW,
-                labels=(),
-                url=f"https://example.com/{i}",
-            )
+            ticket = make_ticket(i, TicketSource.GITHUB)
             cache.set_ticket(ticket)
 
         def invalidate_and_check():
@@ -363,13 +397,71 @@ class TestTicketCacheThreadSafety:
             return True
 
         # Run concurrent invalidations
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [executor.submit(invalidate_and_check) for _ in range(20)]
-            results = [f.result() for f in futures]
+        futures = [executor.submit(invalidate_and_check) for _ in range(20)]
+        results = [f.result() for f in futures]
 
         # All operations should complete without error
         assert all(r is True for r in results)
 
+    def test_single_flight_fetch(self, executor):
+        """Concurrent misses on one key run the loader only once."""
+        cache = TicketCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)  # Keep the load in flight while others arrive
+            return "ticket"
+
+        futures = [
+            executor.submit(cache.get_or_fetch, "key", loader) for _ in range(10)
+        ]
+        results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert results == ["ticket"] * 10
+
+
+class TestGetOrFetch:
+    """Test loading through the cache."""
+
+    def test_loads_once_then_hits(self):
+        """A loaded value is cached for later calls."""
+        cache = TicketCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "ticket"
+
+        assert cache.get_or_fetch("key", loader) == "ticket"
+        assert cache.get_or_fetch("key", loader) == "ticket"
+        assert len(calls) == 1
+
+    def test_none_result_not_cached(self):
+        """A None result is returned but the next call loads again."""
+        cache = TicketCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+
+        assert cache.get_or_fetch("key", loader) is None
+        assert cache.get_or_fetch("key", loader) is None
+        assert len(calls) == 2
+
+    def test_loader_error_propagates_and_releases_key(self):
+        """A failing load raises and does not block later loads."""
+        cache = TicketCache()
+
+        def failing_loader():
+            raise RuntimeError("upstream down")
+
+        with pytest.raises(RuntimeError, match="upstream down"):
+            cache.get_or_fetch("key", failing_loader)
+
+        assert cache.get_or_fetch("key", lambda: "ticket") == "ticket"
+
 
 class TestCacheStats:
     """Test cache statistics."""
@@ -377,17 +469,7 @@ class TestCacheStats:
     def test_hit_rate_tracking(self):
         """Test that hit rate is tracked correctly."""
         cache = TicketCache()
-        ticket = TicketEntity(
-            id="ticket-1",
-            source=TicketSource.LINEAR,
-            identifier="AVO-1",
-            title="Test",
-            description="Test",
-            status=TicketStatus.OPEN,
-            priority=TicketPriority.HIGH,
-            labels=(),
-            url="https://example.com",
-        )
+        ticket = make_ticket(1)
         cache.set_ticket(ticket)
 
         # First access - hit
@@ -1,11 +1,28 @@
 """Tests for Linear client (Milestone 8.3)."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
-from claude_indexer.integrations.models import TicketPriority, TicketStatus
+from claude_indexer.integrations.linear import LinearClient
+from claude_indexer.integrations.models import (
+    TicketPriority,
+    TicketSource,
+    TicketStatus,
+    normalize_linear_priority,
+    normalize_linear_status,
+)
+
+
+@pytest.fixture
+def linear_api_key(monkeypatch: pytest.MonkeyPatch) -> str:
+    """Set LINEAR_API_KEY for the test and return its value."""
+    monkeypatch.setenv("LINEAR_API_KEY", "test-key")
+    return "test-key"
+
+
+@pytest.fixture
+def no_linear_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove LINEAR_API_KEY from the environment for the test."""
+    monkeypatch.delenv("LINEAR_API_KEY", raising=False)
 
 
 class TestLinearClientBasics:
@@ -17,45 +34,29 @@ class TestLinearClientBasics:
 
         assert LinearClient is not None
 
-    def test_init_requires_api_key(self):
+    def test_init_requires_api_key(self, no_linear_api_key):
         """Test that initialization requires an API key."""
-        from claude_indexer.integrations.linear import LinearClient
-
-        # Clear environment variable if set
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(ValueError, match="LINEAR_API_KEY"):
-                LinearClient()
+        with pytest.raises(ValueError, match="LINEAR_API_KEY"):
+            LinearClient()
 
-    def test_init_with_env_var(self):
+    def test_init_with_env_var(self, linear_api_key):
         """Test initialization with environment variable."""
-        from claude_indexer.integrations.linear import LinearClient
-
-        with patch.dict(os.environ, {"LINEAR_API_KEY": "test-key"}):
-            client = LinearClient()
-            assert client.api_key == "test-key"
+        client = LinearClient()
+        assert client.api_key == linear_api_key
 
-    def test_init_with_api_key_param(self):
+    def test_init_with_api_key_param(self, no_linear_api_key):
         """Test initialization with explicit api_key parameter."""
-        from claude_indexer.integrations.linear import LinearClient
-
-        with patch.dict(os.environ, {}, clear=True):
-            client = LinearClient(api_key="my-token")
-            assert client.api_key == "my-token"
+        client = LinearClient(api_key="my-token")
+        assert client.api_key == "my-token"
 
     def test_graphql_endpoint(self):
         """Test GraphQL endpoint is correct."""
-        from claude_indexer.integrations.linear import LinearClient
-
         assert LinearClient.GRAPHQL_ENDPOINT == "https://api.linear.app/graphql"
 
-    def test_source_property(self):
+    def test_source_property(self, linear_api_key):
         """Test source property returns LINEAR."""
-        from claude_indexer.integrations.linear import LinearClient
-        from claude_indexer.integrations.models import TicketSource
-
-        with patch.dict(os.environ, {"LINEAR_API_KEY": "test-key"}):
-            client = LinearClient()
-            assert client.source == TicketSource.LINEAR
+        client = LinearClient()
+        assert client.source == TicketSource.LINEAR
 
 
 class TestLinearStatusNormalization:
@@ -63,32 +64,22 @@ class TestLinearStatusNormalization:
 
     def test_backlog_is_open(self):
         """Test backlog state normalizes to open."""
-        from claude_indexer.integrations.models import normalize_linear_status
-
         assert normalize_linear_status("Backlog") == TicketStatus.OPEN
 
     def test_todo_is_open(self):
         """Test todo state normalizes to open."""
-        from claude_indexer.integrations.models import normalize_linear_status
-
         assert normalize_linear_status("Todo") == TicketStatus.OPEN
 
     def test_in_progress(self):
         """Test in progress state normalization."""
-        from claude_indexer.integrations.models import normalize_linear_status
-
         assert normalize_linear_status("In Progress") == TicketStatus.IN_PROGRESS
 
     def test_done_is_done(self):
         """Test done state normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_status
-
         assert normalize_linear_status("Done") == TicketStatus.DONE
 
     def test_canceled_is_cancelled(self):
         """Test canceled state normalization."""
-        from claude_indexer.integrations.models import normalize_linear_status
-
         assert normalize_linear_status("Canceled") == TicketStatus.CANCELLED
 
 
@@ -97,36 +88,24 @@ class TestLinearPriorityNormalization:
 
     def test_priority_0_is_none(self):
         """Test priority 0 (no priority) normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(0) == TicketPriority.NONE
 
     def test_priority_1_is_urgent(self):
         """Test priority 1 (urgent) normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(1) == TicketPriority.URGENT
 
     def test_priority_2_is_high(self):
         """Test priority 2 (high) normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(2) == TicketPriority.HIGH
 
     def test_priority_3_is_medium(self):
         """Test priority 3 (medium) normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(3) == TicketPriority.MEDIUM
 
     def test_priority_4_is_low(self):
         """Test priority 4 (low) normalizes correctly."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(4) == TicketPriority.LOW
 
     def test_priority_none_defaults_to_none(self):
         """Test None priority defaults to NONE."""
-        from claude_indexer.integrations.models import normalize_linear_priority
-
         assert normalize_linear_priority(None) == TicketPriority.NONE
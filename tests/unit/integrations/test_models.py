@@ -1,5 +1,7 @@
 """Tests for ticket integration models (Milestone 8.3)."""
 
+import dataclasses
+import pickle
 from datetime import datetime
 
 import pytest
@@ -91,9 +93,9 @@ class TestTicketComment:
 class TestTicketEntity:
     """Test TicketEntity dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_ticket(self) -> TicketEntity:
-        """Create a sample ticket for testing."""
+        """Sample ticket shared by the class; frozen, so tests cannot alter it."""
         return TicketEntity(
             id="ticket-123",
             source=TicketSource.LINEAR,
@@ -212,64 +214,78 @@ class TestTicketEntity:
         assert len(preview) <= 203  # 200 + "..."
         assert preview.endswith("...")
 
+    def test_slotted_ticket_stays_frozen_and_picklable(self, sample_ticket):
+        """Slotted tickets keep frozen semantics and survive pickling."""
+        assert not hasattr(sample_ticket, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sample_ticket.title = "Changed"
+        assert pickle.loads(pickle.dumps(sample_ticket)) == sample_ticket
+        assert dataclasses.replace(sample_ticket, title="Changed").title == "Changed"
+
 
 class TestStatusNormalization:
     """Test status normalization functions."""
 
-    def test_normalize_linear_status_todo(self):
-        """Test Linear 'Todo' status normalization."""
-        assert normalize_linear_status("Todo") == TicketStatus.OPEN
-        assert normalize_linear_status("Backlog") == TicketStatus.OPEN
-        assert normalize_linear_status("Triage") == TicketStatus.OPEN
-
-    def test_normalize_linear_status_in_progress(self):
-        """Test Linear in-progress status normalization."""
-        assert normalize_linear_status("In Progress") == TicketStatus.IN_PROGRESS
-        assert normalize_linear_status("In Review") == TicketStatus.IN_PROGRESS
-
-    def test_normalize_linear_status_done(self):
-        """Test Linear done status normalization."""
-        assert normalize_linear_status("Done") == TicketStatus.DONE
-        assert normalize_linear_status("Completed") == TicketStatus.DONE
-
-    def test_normalize_linear_status_cancelled(self):
-        """Test Linear cancelled status normalization."""
-        assert normalize_linear_status("Canceled") == TicketStatus.CANCELLED
-        assert normalize_linear_status("Cancelled") == TicketStatus.CANCELLED
-        assert normalize_linear_status("Duplicate") == TicketStatus.CANCELLED
-
-    def test_normalize_linear_status_unknown(self):
-        """Test Linear unknown status defaults to open."""
-        assert normalize_linear_status("SomeCustomStatus") == TicketStatus.OPEN
-
-    def test_normalize_github_status(self):
+    @pytest.mark.parametrize(
+        "state_name,expected",
+        [
+            ("Todo", TicketStatus.OPEN),
+            ("Backlog", TicketStatus.OPEN),
+            ("Triage", TicketStatus.OPEN),
+            ("In Progress", TicketStatus.IN_PROGRESS),
+            ("In Review", TicketStatus.IN_PROGRESS),
+            ("Done", TicketStatus.DONE),
+            ("Completed", TicketStatus.DONE),
+            ("Canceled", TicketStatus.CANCELLED),
+            ("Cancelled", TicketStatus.CANCELLED),
+            ("Duplicate", TicketStatus.CANCELLED),
+            ("SomeCustomStatus", TicketStatus.OPEN),
+        ],
+    )
+    def test_normalize_linear_status(self, state_name, expected):
+        """Linear state names map to statuses, defaulting to open."""
+        assert normalize_linear_status(state_name) == expected
+
+    @pytest.mark.parametrize(
+        "state,expected",
+        [("open", TicketStatus.OPEN), ("closed", TicketStatus.DONE)],
+    )
+    def test_normalize_github_status(self, state, expected):
         """Test GitHub status normalization."""
-        assert normalize_github_status("open") == TicketStatus.OPEN
-        assert normalize_github_status("closed") == TicketStatus.DONE
+        assert normalize_github_status(state) == expected
 
 
 class TestPriorityNormalization:
     """Test priority normalization functions."""
 
-    def test_normalize_linear_priority(self):
-        """Test Linear priority normalization (0=none, 1=urgent, 4=low)."""
-        assert normalize_linear_priority(0) == TicketPriority.NONE
-        assert normalize_linear_priority(1) == TicketPriority.URGENT
-        assert normalize_linear_priority(2) == TicketPriority.HIGH
-        assert normalize_linear_priority(3) == TicketPriority.MEDIUM
-        assert normalize_linear_priority(4) == TicketPriority.LOW
-
-    def test_normalize_linear_priority_invalid(self):
-        """Test Linear priority normalization with invalid values."""
-        assert normalize_linear_priority(5) == TicketPriority.NONE
-        assert normalize_linear_priority(-1) == TicketPriority.NONE
-
-    def test_infer_github_priority_from_labels(self):
+    @pytest.mark.parametrize(
+        "priority,expected",
+        [
+            (0, TicketPriority.NONE),
+            (1, TicketPriority.URGENT),
+            (2, TicketPriority.HIGH),
+            (3, TicketPriority.MEDIUM),
+            (4, TicketPriority.LOW),
+            (5, TicketPriority.NONE),
+            (-1, TicketPriority.NONE),
+        ],
+    )
+    def test_normalize_linear_priority(self, priority, expected):
+        """Linear priorities map 0=none, 1=urgent .. 4=low; others are none."""
+        assert normalize_linear_priority(priority) == expected
+
+    @pytest.mark.parametrize(
+        "labels,expected",
+        [
+            (["P0", "bug"], TicketPriority.URGENT),
+            (["priority: critical"], TicketPriority.URGENT),
+            (["P1", "enhancement"], TicketPriority.HIGH),
+            (["priority: high"], TicketPriority.HIGH),
+            (["P2"], TicketPriority.MEDIUM),
+            (["P3"], TicketPriority.LOW),
+            (["bug", "enhancement"], TicketPriority.NONE),
+        ],
+    )
+    def test_infer_github_priority_from_labels(self, labels, expected):
         """Test inferring GitHub priority from labels."""
-        assert infer_github_priority(["P0", "bug"]) == TicketPriority.URGENT
-        assert infer_github_priority(["priority: critical"]) == TicketPriority.URGENT
-        assert infer_github_priority(["P1", "enhancement"]) == TicketPriority.HIGH
-        assert infer_github_priority(["priority: high"]) == TicketPriority.HIGH
-        assert infer_github_priority(["P2"]) == TicketPriority.MEDIUM
-        assert infer_github_priority(["P3"]) == TicketPriority.LOW
-        assert infer_github_priority(["bug", "enhancement"]) == TicketPriority.NONE
+        assert infer_github_priority(labels) == expected
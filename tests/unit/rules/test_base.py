@@ -222,6 +222,19 @@ class TestRuleContext:
         )
         assert context.lines == ["line1", "line2", "line3"]
 
+    def test_rule_context_lines_cached_per_content(self):
+        """Lines are split once and re-split when content is replaced."""
+        context = RuleContext(
+            file_path=Path("test.py"),
+            content="line1\nline2",
+            language="python",
+        )
+        first = context.lines
+        assert context.lines is first
+
+        context.content = "other"
+        assert context.lines == ["other"]
+
     def test_rule_context_is_line_in_diff_no_diff(self):
         """Test is_line_in_diff when no diff info available."""
         context = RuleContext(
@@ -9,6 +9,8 @@ from pathlib import Path
 import pytest
 
 from claude_indexer.rules.base import RuleContext, Severity
+from claude_indexer.rules.documentation.missing_docstring import MissingDocstringRule
+from claude_indexer.rules.documentation.outdated_docs import OutdatedDocsRule
 
 
 def create_context(
@@ -30,12 +32,8 @@ def create_context(
 class TestMissingDocstringRule:
     """Tests for DOCUMENTATION.MISSING_DOCSTRING rule."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def rule(self):
-        from claude_indexer.rules.documentation.missing_docstring import (
-            MissingDocstringRule,
-        )
-
         return MissingDocstringRule()
 
     def test_rule_metadata(self, rule):
@@ -230,10 +228,8 @@ def process_complex_data(data):
 class TestOutdatedDocsRule:
     """Tests for DOCUMENTATION.OUTDATED_DOCS rule."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def rule(self):
-        from claude_indexer.rules.documentation.outdated_docs import OutdatedDocsRule
-
         return OutdatedDocsRule()
 
     def test_rule_metadata(self, rule):
@@ -398,57 +394,39 @@ def func(a, b, c):
 class TestDocumentationRulesIntegration:
     """Integration tests for all documentation rules."""
 
-    def test_all_rules_have_correct_category(self):
-        """Test all documentation rules have correct category."""
-        from claude_indexer.rules.documentation.missing_docstring import (
-            MissingDocstringRule,
-        )
-        from claude_indexer.rules.documentation.outdated_docs import OutdatedDocsRule
-
-        rules = [
-            MissingDocstringRule(),
-            OutdatedDocsRule(),
-        ]
+    @pytest.fixture(scope="module")
+    def rules(self) -> tuple[MissingDocstringRule, OutdatedDocsRule]:
+        """One instance of each documentation rule, shared by the class."""
+        return MissingDocstringRule(), OutdatedDocsRule()
 
+    def test_all_rules_have_correct_category(self, rules):
+        """Test all documentation rules have correct category."""
         for rule in rules:
             assert rule.category == "documentation"
             assert rule.rule_id.startswith("DOCUMENTATION.")
 
-    def test_all_rules_support_common_languages(self):
+    def test_all_rules_support_common_languages(self, rules):
         """Test all rules support Python, JavaScript, TypeScript."""
-        from claude_indexer.rules.documentation.missing_docstring import (
-            MissingDocstringRule,
-        )
-        from claude_indexer.rules.documentation.outdated_docs import OutdatedDocsRule
-
-        rules = [
-            MissingDocstringRule(),
-            OutdatedDocsRule(),
-        ]
-
         for rule in rules:
             langs = rule.supported_languages
             assert "python" in langs
             assert "javascript" in langs
             assert "typescript" in langs
 
-    def test_all_rules_provide_remediation(self):
+    def test_all_rules_provide_remediation(self, rules):
         """Test all rules provide remediation hints."""
-        from claude_indexer.rules.documentation.missing_docstring import (
-            MissingDocstringRule,
-        )
-        from claude_indexer.rules.documentation.outdated_docs import OutdatedDocsRule
+        missing_docstring, outdated_docs = rules
 
         # Test cases that should trigger each rule
         test_cases = [
             (
-                MissingDocstringRule(),
+                missing_docstring,
                 "def foo(x):\n    return x * 2",
                 "python",
                 "module.py",
             ),
             (
-                OutdatedDocsRule(),
+                outdated_docs,
                 '''def foo(a, b):
     """Doc.
 
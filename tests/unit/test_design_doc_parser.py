@@ -555,6 +555,33 @@ class TestEdgeCases:
 
         assert result.parsing_time >= 0
 
+    def test_reparse_unchanged_file_uses_cache(self, tmp_path):
+        """Test re-parsing an unchanged file returns equivalent fresh entities."""
+        parser = DesignDocParser()
+
+        prd_file = tmp_path / "PRD.md"
+        prd_file.write_text(PRD_CONTENT)
+
+        first = parser.parse(prd_file)
+        second = parser.parse(prd_file)
+
+        assert [e.name for e in first.entities] == [e.name for e in second.entities]
+        assert first.entities[0] is not second.entities[0]
+
+    def test_reparse_modified_file(self, tmp_path):
+        """Test re-parsing picks up file modifications."""
+        parser = DesignDocParser()
+
+        prd_file = tmp_path / "PRD.md"
+        prd_file.write_text(PRD_CONTENT)
+        first = parser.parse(prd_file)
+
+        prd_file.write_text(PRD_CONTENT + "\n## Appendix\n\nExtra notes.\n")
+        second = parser.parse(prd_file)
+
+        assert first.file_hash != second.file_hash
+        assert any(e.name == "Section: Appendix" for e in second.entities)
+
 
 class TestEntityTypeIntegration:
     """Test integration with new entity types."""
@@ -476,3 +476,22 @@ class TestDummyEmbedder:
         embedding = custom_embedder.embed_single("test")
         assert len(embedding) == 512
         assert embedding.dtype == np.float32
+
+
+class TestPackageExports:
+    """Test lazily imported package-level exports."""
+
+    def test_lazy_exports_resolve(self):
+        """Test provider embedders are reachable from the package."""
+        import claude_indexer.embeddings as embeddings
+
+        assert embeddings.OpenAIEmbedder is OpenAIEmbedder
+        assert embeddings.BM25Embedder.__name__ == "BM25Embedder"
+        assert embeddings.EmbedderRegistry.__name__ == "EmbedderRegistry"
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError."""
+        import claude_indexer.embeddings as embeddings
+
+        with pytest.raises(AttributeError):
+            embeddings.DoesNotExist  # noqa: B018
@@ -6,6 +6,8 @@ Tests cover:
 - PlanGenerator: Critique to task conversion and plan generation
 """
 
+import sys
+
 import pytest
 
 from claude_indexer.ui.critique.engine import (
@@ -197,6 +199,16 @@ class TestTask:
         assert restored.title == sample_task.title
         assert restored.impact == sample_task.impact
 
+    def test_task_ids_are_interned(self, sample_task: Task) -> None:
+        """Test IDs built at runtime share one string object."""
+        task_dict = sample_task.to_dict()
+        task_dict["id"] = "".join(["TASK-", "TOK-0001"])
+        task_dict["dependencies"] = ["".join(["TASK-", "TOK-0002"])]
+        restored = Task.from_dict(task_dict)
+
+        assert restored.id is sample_task.id
+        assert restored.dependencies[0] is sys.intern("TASK-TOK-0002")
+
 
 class TestTaskGroup:
     """Tests for TaskGroup dataclass."""
@@ -362,6 +374,52 @@ class TestImplementationPlan:
         unknown_group = plan.get_group_by_scope("unknown")
         assert unknown_group is None
 
+    def test_get_task_by_id_and_index(self) -> None:
+        """Test task lookup by ID across groups."""
+        tasks = [
+            Task(
+                id=task_id,
+                title=task_id,
+                description="",
+                scope=scope,
+                priority=1,
+                estimated_effort="low",
+                impact=0.5,
+            )
+            for task_id, scope in [("T1", "tokens"), ("T2", "components")]
+        ]
+        plan = ImplementationPlan(
+            groups=[
+                TaskGroup(scope="tokens", description="", tasks=[tasks[0]]),
+                TaskGroup(scope="components", description="", tasks=[tasks[1]]),
+            ],
+        )
+
+        assert plan.get_task_by_id("T2") is tasks[1]
+        assert plan.get_task_by_id("missing") is None
+        assert plan.get_task_index() == {"T1": tasks[0], "T2": tasks[1]}
+
+    def test_get_dependents(self) -> None:
+        """Test reverse dependency lookup."""
+        tasks = [
+            Task(
+                id=task_id,
+                title=task_id,
+                description="",
+                scope="tokens",
+                priority=1,
+                estimated_effort="low",
+                impact=0.5,
+                dependencies=deps,
+            )
+            for task_id, deps in [("T1", []), ("T2", ["T1"]), ("T3", ["T1", "T2"])]
+        ]
+        plan = ImplementationPlan(
+            groups=[TaskGroup(scope="tokens", description="", tasks=tasks)],
+        )
+
+        assert plan.get_dependents() == {"T1": {"T2", "T3"}, "T2": {"T3"}}
+
 
 class TestTaskPrioritizer:
     """Tests for TaskPrioritizer."""
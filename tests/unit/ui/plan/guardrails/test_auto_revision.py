@@ -628,6 +628,33 @@ class TestCircularDependencyDetection:
         assert conflict is not None
         assert "circular dependency" in conflict
 
+    def test_add_dependency_cycle_within_revision(self, engine: AutoRevisionEngine):
+        """Test edges added by the same revision are checked together."""
+        plan = make_plan([make_task("TASK-A"), make_task("TASK-B")])
+
+        revision = PlanRevision(
+            revision_type=RevisionType.ADD_DEPENDENCY,
+            rationale="Adding both directions",
+            dependency_additions=[("TASK-A", "TASK-B"), ("TASK-B", "TASK-A")],
+        )
+
+        conflict = engine._check_conflicts(plan, revision)
+
+        assert conflict is not None
+        assert "circular dependency" in conflict
+
+    def test_deep_chain_cycle_detection(self, engine: AutoRevisionEngine):
+        """Test cycle detection on chains deeper than the recursion limit."""
+        depth = 2000
+        tasks = [
+            make_task(f"TASK-{i}", dependencies=[f"TASK-{i + 1}"]) for i in range(depth)
+        ]
+        tasks.append(make_task(f"TASK-{depth}"))
+        plan = make_plan(tasks)
+
+        assert engine._would_create_cycle(plan, f"TASK-{depth}", "TASK-0") is True
+        assert engine._would_create_cycle(plan, "TASK-0", f"TASK-{depth}") is False
+
     def test_get_dependency_graph(self, engine: AutoRevisionEngine):
         """Test building dependency graph from plan."""
         task_a = make_task("TASK-A", dependencies=["TASK-B", "TASK-C"])
@@ -796,6 +823,28 @@ class TestRevisionApplication:
         # New plan should have the change
         assert new_plan.all_tasks[0].description == "Modified"
 
+    def test_apply_revision_shares_untouched_groups(self, engine: AutoRevisionEngine):
+        """Test that only the touched group and task are copied."""
+        target = make_task("TASK-001")
+        other = make_task("TASK-002", scope="api")
+        plan = ImplementationPlan(
+            groups=[
+                TaskGroup(scope="components", description="A", tasks=[target]),
+                TaskGroup(scope="api", description="B", tasks=[other]),
+            ],
+            quick_wins=[target],
+        )
+        revision = make_add_dependency_revision("TASK-001", "TASK-002")
+
+        new_plan, error = engine._apply_revision(plan, revision)
+
+        assert error is None
+        assert new_plan.groups[1] is plan.groups[1]
+        assert new_plan.groups[0] is not plan.groups[0]
+        assert target.dependencies == []
+        assert new_plan.quick_wins[0] is new_plan.groups[0].tasks[0]
+        assert new_plan.quick_wins[0].dependencies == ["TASK-002"]
+
 
 # ============================================================================
 # Engine Flow Tests
@@ -974,6 +1023,39 @@ class TestEngineFlow:
         )
         assert "TASK-B" not in task_a_revised.dependencies
 
+    def test_revise_plan_shares_dependency_graph(
+        self, engine: AutoRevisionEngine, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test consecutive dependency revisions reuse one graph."""
+        plan = make_plan([make_task("TASK-A"), make_task("TASK-B")])
+        findings = [
+            make_finding(
+                summary="A needs B",
+                suggested_revision=make_add_dependency_revision("TASK-A", "TASK-B"),
+            ),
+            make_finding(
+                summary="B needs A",
+                suggested_revision=make_add_dependency_revision("TASK-B", "TASK-A"),
+            ),
+        ]
+        build_count = 0
+        build_graph = engine._get_task_dependency_graph
+
+        def counting_build(p):
+            nonlocal build_count
+            build_count += 1
+            return build_graph(p)
+
+        monkeypatch.setattr(engine, "_get_task_dependency_graph", counting_build)
+
+        result = engine.revise_plan(plan, findings)
+
+        # The second edge closes a cycle with the first and must be rejected
+        assert len(result.revisions_applied) == 1
+        assert len(result.revisions_skipped) == 1
+        assert "circular" in result.revisions_skipped[0][1]
+        assert build_count == 1
+
     def test_revise_plan_tracks_time(self, engine: AutoRevisionEngine):
         """Test total_time_ms is recorded."""
         plan = make_plan([make_task()])
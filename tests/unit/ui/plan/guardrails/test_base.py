@@ -83,6 +83,11 @@ class TestRevisionType:
         assert RevisionType("add_task") == RevisionType.ADD_TASK
         assert RevisionType("modify_task") == RevisionType.MODIFY_TASK
 
+    def test_label(self):
+        """Test human-readable labels used in audit trails."""
+        assert RevisionType.ADD_TASK.label == "Add Task"
+        assert RevisionType.ADD_DEPENDENCY.label == "Add Dependency"
+
 
 class TestPlanRevision:
     """Tests for PlanRevision dataclass."""
@@ -798,6 +798,40 @@ class DiscoveredRule(PlanValidationRule):
         assert discovered == 1
         assert engine.get_rule("PLAN.DISCOVERED") is not None
 
+    def test_discover_rules_reuses_loaded_classes(
+        self, sample_config: PlanGuardrailConfig
+    ):
+        """Test repeated discovery reuses classes but gives fresh instances."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            rule_file = Path(tmpdir) / "cached_rule.py"
+            rule_file.write_text(
+                """
+from claude_indexer.ui.plan.guardrails.base import PlanValidationRule
+from claude_indexer.rules.base import Severity
+
+class CachedRule(PlanValidationRule):
+    rule_id = "PLAN.CACHED"
+    name = "Cached Rule"
+    category = "coverage"
+    default_severity = Severity.LOW
+
+    def validate(self, context):
+        return []
+
+    def suggest_revision(self, finding, context):
+        return None
+"""
+            )
+            first = PlanGuardrailEngine(sample_config)
+            second = PlanGuardrailEngine(sample_config)
+            assert first.discover_rules(Path(tmpdir)) == 1
+            assert second.discover_rules(Path(tmpdir)) == 1
+
+        first_rule = first.get_rule("PLAN.CACHED")
+        second_rule = second.get_rule("PLAN.CACHED")
+        assert type(first_rule) is type(second_rule)
+        assert first_rule is not second_rule
+
 
 class TestCreateGuardrailEngine:
     """Tests for create_guardrail_engine factory function."""
@@ -897,6 +931,116 @@ class TestParallelExecution:
         assert result.rules_skipped == 0
         assert len(result.findings) == 0
 
+    def test_parallel_preserves_registration_order(
+        self,
+        sample_config: PlanGuardrailConfig,
+        sample_context: PlanValidationContext,
+    ):
+        """Test results come back in rule registration order."""
+        engine_config = PlanGuardrailEngineConfig(
+            parallel_execution=True, max_parallel_workers=3
+        )
+        engine = PlanGuardrailEngine(sample_config, engine_config)
+        # The first rule finishes last
+        engine.register(MockSlowRule(delay_ms=40.0, suffix="_1"))
+        engine.register(MockSlowRule(delay_ms=0.0, suffix="_2"))
+        engine.register(MockSlowRule(delay_ms=10.0, suffix="_3"))
+
+        result = engine.validate(sample_context)
+
+        assert [f.rule_id for f in result.findings] == [
+            "PLAN.MOCK_SLOW_1",
+            "PLAN.MOCK_SLOW_2",
+            "PLAN.MOCK_SLOW_3",
+        ]
+
+    def test_parallel_runs_unsafe_rules_on_calling_thread(
+        self,
+        sample_config: PlanGuardrailConfig,
+        sample_context: PlanValidationContext,
+    ):
+        """Test rules that opt out of threading run on the caller's thread."""
+        import threading
+
+        threads: dict[str, int] = {}
+
+        class ThreadRecordingRule(MockSlowRule):
+            def __init__(self, suffix: str, thread_safe: bool):
+                super().__init__(delay_ms=0.0, suffix=suffix)
+                self._thread_safe = thread_safe
+
+            @property
+            def is_thread_safe(self) -> bool:
+                return self._thread_safe
+
+            def validate(self, context):
+                threads[self.rule_id] = threading.get_ident()
+                return super().validate(context)
+
+        engine_config = PlanGuardrailEngineConfig(parallel_execution=True)
+        engine = PlanGuardrailEngine(sample_config, engine_config)
+        engine.register(ThreadRecordingRule("_SAFE", thread_safe=True))
+        engine.register(ThreadRecordingRule("_UNSAFE", thread_safe=False))
+
+        result = engine.validate(sample_context)
+
+        assert result.rules_executed == 2
+        assert threads["PLAN.MOCK_SLOW_UNSAFE"] == threading.get_ident()
+        assert threads["PLAN.MOCK_SLOW_SAFE"] != threading.get_ident()
+
+    def test_parallel_unsafe_rules_do_not_overlap_pooled_rules(
+        self,
+        sample_config: PlanGuardrailConfig,
+        sample_context: PlanValidationContext,
+    ):
+        """Test a thread-unsafe rule never runs while a pooled rule is running."""
+        import threading
+
+        lock = threading.Lock()
+        running = {"pooled": 0}
+        overlaps: list[int] = []
+
+        class PooledRule(MockSlowRule):
+            def validate(self, context):
+                with lock:
+                    running["pooled"] += 1
+                try:
+                    return super().validate(context)
+                finally:
+                    with lock:
+                        running["pooled"] -= 1
+
+        class UnsafeRule(MockSlowRule):
+            @property
+            def is_thread_safe(self) -> bool:
+                return False
+
+            def validate(self, context):
+                with lock:
+                    overlaps.append(running["pooled"])
+                findings = super().validate(context)
+                with lock:
+                    overlaps.append(running["pooled"])
+                return findings
+
+        engine_config = PlanGuardrailEngineConfig(
+            parallel_execution=True, max_parallel_workers=3
+        )
+        engine = PlanGuardrailEngine(sample_config, engine_config)
+        engine.register(PooledRule(delay_ms=20.0, suffix="_1"))
+        engine.register(UnsafeRule(delay_ms=20.0, suffix="_UNSAFE"))
+        engine.register(PooledRule(delay_ms=20.0, suffix="_2"))
+
+        result = engine.validate(sample_context)
+
+        assert result.rules_executed == 3
+        assert overlaps == [0, 0]
+        assert [f.rule_id for f in result.findings] == [
+            "PLAN.MOCK_SLOW_1",
+            "PLAN.MOCK_SLOW_UNSAFE",
+            "PLAN.MOCK_SLOW_2",
+        ]
+
     def test_parallel_max_workers_config(self):
         """Test max_parallel_workers configuration."""
         config = PlanGuardrailEngineConfig(
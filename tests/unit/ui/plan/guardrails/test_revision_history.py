@@ -689,3 +689,43 @@ class TestImplementationPlanRevisionHistory:
 
         assert data["revision_count"] == 1
         assert len(data["revision_history"]) == 1
+
+    def test_add_revisions_chains_hashes(
+        self,
+        sample_plan: ImplementationPlan,
+        sample_applied_revision: AppliedRevision,
+    ):
+        """Test each history entry links to the previous entry's hash."""
+        sample_plan.add_revisions([sample_applied_revision])
+        sample_plan.add_revisions([sample_applied_revision])
+
+        first, second = sample_plan.revision_history
+        assert first.previous_hash == ""
+        assert first.entry_hash != ""
+        assert second.previous_hash == first.entry_hash
+        assert second.entry_hash != first.entry_hash
+        assert sample_plan.verify_revision_history() is True
+
+    def test_verify_detects_tampering(
+        self,
+        sample_plan: ImplementationPlan,
+        sample_applied_revision: AppliedRevision,
+    ):
+        """Test editing a recorded entry breaks verification."""
+        sample_plan.add_revisions([sample_applied_revision, sample_applied_revision])
+
+        sample_plan.revision_history[0].revision.rationale = "Edited after the fact"
+
+        assert sample_plan.verify_revision_history() is False
+
+    def test_verify_survives_serialization(
+        self,
+        sample_plan: ImplementationPlan,
+        sample_applied_revision: AppliedRevision,
+    ):
+        """Test hash chain round-trips through to_dict/from_dict."""
+        sample_plan.add_revisions([sample_applied_revision, sample_applied_revision])
+
+        restored = ImplementationPlan.from_dict(sample_plan.to_dict())
+
+        assert restored.verify_revision_history() is True